@@ -12,6 +12,7 @@ from selenium.webdriver.support.ui import Select, WebDriverWait
 
 from utils.restmail import RestMail
 from utils.utility import Utilities
+from utils.workers import Worker
 
 Name = Tuple[str, str]
 Password = str
@@ -224,7 +225,10 @@ class Signup(Page):
         extra_length = randint(3, 8)
         extra_string = "".join(
             [string.hexdigits[randint(0, 0xF)] for _ in range(extra_length)])
-        email = RestMail(f"{name[0]}.{name[1]}.{extra_string}".lower())
+        # Include the pytest-xdist worker so parallel workers never share a
+        # mailbox
+        username = ".".join(filter(None, [*name, Worker.tag(), extra_string]))
+        email = RestMail(username.lower())
         email.empty()
         return (name, password, school, email)
 
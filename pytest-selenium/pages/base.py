@@ -3,8 +3,6 @@ from __future__ import annotations
 import re
 import pytest
 
-from time import sleep
-from math import ceil as round_up
 from typing import Tuple
 from datetime import datetime
 
@@ -22,8 +20,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as expected
 
 from tests.conftest import DESKTOP, MOBILE
+from utils.geometry import Geometry
+from utils.readiness import Readiness
 
-BOUNDING_RECTANGLE = "return arguments[0].getBoundingClientRect();"
 XPATH_SEARCH = "//span[contains(text(),'{term}') and contains(@class,'search-highlight first text last focus')]"
 # If search term is inside a block of search highlight use this XPATH
 XPATH_SEARCH_BLOCK = "//span[contains(@class,'search-highlight first text last focus')]//span[contains(text(),'{term}')]"
@@ -34,6 +33,7 @@ class Page(pypom.Page):
         super().__init__(driver, base_url, timeout, **url_kwargs)
 
     _math_equation_locator = (By.CSS_SELECTOR, "[id*=MathJax][id*=Frame] .math")
+    _search_focus_locator = (By.CSS_SELECTOR, ".search-highlight.focus")
     _title_locator = (By.TAG_NAME, "title")
 
     def open(self):
@@ -48,7 +48,7 @@ class Page(pypom.Page):
 
     @property
     def loaded(self) -> bool:
-        return super().loaded and (sleep(1.0) or True)
+        return super().loaded and Readiness.document_ready(self.driver)
 
     @property
     def page_title(self):
@@ -100,18 +100,12 @@ class Page(pypom.Page):
         return False
 
     def width(self, element):
-        return (
-            self.driver.execute_script(
-                "return window.getComputedStyle(arguments[0]).width;", element
-            )
-        ).strip("px")
+        geometry = Geometry.measure(self.driver, element, styles=["width"])
+        return geometry.styles["width"].strip("px")
 
     def height(self, element):
-        return (
-            self.driver.execute_script(
-                "return window.getComputedStyle(arguments[0]).height;", element
-            )
-        ).strip("px")
+        geometry = Geometry.measure(self.driver, element, styles=["height"])
+        return geometry.styles["height"].strip("px")
 
     @property
     def scroll_position(self):
@@ -171,7 +165,7 @@ class Page(pypom.Page):
                     wait.until(lambda _: self.find_elements(*self._math_equation_locator))
                 except TimeoutException:
                     pass
-                sleep(1.0)
+                Readiness.mathjax_idle(self.driver)
         return self
 
     def get_window_size(self) -> Tuple[int, int]:
@@ -205,15 +199,12 @@ class Page(pypom.Page):
         """
         WebDriverWait(self.driver, 5).until(expected.number_of_windows_to_be(2))
 
-        try:
-            self.driver.switch_to.window(self.driver.window_handles[n])
-
-            if self.driver.current_window_handle != n:
-                raise WebDriverException("Try again")
+        def switched(driver) -> bool:
+            handle = driver.window_handles[n]
+            driver.switch_to.window(handle)
+            return driver.current_window_handle == handle
 
-        except WebDriverException:
-            sleep(1.0)
-            self.driver.switch_to.window(self.driver.window_handles[n])
+        WebDriverWait(self.driver, 5, ignored_exceptions=(WebDriverException,)).until(switched)
 
     def open_new_tab(self):
         """"Open new browser tab."""
@@ -228,34 +219,12 @@ class Page(pypom.Page):
     def element_in_viewport(self, target: WebElement):
         """verifies if target element is within viewport."""
 
-        boundry = self.driver.execute_script(BOUNDING_RECTANGLE, target)
-
-        target_left_bound = round_up(boundry.get("left"))
-        target_right_bound = round_up(boundry.get("right"))
-        target_height = round_up(boundry.get("height"))
-        target_top_bound = target.location.get("y")
-        target_lower_bound = target_top_bound + target_height
-
-        win_upper_bound = self.driver.execute_script("return window.pageYOffset")
-        win_left_bound = self.driver.execute_script("return window.pageXOffset")
-        win_width = self.driver.execute_script("return document.documentElement.clientWidth")
-        win_height = self.driver.execute_script("return document.documentElement.clientHeight")
-        win_right_bound = win_left_bound + win_width
-        win_lower_bound = win_upper_bound + win_height
-
-        return all(
-            (
-                win_left_bound <= target_left_bound,
-                win_right_bound >= target_right_bound,
-                win_upper_bound <= target_top_bound,
-                win_lower_bound >= target_lower_bound,
-            )
-        )
+        return Geometry.measure(self.driver, target).in_viewport
 
     def wait_for_service_worker_to_install(self):
-        """Add a delay to give some time for the service workers installation."""
+        """Wait for the service worker to install and activate."""
 
-        sleep(3)
+        Readiness.service_worker_ready(self.driver)
         return None
 
     def assert_search_term_is_highlighted_in_content_page(self, search_term):
@@ -267,7 +236,13 @@ class Page(pypom.Page):
 
         """
         # Wait for search results to load especially on math books
-        sleep(2)
+        try:
+            WebDriverWait(self.driver, 5).until(
+                lambda _: self.content.find_elements(*self._search_focus_locator)
+            )
+        except TimeoutException:
+            pass
+        Readiness.mathjax_idle(self.driver)
 
         # Break the search phrase to a list of words
         split_search_term = re.findall(r"\w+", search_term)
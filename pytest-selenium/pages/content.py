@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from math import ceil as round_up
 from random import randint
-from time import sleep
 from typing import List, Tuple, Union
 
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
@@ -23,9 +22,10 @@ from regions.practice import Practice
 from regions.search_sidebar import SearchSidebar
 from regions.study_guides import StudyGuide
 from regions.toc import TableOfContents
-from utils.utility import Color, Highlight, Utilities
+from utils.geometry import Geometry
+from utils.readiness import Readiness
+from utils.utility import Color, DOMBridge, Highlight, Utilities
 
-BOUNDING_RECTANGLE = "return arguments[0].getBoundingClientRect();"
 COMPUTED_STYLES = "return window.getComputedStyle(arguments[0]){field};"
 ELEMENT_SELECT = "return document.querySelector('{selector}');"
 
@@ -67,17 +67,20 @@ class Content(Page):
     def loaded(self) -> bool:
         """Return True when the page is load or an error pane is found.
 
-        :return: ``True`` when the page is loaded, the page not found message
-            is displayed, or the 404 error page is displayed
+        .. note::
+           A single asynchronous script resolves on the first final state so
+           each check costs one WebDriver round trip and no fixed delay.
+
+        :return: ``True`` when the page is loaded and the math is typeset, the
+            page not found message is displayed, the 404 error page is
+            displayed, or an error modal is open
         :rtype: bool
 
         """
-        body = self.find_elements(*self._body_locator)
-        data_load = body[0].get_attribute("data-rex-loaded") if body else None
-        source = self.driver.page_source
-        page_missing = self.PAGE_MISSING in source
-        _404_error = self._404_ERROR in source
-        return data_load or page_missing or _404_error
+        state = Readiness.wait_for_rex(
+            self.driver, self.PAGE_MISSING, self._404_ERROR, timeout=min(self.timeout, 10)
+        )
+        return state in Readiness.READY_STATES
 
     @property
     def goto_accessibility_page(self) -> WebElement:
@@ -189,7 +192,7 @@ class Content(Page):
         :rtype: bool
 
         """
-        sleep(0.25)
+        Readiness.settled(self.driver)
         return bool(self.find_elements(*self._notification_pop_up_locator))
 
     @property
@@ -372,7 +375,8 @@ class Content(Page):
 
         :param int repeat: (optional) an internal recursive counter managing
             the number of error modal check retries
-            default: 1 - check for the modal twice over 0.25 seconds
+            default: 1 - check for the modal twice, letting the page settle
+            between checks
         :return: ``True`` when the error modal exists within the content page
         :rtype: bool
 
@@ -382,13 +386,13 @@ class Content(Page):
         except NoSuchElementException:
             if repeat <= 0:
                 return False
-            sleep(0.25)
+            Readiness.settled(self.driver)
             return self.error_shown(repeat - 1)
 
     @property
     def full_page_nudge_displayed(self) -> bool:
         """Return true if highlighting/study guide nudge is displayed"""
-        sleep(0.25)
+        Readiness.settled(self.driver)
         return bool(self.find_elements(*self._full_page_nudge_locator))
 
     def scroll_over_content_overlay(self):
@@ -697,8 +701,8 @@ class Content(Page):
 
             """
             for _ in range(2):
+                Readiness.settled(self.driver)
                 for box in self.highlight_boxes:
-                    sleep(0.1)
                     display = self.driver.execute_script(
                         COMPUTED_STYLES.format(field=".display"), box
                     )
@@ -739,9 +743,13 @@ class Content(Page):
             :rtype: list(str)
 
             """
-            return list(
-                set([highlight.get_attribute("data-highlight-id") for highlight in self.highlights])
+            highlights = DOMBridge.query(
+                self.driver,
+                self._highlighted_element_locator,
+                root=self.root,
+                attributes=["data-highlight-id"],
             )
+            return list(set([highlight["data-highlight-id"] for highlight in highlights]))
 
         @property
         def images(self) -> List[WebElement]:
@@ -943,9 +951,9 @@ class Content(Page):
                 if by_id
                 else (str(by_timestamp), "data-timestamp")
             )
-            return [
-                segment for segment in self.highlights if data == segment.get_attribute(attribute)
-            ]
+            return self.find_elements(
+                By.CSS_SELECTOR, f"{self._highlighted_element_locator[1]}[{attribute}='{data}']"
+            )
 
         def highlight(
             self,
@@ -1066,27 +1074,28 @@ class Content(Page):
                 registered value like Highlight.RANDOM or Highlight.ENTIRE
 
             """
-            # Retrieve the element area information
-            boundry = self.driver.execute_script(BOUNDING_RECTANGLE, target)
+            # Retrieve the element area information and tag name
+            geometry = Geometry.measure(self.driver, target)
+            tag_name = geometry.tag_name
 
             # And round up the computed height and width values
-            width = round_up(boundry.get("width"))
-            height = round_up(boundry.get("height"))
+            width = round_up(geometry.width)
+            height = round_up(geometry.height)
 
             # Determine where to start and stop the hightlight
             # Normally begin at the top left except for images, which should
             # begin to the left of the picture, or tables, which should begin
             # within the first cell to ignore the table/cell borders.
-            if target.tag_name == "img" or target.tag_name == "figure":
+            if tag_name == "img" or tag_name == "figure":
                 start = (-10, 0)
-            elif target.tag_name == "table":
+            elif tag_name == "table":
                 start = (3, 3)
-            elif target.tag_name == "a":
+            elif tag_name == "a":
                 start = (-1, 1)
             else:
                 start = (0, 0)
 
-            if target.tag_name == "img" or target.tag_name == "figure":
+            if tag_name == "img" or tag_name == "figure":
                 end = (width * 0.75, 3)
             elif offset == Highlight.ENTIRE:
                 end = (width - 1, height - 1 if height - 1 > start[1] else start[1] + 1)
@@ -1163,7 +1172,7 @@ class Content(Page):
             try:
                 self.highlight_box
             except NoSuchElementException:
-                sleep(0.1)
+                Readiness.settled(self.driver, target)
                 (actions.move_to_element_with_offset(target, *retag).click().perform())
 
         def _select_section(
@@ -1459,8 +1468,9 @@ class Content(Page):
 
             def confirm_deletion(self):
                 """Click the delete confirmation button."""
-                sleep(0.25)
-                Utilities.click_option(self.driver, element=self.confirm_delete_button)
+                button = self.confirm_delete_button
+                Readiness.settled(self.driver, button)
+                Utilities.click_option(self.driver, element=button)
 
             def delete(self) -> Content.Content:
                 """Delete the highlight and note.
@@ -1554,24 +1564,23 @@ class Content(Page):
 
                 """
                 # Find the initial heights and sizes
-                minimum_box_height = self.driver.execute_script(
-                    COMPUTED_STYLES.format(field=".minHeight"), self.note
-                )
-                box_boundries = self.driver.execute_script(BOUNDING_RECTANGLE, self.note)
-                current_box_height = box_boundries.get("height")
+                note_box = self.note_box
+                geometry = Geometry.measure(self.driver, note_box, styles=["minHeight"])
+                minimum_box_height = geometry.pixels("minHeight")
+                current_box_height = geometry.height
 
                 # Find the vertical adjustment (negative moves up and shrinks
                 # the box and positive moves down expanding the textarea)
                 change = height - current_box_height
                 if height < minimum_box_height or change == 0:
                     return -1
-                resize_location_arrow = (box_boundries.get("width") - 3, current_box_height - 3)
+                resize_location_arrow = (geometry.width - 3, current_box_height - 3)
 
                 # Adjust the textarea
                 ActionChains(self.driver).move_to_element_with_offset(
-                    self.note, *resize_location_arrow
+                    note_box, *resize_location_arrow
                 ).click_and_hold().move_by_offset(0, change).release().perform()
-                return self.driver.execute_script(BOUNDING_RECTANGLE, self.note).get("height")
+                return Geometry.measure(self.driver, note_box).height
 
             def save(self) -> Content.Content.HighlightBox:
                 """Click the save note button.
@@ -1581,7 +1590,7 @@ class Content(Page):
 
                 """
                 Utilities.click_option(self.driver, element=self.save_button)
-                sleep(0.1)
+                Readiness.settled(self.driver, self.root)
                 return self
 
             def toggle_color(self, color: Color) -> Content.Content.HighlightBox:
@@ -1751,8 +1760,7 @@ class Content(Page):
             self.page.topbar.click_search_icon()
             self.search_textbox.send_keys(search_term)
             self.offscreen_click(self.search_textbox)
-            self.page.search_sidebar.wait_for_region_to_display()
-            sleep(1.0)
+            self.page.search_sidebar.wait_for_results()
             return self.page.search_sidebar
 
     class NavBar(Region):
@@ -2024,8 +2032,7 @@ class Content(Page):
             """
             self.search_textbox.send_keys(search_term)
             self.offscreen_click(self.search_button)
-            self.page.search_sidebar.wait_for_region_to_display()
-            sleep(1.0)
+            self.page.search_sidebar.wait_for_results()
             return self.page.search_sidebar
 
         def click_mobile_menu_button(self) -> WebElement:
@@ -2164,8 +2171,10 @@ class Content(Page):
 
             """
             Utilities.click_option(self.driver, element=element)
-            modal_root = self.driver.execute_script(ELEMENT_SELECT.format(selector=root_selector))
-            sleep(0.1)
+            modal_root = self.wait.until(
+                lambda _: self.driver.execute_script(ELEMENT_SELECT.format(selector=root_selector))
+            )
+            Readiness.settled(self.driver, modal_root)
             pop_up = modal(self.page, modal_root)
             pop_up.wait_for_region_to_load()
             return pop_up
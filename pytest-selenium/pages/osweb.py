@@ -4,9 +4,9 @@ from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.support import expected_conditions as expected
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-from time import sleep
 
 from pages.base import Page
+from utils.readiness import Readiness
 from utils.utility import Utilities
 
 HAS_HEIGHT = "return window.getComputedStyle(arguments[0]).height != 'auto';"
@@ -58,18 +58,15 @@ class WebBase(Page):
 
     @property
     def loaded(self):
-        """Return when the page is loaded.
+        """Return True when the page is loaded.
 
-        Fires the 'load' event when the whole webpage (HTML) has loaded fully,
-        including all dependent resources such as CSS files, and images.
-        Or
-        Return when the async event is hidden.
+        The whole webpage (HTML) has loaded fully, including all dependent
+        resources such as CSS files and images, and the page has initialized.
 
         """
-        script = r'window.addEventListener("load", function(event) {});'
-        self.driver.execute_script(script)
-        sleep(1.0)
-        return bool(self.find_elements(*self._body_data_init_locator))
+        return Readiness.document_ready(self.driver) and bool(
+            self.find_elements(*self._body_data_init_locator)
+        )
 
     def wait_for_load(self):
         return self.wait.until(lambda _: self.loaded)
@@ -158,7 +155,7 @@ class WebBase(Page):
 
     def click_mobile_user_nav(self):
         self.offscreen_click(self.mobile_user_nav)
-        sleep(1.0)
+        Readiness.settled(self.driver)
 
     def osweb_username(self):
         """Get the username of the logged in user."""
@@ -215,7 +212,7 @@ class WebBase(Page):
             individual = self.find_elements(*individual_locator)
             if individual:
                 Utilities.switch_to(self.driver, element=individual[0])
-                sleep(1)
+                self.wait.until(lambda driver: driver.current_url != "about:blank")
                 amazon_link = self.current_url
                 self.driver.close()
                 self.driver.switch_to.window(self.driver.window_handles[0])
@@ -2,9 +2,7 @@
 # fmt: off
 from __future__ import annotations
 
-import re
-from time import sleep
-from typing import List
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 from pypom import Page
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
@@ -14,10 +12,51 @@ from selenium.webdriver.remote.webelement import WebElement
 
 from pages.accounts import Login
 from regions.base import Region
-from utils.utility import Color, Utilities
+from utils.readiness import Readiness
+from utils.utility import Color, DOMBridge, Utilities
 
 ELEMENT_SELECT = "return document.querySelector('{selector}');"
 COMPUTED_STYLES = "return window.getComputedStyle(arguments[0]){field};"
+# Read every listed highlight with its chapter and section headings
+HIGHLIGHT_RECORDS = r"""
+const [root, chapterSelector, sectionSelector, highlightSelector] = arguments;
+const selector = [chapterSelector, sectionSelector, highlightSelector].join(', ');
+const text = (element) => element ? element.textContent.trim() : '';
+let chapter = '';
+let section = '';
+const records = [];
+root.querySelectorAll(selector).forEach((element) => {
+  if (element.matches(chapterSelector)) { chapter = text(element); section = ''; return; }
+  if (element.matches(sectionSelector)) { section = text(element); return; }
+  const excerpt = element.querySelector('[data-highlight-id]');
+  if (!excerpt) { return; }
+  const color = excerpt.closest('[color]');
+  const label = element.querySelector('.highlight-note-text');
+  records.push([
+    excerpt.getAttribute('data-highlight-id'),
+    color ? color.getAttribute('color') : null,
+    chapter,
+    section,
+    Boolean(label),
+    label ? text(label.nextElementSibling) : '',
+  ]);
+});
+return records;"""  # NOQA
+
+
+class HighlightRecord(NamedTuple):
+    """The plain values of a My Highlights and Notes entry.
+
+    The color is ``None`` if the entry does not display one.
+
+    """
+
+    id: str
+    color: Optional[Color]
+    chapter: str
+    section: str
+    has_note: bool
+    note_text: str
 
 
 class ChapterData(Region):
@@ -233,10 +272,9 @@ class MyHighlights(Region):
         :rtype: list(:py:class:`~regions.my_highlights.Highlight`)
 
         """
-        highlights = []
-        for section in self.highlights.sections:
-            highlights = highlights + section.highlights
-        return highlights
+        return [highlight
+                for section in self.highlights.sections
+                for highlight in section.highlights]
 
     @property
     def back_to_top_available(self) -> bool:
@@ -323,13 +361,24 @@ class MyHighlights(Region):
         if self.back_to_top_available:
             button = self.find_element(*self._back_to_top_button_locator)
             Utilities.click_option(self.driver, element=button)
-            sleep(0.33)
+            Readiness.settled(self.driver, self.root)
             return self
 
     @property
     def close_icon(self):
         return self.find_element(*self._close_x_button_locator)
 
+    def iter_highlights(self, batch: int = 25) -> Iterator[Highlight]:
+        """Yield the highlights, loading more as the modal scrolls.
+
+        :param int batch: (optional) the number of entries to request at once
+            default: 25
+        :return: the highlights in display order
+        :rtype: iterator(:py:class:`~regions.my_highlights.Highlight`)
+
+        """
+        return self.highlights.iter_highlights(batch)
+
     def close(self) -> Page:
         """Click the close 'x' button.
 
@@ -589,6 +638,13 @@ class MyHighlights(Region):
         _empty_state_nudge_locator = (By.CSS_SELECTOR, "[class*=MyHighlightsWrapper]")
         _context_menu_locator = (By.XPATH, "//div[starts-with(@class, 'ContextMenu')]")
 
+        # The CSS selectors of the entries yielded by entries()
+        ENTRIES = {
+            "chapter": "[data-testid=chapter-title]",
+            "section": "[data-testid=section-title]",
+            "highlight": "div[data-highlight-id]",
+        }
+
         @property
         def chapters(self) -> List[MyHighlights.Highlights.Chapter]:
             """Access the list of chapters currently displayed.
@@ -644,15 +700,95 @@ class MyHighlights(Region):
             :rtype: list(str)
 
             """
-            return list(set(self._split_html(highlight) for highlight in self.highlights))
+            highlights = DOMBridge.query(
+                self.driver, self._highlight_locator, root=self.root,
+                fields={"id": ("[data-highlight-id]", "data-highlight-id")})
+            return list(set(highlight["id"] for highlight in highlights))
+
+        def entries(self, batch: int = 25) \
+                -> Iterator[Union[MyHighlights.Highlights.Chapter,
+                                  MyHighlights.Highlights.Section,
+                                  Highlight]]:
+            """Yield the chapters, sections and highlights in display order.
+
+            Entries are requested a batch at a time and the modal is scrolled
+            to load more only when the previous batch is used up.
+
+            :param int batch: (optional) the number of entries to request at
+                once
+                default: 25
+            :return: the chapter headings, section headings and highlights
+            :rtype: iterator(:py:class:`~MyHighlights.Highlights.Chapter`,
+                :py:class:`~MyHighlights.Highlights.Section` or
+                :py:class:`~regions.my_highlights.Highlight`)
+
+            """
+            section = self
+            for kind, element in DOMBridge.stream(
+                    self.driver, self.root, self.ENTRIES,
+                    loader=self.page._loading_animation_locator[1],
+                    batch=batch):
+                if kind == "chapter":
+                    yield self.Chapter(self, element)
+                elif kind == "section":
+                    section = self.Section(self, element)
+                    yield section
+                else:
+                    yield Highlight(section, element)
+
+        def iter_highlights(self, batch: int = 25) -> Iterator[Highlight]:
+            """Yield the highlights, loading more as the modal scrolls.
+
+            :param int batch: (optional) the number of entries to request at
+                once
+                default: 25
+            :return: the highlights in display order
+            :rtype: iterator(:py:class:`~regions.my_highlights.Highlight`)
 
-        def _split_html(self, locator):
-            """Break up the innerHTML string to retrieve highlight ID."""
-            html = locator.get_attribute("innerHTML")
-            split_html_highlight_id = re.findall(r"(.*? words|data-highlight-id.{38})", html)
-            unlist_highlight_id = ', '.join(split_html_highlight_id)
-            highlight_id = re.sub('data-highlight-id="', '', unlist_highlight_id)
-            return highlight_id
+            """
+            for entry in self.entries(batch):
+                if isinstance(entry, Highlight):
+                    yield entry
+
+        @property
+        def records(self) -> List[HighlightRecord]:
+            """Return the values of every listed highlight in one request.
+
+            :return: the ID, color, chapter title, section title, note flag
+                and note text of each highlight in display order
+            :rtype: list(:py:class:`~regions.my_highlights.HighlightRecord`)
+
+            """
+            records = self.driver.execute_script(
+                HIGHLIGHT_RECORDS, self.root,
+                self.ENTRIES["chapter"], self.ENTRIES["section"],
+                self._highlight_locator[1])
+            return [
+                HighlightRecord(
+                    highlight_id,
+                    Color.from_color_string(color) if color else None,
+                    chapter, section, has_note, note_text)
+                for highlight_id, color, chapter, section, has_note, note_text
+                in records]
+
+        def compare_ids(self, highlight_ids: Iterable[str]) \
+                -> Tuple[List[str], List[str]]:
+            """Compare the listed highlights with a set of highlight IDs.
+
+            Use with :py:attr:`~pages.content.Content.Content.highlight_ids`
+            to check that My Highlights lists the highlights made on one or
+            more content pages.
+
+            :param highlight_ids: the expected highlight IDs
+            :type highlight_ids: iterable(str)
+            :return: the expected IDs missing from My Highlights and the
+                listed IDs that were not expected, both sorted
+            :rtype: tuple(list(str), list(str))
+
+            """
+            expected = set(highlight_ids)
+            listed = set(record.id for record in self.records)
+            return sorted(expected - listed), sorted(listed - expected)
 
         @property
         def edit_highlight(self) -> List[MyHighlights.Highlights.EditHighlight]:
@@ -898,8 +1034,8 @@ class MyHighlights(Region):
             def highlight_edit_box_open(self):
                 """Search for the open (displayed) highlight edit box."""
                 for _ in range(2):
+                    Readiness.settled(self.driver)
                     for box in self.highlight_edit_boxes:
-                        sleep(0.1)
                         display = self.driver.execute_script(
                             COMPUTED_STYLES.format(field=".display"), box
                         )
@@ -955,8 +1091,9 @@ class MyHighlights(Region):
 
             def confirm_deletion(self):
                 """Click the delete confirmation button."""
-                sleep(0.25)
-                Utilities.click_option(self.driver, element=self.confirm_delete_button)
+                button = self.confirm_delete_button
+                Readiness.settled(self.driver, button)
+                Utilities.click_option(self.driver, element=button)
 
             def delete(self) -> MyHighlights:
                 """Delete the highlight and note.
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from enum import Enum
-from time import sleep
 from typing import List, Tuple
 
 from selenium.common.exceptions import NoSuchElementException
@@ -12,6 +11,7 @@ from selenium.webdriver.remote.webelement import WebElement
 
 from pages.base import Page
 from regions.base import Region
+from utils.readiness import Readiness
 from utils.utility import Utilities
 
 BACKGROUND_COLOR = (
@@ -513,7 +513,7 @@ class Practice(Region):
                 """
                 radio_button = self.find_element(*self._radio_button_locator)
                 Utilities.click_option(self.driver, element=radio_button)
-                sleep(0.2)
+                Readiness.settled(self.driver, self.root)
 
             def _get_color(self, answer: WebElement) -> str:
                 r"""Return the background color for the selected element.
@@ -651,7 +651,7 @@ class Practice(Region):
             """
             button = self.find_element(*self._toggle_button_locator)
             Utilities.click_option(self.driver, element=button)
-            sleep(0.1)
+            Readiness.settled(self.driver, self.root)
             return self
 
         class Chapter(TitleSection):
@@ -701,7 +701,7 @@ class Practice(Region):
 
                 """
                 Utilities.click_option(self.driver, element=self.root)
-                sleep(0.1)
+                Readiness.settled(self.driver, self.root)
                 return self.page
 
             class Section(TitleSection):
@@ -715,7 +715,7 @@ class Practice(Region):
 
                     """
                     Utilities.click_option(self.driver, element=self.root)
-                    sleep(0.25)
+                    Readiness.settled(self.driver)
                     return self.page.page.page
 
 
@@ -7,7 +7,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as expected
 
 from regions.base import Region
-from utils.utility import Utilities
+from utils.readiness import Readiness
+from utils.utility import DOMBridge, Utilities
 
 VISIBILITY = "window.getComputedStyle(arguments[0]).visibility == 'visible';"
 
@@ -65,6 +66,21 @@ class SearchSidebar(Region):
 
     # fmt: on
 
+    def wait_for_results(self):
+        """Wait for the search results, or the no results message, to render.
+
+        :return: the search sidebar once it has stopped changing
+        :rtype: :py:class:`~regions.search_sidebar.SearchSidebar`
+
+        """
+        self.wait_for_region_to_display()
+        self.wait.until(
+            lambda _: self.find_elements(*self._search_result_locator)
+            or self.find_elements(*self._no_results_locator)
+        )
+        Readiness.settled(self.driver, self.root)
+        return self
+
     @property
     def is_displayed(self):
         try:
@@ -120,9 +136,14 @@ class SearchSidebar(Region):
         for x in split_search_term:
             try:
                 return [
-                    result
-                    for result in self.find_elements(*self._search_result_locator)
-                    if x in result.get_attribute("textContent")
+                    result["element"]
+                    for result in DOMBridge.query(
+                        self.driver,
+                        self._search_result_locator,
+                        root=self.root,
+                        attributes=["textContent"],
+                    )
+                    if x in result["textContent"]
                 ]
             except IndexError:
                 continue
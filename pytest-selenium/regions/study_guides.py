@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from time import sleep
-from typing import List, Union
+from typing import List, Tuple, Union
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
@@ -12,8 +11,60 @@ from selenium.webdriver.support import expected_conditions as expect
 from pages.accounts import Login, Signup
 from pages.base import Page
 from regions.base import Region
+from utils.readiness import Readiness
 from utils.utility import Color, Utilities
 
+# Scroll the last loaded section into view until the app stops appending
+# sections. A MutationObserver follows the list: each batch of sections is
+# scrolled to as soon as the loading indicator clears and the list is complete
+# once nothing changes for a quiet period. Only the sections after the number
+# already known for the same active filters are returned and nothing is
+# scrolled once those sections are complete. The returned sections are kept on
+# the list element; if the list re-rendered since, like after a highlight is
+# added or removed or a filter is reapplied, every section is returned again.
+LOAD_SECTIONS = r"""
+const [root, sectionSelector, loaderSelector, filterSelector, knownFilters, known,
+       complete, quietTime, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const filters = Array.from(document.querySelectorAll(filterSelector))
+  .map((filter) => filter.textContent).join('|');
+const displayed = Array.from(root.querySelectorAll(sectionSelector));
+const memo = root.loadedSections || [];
+const current = filters === knownFilters && known === memo.length
+  && (!complete || displayed.length === memo.length)
+  && memo.every((section, index) => section.isConnected && displayed[index] === section);
+const start = current ? known : 0;
+if (start && complete) {
+  return done({filters, complete, scrolled: false, start, sections: []});
+}
+const container = root.parentElement || root;
+let count = start;
+let scrolled = false;
+let quiet = null;
+const finish = (complete) => {
+  observer.disconnect();
+  clearTimeout(quiet);
+  clearTimeout(timer);
+  const sections = Array.from(root.querySelectorAll(sectionSelector));
+  root.loadedSections = sections;
+  done({filters, complete, scrolled, start, sections: sections.slice(start)});
+};
+const step = () => {
+  clearTimeout(quiet);
+  if (container.querySelector(loaderSelector)) { return; }
+  const sections = root.querySelectorAll(sectionSelector);
+  if (sections.length && (sections.length !== count || !scrolled)) {
+    count = sections.length;
+    scrolled = true;
+    sections[count - 1].scrollIntoView({block: 'end'});
+  }
+  quiet = setTimeout(() => finish(true), quietTime);
+};
+const observer = new MutationObserver(step);
+observer.observe(container, {childList: true, subtree: true});
+const timer = setTimeout(() => finish(false), timeout);
+step();"""  # NOQA
+
 
 class StudyGuide(Region):
     """The Study Guides pop up modal region."""
@@ -31,6 +82,19 @@ class StudyGuide(Region):
     _toolbar_locator = (
         By.CSS_SELECTOR, "[data-testid*=guides-body] > [class*=Filters]")
 
+    def __init__(self, page, root=None):
+        """Initialize the study guide with no sections loaded.
+
+        :param page: the parent page object
+        :param root: (optional) the study guide modal element
+        :type root: WebElement
+
+        """
+        super().__init__(page, root)
+        # The active filters, the section elements loaded for them and
+        # whether every section has loaded
+        self._sections: Tuple[str, List[WebElement], bool] = ("", [], False)
+
     @property
     def loaded(self) -> bool:
         """Return True when the pop up header is displayed.
@@ -124,7 +188,7 @@ class StudyGuide(Region):
         """
         if self.go_to_top_available:
             Utilities.click_option(self.driver, element=self.go_to_top_button)
-            sleep(1.0)
+            Readiness.settled(self.driver, self.root)
         return self
 
     class Account(Region):
@@ -209,19 +273,17 @@ class StudyGuide(Region):
 
         _chapter_locator = (
             By.CSS_SELECTOR, "[class*=ChapterWrapper]")
+        _loader_locator = (
+            By.CSS_SELECTOR, "[class*=LoaderWrapper]")
         _no_results_text_locator = (
             By.CSS_SELECTOR, "[class*=GeneralText]")
         _section_locator = (
             By.CSS_SELECTOR, "[class*=HighlightWrapper]")
 
-        _parent_div_selector = (
-            "[class*=StudyGuides] > [class*=HighlightsWrapper]"
-        )
-
-        HEIGHT = (
-            f'return document.querySelectorAll("{_parent_div_selector}")'
-            ".getBoundingClientRect().height;"
-        )
+        # Seconds without new sections before the list is complete
+        LOAD_WAIT = 0.5
+        # Seconds to wait for every section to load
+        LOAD_TIMEOUT = 30
 
         @property
         def chapters(self) -> List[StudyGuide.Content.Chapter]:
@@ -244,9 +306,11 @@ class StudyGuide(Region):
         def sections(self) -> List[StudyGuide.Content.Section]:
             r"""Access the sections available due to current filters.
 
-            .. note:: Sections load dynamically so we scroll to the last
-                      currently loaded one, wait a bit, then check for more. We
-                      repeat this until the parent DIV stops growing.
+            .. note:: Sections load dynamically so the sections loaded by an
+                      earlier call are kept by the study guide and only the
+                      sections appended since then are requested. The list is
+                      loaded again when the active filters change or the
+                      list is rendered again.
 
             :return: the sections currently displayed
             :rtype: list(:py:class:`~regions.study_guides. \
@@ -255,18 +319,24 @@ class StudyGuide(Region):
             """
             if self.no_results:
                 return []
-            while True:
-                start_height = self.driver.execute_script(self.HEIGHT)
-                sections = [self.Section(self, section)
-                            for section
-                            in self.find_elements(*self._section_locator)]
-                Utilities.scroll_to(self.driver, element=sections[-1])
-                sleep(0.5)
-                new_height = self.driver.execute_script(self.HEIGHT)
-                if new_height <= start_height:
-                    self.page.go_back_to_top()
-                    break
-            return sections
+            filters, loaded, complete = self.page._sections
+            active_filters = " ".join([
+                self.page._toolbar_locator[1],
+                self.page.Toolbar._active_filters_locator[1]])
+            with Readiness.script_timeout(self.driver, self.LOAD_TIMEOUT + 1):
+                result = self.driver.execute_async_script(
+                    LOAD_SECTIONS, self.root, self._section_locator[1],
+                    self._loader_locator[1], active_filters, filters,
+                    len(loaded), complete, int(self.LOAD_WAIT * 1000),
+                    int(self.LOAD_TIMEOUT * 1000))
+            if not result["start"]:
+                loaded = []
+            if result["scrolled"]:
+                self.page.go_back_to_top()
+            loaded = loaded + result["sections"]
+            self.page._sections = (
+                result["filters"], loaded, result["complete"])
+            return [self.Section(self, section) for section in loaded]
 
         @property
         def no_results(self) -> str:
@@ -602,7 +672,7 @@ class StudyGuide(Region):
                 self.driver,
                 element=self.using_this_guide_button
             )
-            sleep(0.33)
+            Readiness.settled(self.driver, self.root)
             if self.guide_is_open:
                 return self.help_guide
 
@@ -1,10 +1,34 @@
+import importlib
 import os
 import random
+import shutil
 import sys
+import tempfile
+from uuid import uuid4
 
 import pytest
+from selenium.webdriver.support.event_firing_webdriver import EventFiringWebDriver
+from tenacity import Retrying, stop_after_attempt, wait_exponential
 
+from pages.accounts import Login, Signup
 from utils import utility
+from utils.account_pool import Account, AccountPool
+from utils.book_selection import BookSelection, PageWeights
+from utils.browser_pool import CLOUD_DRIVERS, BrowserPool
+from utils.fixture_server import FixtureServer
+from utils.instrumentation import CommandRecorder
+from utils.mailserver import LocalMailServer
+from utils.network_policy import NetworkPolicy
+from utils.profiler import ProfilePlugin
+from utils.replay_proxy import ReplayProxy
+from utils.restmail import RestMail
+from utils.scheduler import DurationScheduler
+from utils.sleep_audit import SleepAuditPlugin
+from utils.sessions import LoginCache, Session
+from utils.workers import Worker
+
+# The rex-web repository root
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Window resolutions. Pytest takes these inputs backwards.
 DESKTOP = (1500, 1080)
@@ -12,44 +36,277 @@ DESKTOP = (1500, 1080)
 MOBILE = (500, 738)
 
 
-@pytest.fixture(
-    scope="function",
-    params=[DESKTOP, MOBILE],
-    ids=[f"{DESKTOP[1]}x{DESKTOP[0]}", f"{MOBILE[1]}x{MOBILE[0]}"],
-)
-def selenium(selenium, request):
+# Run both resolutions of a test, one after the other, in one browser session
+PAIRED = (DESKTOP, MOBILE)
+
+
+def resolution_id(size) -> str:
+    """Return the test ID for a window resolution."""
+    if size == PAIRED:
+        return "paired"
+    return f"{size[1]}x{size[0]}"
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize the browser tests by window resolution.
+
+    Every test receives a desktop and a mobile variant except those marked
+    ``desktop_only`` or ``mobile_only``, so no browser is started for a
+    variant that would be skipped. With ``--paired-resolutions``,
+    nondestructive tests receive a single variant that runs the test at both
+    resolutions in the same browser.
+
+    """
+    if "resolution" not in metafunc.fixturenames:
+        return
+    definition = metafunc.definition
+    if definition.get_closest_marker("desktop_only"):
+        sizes = [DESKTOP]
+    elif definition.get_closest_marker("mobile_only"):
+        sizes = [MOBILE]
+    elif metafunc.config.getoption("--paired-resolutions") and definition.get_closest_marker(
+        "nondestructive"
+    ):
+        sizes = [PAIRED]
+    else:
+        sizes = [DESKTOP, MOBILE]
+    metafunc.parametrize("resolution", sizes, ids=resolution_id, indirect=True)
+
+
+@pytest.fixture
+def resolution(request):
+    """The window resolution, or the paired resolutions, for a test."""
+    return request.param
+
+
+@pytest.fixture(scope="function")
+def selenium(selenium, request, resolution, base_url):
     """Fixture to set custom selenium parameters.
 
-    This fixture will also parametrize all of the tests to run them on both a
-    Desktop resolution and a mobile resolution.
+    The window is sized to the test's resolution parameter, see
+    :py:func:`pytest_generate_tests`; paired tests start at the desktop size.
 
-    This fixture also helps skip desktop for tests focussing only on mobile.
+    Chrome blocks the third-party analytics, survey and font requests given
+    by ``--block-urls`` and opts out of analytics before the first page loads.
 
     Desktop size: 1920x1080
     Mobile size: 738x414 (iPhone 7+)
     """
-    desktop_only = request.node.get_closest_marker("desktop_only")
-    mobile_only = request.node.get_closest_marker("mobile_only")
-    if mobile_only and request.param == DESKTOP:
-        pytest.skip("Skipping desktop test")
-    elif desktop_only and request.param == MOBILE:
-        pytest.skip("Skipping mobile test")
-    selenium.set_window_size(*request.param)
+    selenium.set_window_size(*(resolution[0] if resolution == PAIRED else resolution))
+    NetworkPolicy.from_option(request.config.getoption("--block-urls"), base_url).apply(selenium)
     return selenium
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Run a paired test at the desktop and then the mobile resolution."""
+    if pyfuncitem.funcargs.get("resolution") != PAIRED:
+        return None
+    driver = pyfuncitem.funcargs["selenium"]
+    arguments = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    for index, size in enumerate(PAIRED):
+        if index:
+            driver.set_window_size(*size)
+            driver.refresh()
+        pyfuncitem.obj(**arguments)
+    return True
+
+
+@pytest.fixture(scope="session")
+def browser_pool(pytestconfig):
+    """Warm browser sessions reused by the tests run on this worker."""
+    pool = BrowserPool(max_uses=int(pytestconfig.getoption("--browser-reuse-limit")))
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def driver(request, driver_class, driver_kwargs, browser_pool, base_url):
+    """Return a WebDriver from the browser pool.
+
+    Fresh browsers are started for each test when ``--fresh-browser`` is set
+    or when running on a cloud provider, which records a job per session.
+    With ``--prewarm-service-worker``, a pooled browser loads a book page
+    before its first test and keeps the installed service worker. Like the
+    pytest-selenium fixture it replaces, new browsers are started with up to
+    ``max_driver_init_attempts`` attempts and wrapped by ``--event-listener``.
+
+    """
+    config = request.config
+    pooled = not config.getoption("--fresh-browser") and config.getoption("driver") not in (
+        CLOUD_DRIVERS
+    )
+
+    def start():
+        retries = int(config.getini("max_driver_init_attempts"))
+        for retry in Retrying(
+            stop=stop_after_attempt(retries), wait=wait_exponential(), reraise=True
+        ):
+            with retry:
+                return driver_class(**driver_kwargs)
+
+    driver = browser_pool.acquire(driver_class, driver_kwargs, start) if pooled else start()
+    if pooled and base_url and config.getoption("--prewarm-service-worker"):
+        book = utility.Library.slugs()[0]
+        browser_pool.prewarm(
+            driver, f"{base_url}/books/{book}/pages/{utility.get_default_page(book)}"
+        )
+    session = driver
+    event_listener = config.getoption("event_listener")
+    if event_listener is not None:
+        module, name = event_listener.rsplit(".", 1)
+        listener = getattr(importlib.import_module(module), name)
+        driver = EventFiringWebDriver(session, listener())
+    request.node._driver = driver
+    request.node._commands = CommandRecorder.install(session)
+    request.node._commands.reset()
+    yield driver
+    if pooled:
+        browser_pool.release(session)
+    else:
+        session.quit()
+
+
+@pytest.fixture(scope="session")
+def account_pool(pytestconfig, base_url):
+    """Registered student accounts shared by every test run on this site."""
+    return AccountPool(pytestconfig.getoption("--account-pool"), base_url)
+
+
+@pytest.fixture
+def student_account(selenium, pytestconfig, account_pool):
+    """Log in a student with a clean set of highlights.
+
+    Return a function that takes the currently displayed book page and logs
+    in a student, returning to the same page. An idle pooled account is
+    leased and its saved session cookies are restored; the Accounts log in
+    form is only used if the session has expired. A new student is
+    registered when every pooled account is in use or ``--fresh-accounts``
+    is set; with ``--local-server`` a new student logs in to the Accounts
+    stub, which has no sign up, and accounts are not pooled. Any highlights
+    left in the book by earlier tests are deleted.
+
+        name, email = student_account(book)
+        name, email, password = student_account(book, return_password=True)
+
+    """
+    offline = pytestconfig.getoption("--local-server")
+    fresh = pytestconfig.getoption("--fresh-accounts") or offline
+    leased = []
+
+    def sign_in(book, return_password=False):
+        account = None if fresh else account_pool.lease()
+        if account:
+            leased.append(account)
+            Session.restore(selenium, account.cookies)
+            if Session.is_logged_in(selenium):
+                book.reload()
+            else:
+                book.navbar.click_login()
+                Login(selenium).login(account.email.address, account.password)
+                book.wait_for_page_to_load()
+            if utility.Highlight.delete_highlights(selenium, book_wide=True, reload=False):
+                book.reload()
+        else:
+            book.navbar.click_login()
+            if offline:
+                name, username, password = utility.Utilities.random_name(), uuid4().hex, uuid4().hex
+                Login(selenium).login(RestMail(username).address, password)
+            else:
+                name, email, password = Signup(selenium).register(True)
+                username = email.address.split("@")[0]
+            book.wait_for_page_to_load()
+            account = Account(name, username, password)
+            if not fresh:
+                leased.append(account)
+                account_pool.add(account)
+        if not fresh:
+            account.cookies = Session.capture(selenium)
+            account_pool.update(account)
+        if return_password:
+            return (account.name, account.email, account.password)
+        return (account.name, account.email)
+
+    yield sign_in
+    for account in leased:
+        account_pool.release(account)
+
+
 def pytest_addoption(parser):
     """Adds additional options to the pytest command line
 
     """
     group = parser.getgroup("selenium", "selenium")
 
+    group.addoption(
+        "--account-pool",
+        action="store",
+        default=os.getenv("ACCOUNT_POOL", None),
+        help="file storing the registered student accounts reused between tests; "
+        "default: ~/.rex-web/accounts.json.",
+    )
+    group.addoption(
+        "--audit-sleeps",
+        action="store_true",
+        default=os.getenv("AUDIT_SLEEPS", False),
+        help="log every fixed sleep with its call site and report the total time slept.",
+    )
+    group.addoption(
+        "--block-urls",
+        action="store",
+        default=os.getenv("BLOCK_URLS", None),
+        help="comma separated URL patterns chrome blocks; defaults to analytics, surveys and "
+        "web fonts and an empty value blocks nothing.",
+    )
+    group.addoption(
+        "--book-seed",
+        action="store",
+        default=os.getenv("BOOK_SEED", None),
+        help="seed used to choose each test's book; the seed of a run is printed in the "
+        "report header.",
+    )
+    group.addoption(
+        "--book-weights",
+        action="store",
+        default=os.getenv("BOOK_WEIGHTS", None),
+        help="file storing the measured book page weights used to choose books.",
+    )
+    group.addoption(
+        "--browser-reuse-limit",
+        action="store",
+        default=os.getenv("BROWSER_REUSE_LIMIT", 25),
+        help="number of tests a pooled browser runs before it is replaced.",
+    )
     group.addoption(
         "--disable-dev-shm-usage",
         action="store_true",
         default=os.getenv("DISABLE_DEV_SHM_USAGE", False),
         help="disable chrome's usage of /dev/shm.",
     )
+    group.addoption(
+        "--duration-history",
+        action="store",
+        default=os.getenv("DURATION_HISTORY", None),
+        help="file storing the test durations used by --duration-schedule.",
+    )
+    group.addoption(
+        "--duration-schedule",
+        action="store_true",
+        default=os.getenv("DURATION_SCHEDULE", False),
+        help="run and distribute the longest tests first using the recorded durations.",
+    )
+    group.addoption(
+        "--fresh-accounts",
+        action="store_true",
+        default=os.getenv("FRESH_ACCOUNTS", False),
+        help="register a new student for every test instead of leasing pooled accounts.",
+    )
+    group.addoption(
+        "--fresh-browser",
+        action="store_true",
+        default=os.getenv("FRESH_BROWSER", False),
+        help="start a new browser for every test instead of reusing pooled browsers.",
+    )
     group.addoption(
         "--headless",
         action="store_true",
@@ -62,19 +319,205 @@ def pytest_addoption(parser):
         default=os.getenv("HIGHLIGHTING", False),
         help="enable highlighting tests",
     )
+    group.addoption(
+        "--local-mail",
+        action="store_true",
+        default=os.getenv("LOCAL_MAIL", False),
+        help="receive registration e-mail with the bundled local RestMail server.",
+    )
+    group.addoption(
+        "--local-mail-port",
+        action="store",
+        default=os.getenv("LOCAL_MAIL_PORT", 2525),
+        help="SMTP port for the local RestMail server.",
+    )
+    group.addoption(
+        "--local-server",
+        action="store_true",
+        default=os.getenv("LOCAL_SERVER", False),
+        help="run against a local rex-web build and recorded responses instead of --base-url.",
+    )
+    group.addoption(
+        "--local-server-build",
+        action="store",
+        default=os.getenv("LOCAL_SERVER_BUILD", os.path.join(REPOSITORY, "build")),
+        help="rex-web build directory served by --local-server.",
+    )
+    group.addoption(
+        "--local-server-fixtures",
+        action="store",
+        default=os.getenv(
+            "LOCAL_SERVER_FIXTURES", os.path.join(REPOSITORY, "src", "test", "fixtures")
+        ),
+        help="recorded API response directory served by --local-server.",
+    )
     group.addoption(
         "--no-sandbox",
         action="store_true",
         default=os.getenv("NO_SANDBOX", False),
         help="disable chrome's sandbox.",
     )
+    group.addoption(
+        "--paired-resolutions",
+        action="store_true",
+        default=os.getenv("PAIRED_RESOLUTIONS", False),
+        help="run nondestructive tests at both resolutions in one browser session.",
+    )
+    group.addoption(
+        "--prewarm-service-worker",
+        action="store_true",
+        default=os.getenv("PREWARM_SERVICE_WORKER", False),
+        help="install the service worker and its precache once per pooled browser.",
+    )
+    group.addoption(
+        "--profile-pages",
+        action="store_true",
+        default=os.getenv("PROFILE_PAGES", False),
+        help="time the page object members and report where the test time is spent.",
+    )
+    group.addoption(
+        "--profile-pages-file",
+        action="store",
+        default=os.getenv("PROFILE_PAGES_FILE", "page-profile.folded"),
+        help="collapsed stack (flame graph) output file for --profile-pages.",
+    )
+    group.addoption(
+        "--profile-pages-top",
+        action="store",
+        default=os.getenv("PROFILE_PAGES_TOP", 25),
+        help="number of page object members listed by --profile-pages.",
+    )
+    group.addoption(
+        "--proxy-cache",
+        action="store",
+        default=os.getenv("PROXY_CACHE", None),
+        help="directory storing the responses recorded by --proxy-mode.",
+    )
+    group.addoption(
+        "--proxy-latency",
+        action="store",
+        default=os.getenv("PROXY_LATENCY", 0),
+        help="milliseconds to delay each response replayed by --proxy-mode replay.",
+    )
+    group.addoption(
+        "--proxy-mode",
+        action="store",
+        choices=ReplayProxy.MODES,
+        default=os.getenv("PROXY_MODE", None),
+        help="send chrome traffic through a caching proxy that records or replays responses.",
+    )
+    group.addoption(
+        "--restmail-url",
+        action="store",
+        default=os.getenv("RESTMAIL_URL", None),
+        help="RestMail compatible mailbox URL containing a {username} placeholder.",
+    )
+
+
+def cache_directory(config, name: str) -> str:
+    """Return a directory in the pytest cache.
+
+    Without the cacheprovider plugin (``-p no:cacheprovider``) a temporary
+    directory, removed when pytest exits, is used instead so nothing is kept
+    between runs.
+
+    """
+    if hasattr(config, "cache"):
+        return str(config.cache.mkdir(name))
+    directory = tempfile.mkdtemp(prefix=f"pytest-{name}-")
+    config.add_cleanup(lambda: shutil.rmtree(directory, ignore_errors=True))
+    return directory
+
+
+def pytest_configure(config):
+    """Start the local services, load the test durations and select the mail service.
+
+    ``--local-mail`` starts the bundled SMTP and HTTP mail server once, in the
+    pytest-xdist controller, and every worker reads the same mailboxes;
+    otherwise ``--restmail-url`` may select another service.
+
+    """
+    mail_url = config.getoption("--restmail-url")
+    if config.getoption("--local-mail"):
+        mail_url = Worker.input(config).get("mail_url")
+        if not mail_url:
+            port = int(config.getoption("--local-mail-port"))
+            config._local_mail = LocalMailServer(smtp_port=port).start()
+            mail_url = config._local_mail.mail_url
+    RestMail.configure(mail_url=mail_url)
+    history = config.getoption("--duration-history") or os.path.join(
+        cache_directory(config, "durations"), "history.json"
+    )
+    config.pluginmanager.register(
+        DurationScheduler(history, reorder=config.getoption("--duration-schedule")),
+        "duration_scheduler",
+    )
+    seed = (
+        Worker.input(config).get("book_seed") or config.getoption("--book-seed") or uuid4().hex[:8]
+    )
+    weights = config.getoption("--book-weights") or os.path.join(
+        cache_directory(config, "books"), "weights.json"
+    )
+    config.pluginmanager.register(BookSelection(weights, seed), "book_selection")
+    if hasattr(config, "_metadata"):
+        config._metadata["Book selection seed"] = seed
+    if config.getoption("--profile-pages"):
+        config.pluginmanager.register(
+            ProfilePlugin(
+                config.getoption("--profile-pages-file"),
+                int(config.getoption("--profile-pages-top")),
+            ),
+            "page_profiler",
+        )
+    if config.getoption("--audit-sleeps"):
+        config.pluginmanager.register(SleepAuditPlugin(), "sleep_audit")
+    if config.getoption("--local-server"):
+        build = config.getoption("--local-server-build")
+        if not os.path.isfile(os.path.join(build, "index.html")):
+            raise pytest.UsageError(
+                f"--local-server needs a rex-web build in {build}; run yarn build"
+            )
+        server = FixtureServer(build, config.getoption("--local-server-fixtures")).start()
+        config._local_server = server
+        config.option.base_url = server.url
+    mode = config.getoption("--proxy-mode")
+    if mode:
+        # Each xdist worker runs its own proxy; recorded files are written
+        # atomically so the workers may share the cache directory
+        cache = config.getoption("--proxy-cache")
+        if not cache:
+            if not hasattr(config, "cache"):
+                raise pytest.UsageError(
+                    "--proxy-mode needs --proxy-cache without the cacheprovider plugin"
+                )
+            cache = str(config.cache.mkdir("replay"))
+        latency = max(float(config.getoption("--proxy-latency")), 0.0) / 1000
+        config._replay_proxy = ReplayProxy(cache, mode=mode, latency=latency).start()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Share the local mail server and book seed with a pytest-xdist worker."""
+    server = getattr(node.config, "_local_mail", None)
+    if server:
+        node.workerinput["mail_url"] = server.mail_url
+    node.workerinput["book_seed"] = node.config.pluginmanager.getplugin("book_selection").seed
+
+
+def pytest_unconfigure(config):
+    """Stop the local services."""
+    for name in ("_local_mail", "_local_server", "_replay_proxy"):
+        server = getattr(config, name, None)
+        if server:
+            server.stop()
 
 
 def pytest_collection_modifyitems(config, items):
     """Runtime test options."""
     server = config.getoption("--base-url") or config.getini("base_url")
     dev_system = "//staging.openstax." not in server and "//openstax." not in server
-    heroku_app = "herokuapp" in server
+    # Like review apps, the local server does not include OSWeb
+    heroku_app = "herokuapp" in server or config.getoption("--local-server")
     highlighting = config.getoption("--highlighting")
     if dev_system and not heroku_app and highlighting:
         return
@@ -121,6 +564,12 @@ def chrome_options(chrome_options, pytestconfig, language):
 
     chrome_options.add_experimental_option("w3c", False)
 
+    # Send the browser traffic through the record and replay proxy
+    proxy = getattr(pytestconfig, "_replay_proxy", None)
+    if proxy:
+        chrome_options.add_argument(f"--proxy-server=http://{proxy.address}")
+        chrome_options.add_argument("--ignore-certificate-errors")
+
     # Set the browser language
     chrome_options.add_argument("--lang={lang}".format(lang=language))
     chrome_options.add_experimental_option("prefs", {"intl.accept_languages": language})
@@ -128,6 +577,32 @@ def chrome_options(chrome_options, pytestconfig, language):
     return chrome_options
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Report the WebDriver commands a test sent and enforce its budget.
+
+    The commands sent by the test's fixtures and the test itself are counted;
+    a passing test marked ``webdriver_budget(n)`` fails if more than ``n``
+    commands were sent.
+
+    """
+    outcome = yield
+    report = outcome.get_result()
+    recorder = getattr(item, "_commands", None)
+    if report.when != "call" or recorder is None:
+        return
+    marker = item.get_closest_marker("webdriver_budget")
+    budget = marker.args[0] if marker else None
+    pytest_html = item.config.pluginmanager.getplugin("html")
+    if pytest_html:
+        extra = getattr(report, "extra", [])
+        extra.append(pytest_html.extras.html(recorder.to_html(budget)))
+        report.extra = extra
+    if budget is not None and report.passed and recorder.count > budget:
+        report.outcome = "failed"
+        report.longrepr = f"{recorder.count} WebDriver commands exceeded the budget of {budget}"
+
+
 def pytest_runtest_setup(item):
     for marker in item.iter_markers(name="my_marker"):
         print(marker)
@@ -135,28 +610,106 @@ def pytest_runtest_setup(item):
 
 
 @pytest.fixture
-def book_slug():
-    book_list = utility.Library()
-    return book_list.random_book_slug()
+def book_slug(request):
+    """Book slug of a light book offering the features the test needs.
+
+    Tests list their needs with the ``needs`` marker. The book is chosen
+    with the run's seed, independently of the test order, and added to the
+    test's report. The weight of the first load of the book page displayed
+    at the end of the test is recorded for later runs.
+
+    """
+    selection = request.config.pluginmanager.getplugin("book_selection")
+    marker = request.node.get_closest_marker("needs")
+    slug = selection.choose(request.node.nodeid, marker.args if marker else ())
+    request.node.user_properties.append(("book_slug", slug))
+    yield slug
+    driver = getattr(request.node, "_driver", None)
+    if driver is not None:
+        selection.record(slug, PageWeights.measure(driver, slug))
 
 
 @pytest.fixture
-def email(store):
-    """ Random user email fetched from secure store
+def seed_highlights(selenium):
+    """Create highlights on a book page without using the highlighting UI.
+
+    Return a function that saves highlights for the logged in user through
+    the application's highlight client, reloads the book page and returns
+    the new highlight IDs once they are displayed:
+
+        ids = seed_highlights(book, count=3, colors=[Color.GREEN], notes=["a"])
+
+    """
+
+    def seed(book, count=1, colors=None, notes=None):
+        ids = utility.Highlight.seed(selenium, count=count, colors=colors, notes=notes)
+        book.reload()
+        book.wait.until(lambda _: set(ids).issubset(book.content.highlight_ids))
+        return ids
+
+    return seed
+
+
+@pytest.fixture
+def user_info(store):
+    """ Random user fetched from secure store
+
+    Under pytest-xdist each worker chooses from its own share of the users so
+    parallel tests do not log in, or change the highlights of, the same user.
 
     :param store: secure store decrypt file
+    :return: user email and password -> dict
+    """
+    return random.choice(Worker.partition(store.get("_user_info")))
+
+
+@pytest.fixture
+def email(user_info):
+    """ Random user email fetched from secure store
+
+    :param user_info: the secure store user
     :return: user email -> str
     """
-    user_info = random.choice((store.get("_user_info")))
     return user_info["email"]
 
 
 @pytest.fixture
-def password(store):
+def password(user_info):
     """ Random user password fetched from secure store
 
-    :param store: secure store decrypt file
+    :param user_info: the secure store user
     :return: user password -> str
     """
-    user_info = random.choice((store.get("_user_info")))
     return user_info["password"]
+
+
+@pytest.fixture(scope="session")
+def login_cache():
+    """Session cookies for the secure store users logged in on this worker."""
+    return LoginCache()
+
+
+@pytest.fixture
+def logged_in(selenium, base_url, email, password, login_cache):
+    """Open a book page as the secure store user.
+
+    Return a function that opens a content page already logged in. The first
+    test on a worker logs in through Accounts and the authenticated cookies
+    are cached; later tests replay them before the page is opened and only
+    fall back to the log in form if the session has expired:
+
+        book = logged_in(Content(selenium, base_url, book_slug=..., page_slug=...))
+
+    """
+
+    def open_page(page):
+        if login_cache.restore(selenium, base_url, email):
+            return page.open()
+        page.open()
+        page.navbar.click_login()
+        Login(selenium).login(email, password)
+        page.wait_for_page_to_load()
+        login_cache.store(selenium, base_url, email)
+        return page
+
+    return open_page
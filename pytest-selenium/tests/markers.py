@@ -3,6 +3,7 @@ from pytest_testrail.plugin import pytestrail
 
 desktop_only = mark.desktop_only
 mobile_only = mark.mobile_only
+needs = mark.needs
 nondestructive = mark.nondestructive
 parametrize = mark.parametrize
 skip_test = mark.skip
@@ -11,3 +12,4 @@ test_case = pytestrail.case
 dev_only = mark.dev_only
 highlighting = mark.highlighting
 non_heroku = mark.non_heroku
+webdriver_budget = mark.webdriver_budget
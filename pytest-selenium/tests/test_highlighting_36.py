@@ -12,7 +12,6 @@ import pytest
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 
-from pages.accounts import Signup
 from pages.content import Content
 from tests import markers
 from tests.conftest import DESKTOP
@@ -30,7 +29,7 @@ XPATH_SEARCH = (
          "2-2-histograms-frequency-polygons-and-time-series-graphs")])
 @markers.desktop_only
 def test_highlighting_different_content(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Highlighting is available when content is selected with the mouse.
 
     .. note::
@@ -45,8 +44,7 @@ def test_highlighting_different_content(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    Signup(selenium).register()
+    student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -142,7 +140,7 @@ def test_highlighting_different_content(
 @markers.parametrize("page_slug", [("preface")])
 @markers.desktop_only
 def test_delete_a_highlight(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Create and then remove a highlight."""
     # GIVEN: a book preface page is displayed
     # AND:   a user is logged in
@@ -152,8 +150,7 @@ def test_delete_a_highlight(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    Signup(selenium).register()
+    student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -202,7 +199,7 @@ def test_delete_a_highlight(
 @markers.parametrize("page_slug", [("preface")])
 @markers.desktop_only
 def test_highlight_stays_on_navigation(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Highlights remain while navigating between pages."""
     # GIVEN: a book preface page is displayed
     # AND:   a user is logged in
@@ -212,8 +209,7 @@ def test_highlight_stays_on_navigation(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    Signup(selenium).register()
+    student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -257,7 +253,7 @@ def test_highlight_stays_on_navigation(
         ("astronomy",
          "1-1-the-nature-of-astronomy")])
 def test_search_term_colored_within_a_highlight(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Search highlights should be over user highlights."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -268,8 +264,7 @@ def test_search_term_colored_within_a_highlight(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -326,7 +321,7 @@ def test_search_term_colored_within_a_highlight(
          "1-1-the-nature-of-astronomy")])
 @markers.desktop_only
 def test_user_highlight_over_search_term_highlight(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Search highlights should be over user highlights."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -337,8 +332,7 @@ def test_user_highlight_over_search_term_highlight(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -395,7 +389,7 @@ def test_expanded_focussed_note_card_is_displayed_when_highlight_clicked():
          "1-introduction")])
 @markers.desktop_only
 def test_focussed_note_card_is_displayed_when_highlight_clicked(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Show the focussed note card when the user clicks a highlight."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -406,8 +400,7 @@ def test_focussed_note_card_is_displayed_when_highlight_clicked(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -459,7 +452,7 @@ def test_focussed_note_card_is_displayed_when_highlight_clicked(
          "1-introduction")])
 @markers.desktop_only
 def test_delete_a_highlight_and_note_using_the_context_menu(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Delete a highlight and associated note using the context menu."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -471,8 +464,7 @@ def test_delete_a_highlight_and_note_using_the_context_menu(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -521,7 +513,7 @@ def test_delete_a_highlight_and_note_using_the_context_menu(
          "1-introduction")])
 @markers.desktop_only
 def test_delete_a_note_using_the_context_menu(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Delete a note from a highlight using the context menu."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -533,8 +525,7 @@ def test_delete_a_note_using_the_context_menu(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -618,7 +609,7 @@ def test_delete_a_note_using_the_context_menu(
          "1-introduction")])
 @markers.desktop_only
 def test_cancel_deleting_a_highlight_using_the_context_menu(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Cancel deleting a highlight using the context menu."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -630,8 +621,7 @@ def test_cancel_deleting_a_highlight_using_the_context_menu(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -691,7 +681,7 @@ def test_cancel_deleting_a_highlight_using_the_context_menu(
          "1-introduction")])
 @markers.desktop_only
 def test_cancel_deleting_a_note_using_the_context_menu(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Cancel deleting a highlight using the context menu."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -703,8 +693,7 @@ def test_cancel_deleting_a_note_using_the_context_menu(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -765,7 +754,7 @@ def test_cancel_deleting_a_note_using_the_context_menu(
         ("microbiology",
          "1-introduction")])
 @markers.desktop_only
-def test_save_a_note_edit(selenium, base_url, book_slug, page_slug):
+def test_save_a_note_edit(selenium, base_url, book_slug, page_slug, student_account):
     """Save an edited note."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -777,8 +766,7 @@ def test_save_a_note_edit(selenium, base_url, book_slug, page_slug):
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -831,7 +819,7 @@ def test_cancel_after_editing_a_note():
          "1-introduction")])
 @markers.desktop_only
 def test_clicking_a_note_highlight_color_doesnt_change_the_highlight(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """No change is made when reselecting a highlight color for a note."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -843,8 +831,7 @@ def test_clicking_a_note_highlight_color_doesnt_change_the_highlight(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -892,7 +879,7 @@ def test_clicking_a_note_highlight_color_doesnt_change_the_highlight(
          "1-introduction")])
 @markers.desktop_only
 def test_clicking_a_new_note_highlight_color_changes_the_highlight(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Change a highlight with note color without saving it."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -904,8 +891,7 @@ def test_clicking_a_new_note_highlight_color_changes_the_highlight(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -972,7 +958,7 @@ def test_print_preview_shows_highlights():
          "1-introduction")])
 @markers.desktop_only
 def test_clicking_outside_edit_box_doesnt_close_when_note_not_saved(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Clicking outside of the highlight box doesn't close it when unsaved."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -983,8 +969,7 @@ def test_clicking_outside_edit_box_doesnt_close_when_note_not_saved(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -1022,7 +1007,7 @@ def test_clicking_outside_edit_box_doesnt_close_when_note_not_saved(
          "1-introduction")])
 @markers.mobile_only
 def test_read_only_display_card_is_shown_when_highlight_clicked_in_mobile(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Read-only display card is shown when the mobile highlight is clicked."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -1033,8 +1018,7 @@ def test_read_only_display_card_is_shown_when_highlight_clicked_in_mobile(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -1098,7 +1082,7 @@ def test_read_only_display_card_is_shown_when_highlight_clicked_in_mobile(
     [("microbiology", "1-introduction")]
 )
 def test_read_only_display_card_closes_when_clicking_content_in_mobile(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Clicking outside the display card closes the card on mobile."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -1110,8 +1094,7 @@ def test_read_only_display_card_closes_when_clicking_content_in_mobile(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -1163,7 +1146,7 @@ def test_read_only_display_card_closes_when_clicking_content_in_mobile(
     [("microbiology", "1-introduction")]
 )
 def test_mobile_display_card_scrolls_for_long_notes(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """A display card with a long note can be scrolled."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -1175,8 +1158,7 @@ def test_mobile_display_card_scrolls_for_long_notes(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -1225,7 +1207,7 @@ def test_mobile_display_card_scrolls_for_long_notes(
     [("microbiology", "1-introduction")]
 )
 def test_open_note_card_after_searching_for_term_in_highlight(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Clicking the searched text within a highlight opens the note."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -1236,8 +1218,7 @@ def test_open_note_card_after_searching_for_term_in_highlight(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -1309,7 +1290,7 @@ def test_open_note_card_after_searching_for_term_in_highlight(
     [("microbiology", "1-introduction")]
 )
 def test_open_a_second_note_when_the_first_is_already_displayed(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Click a second highlighted note when one is already open on mobile."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -1321,8 +1302,7 @@ def test_open_a_second_note_when_the_first_is_already_displayed(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -1402,7 +1382,7 @@ def test_content_highlight_and_note_are_copyable():
 @markers.highlighting
 @markers.parametrize("page_slug", [("preface")])
 def test_top_of_create_note_box_is_even_with_top_of_content_highlight(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """The top of the create box is even with the top of the highlight.
 
     .. note::
@@ -1418,8 +1398,7 @@ def test_top_of_create_note_box_is_even_with_top_of_content_highlight(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -1475,7 +1454,7 @@ def test_top_of_edit_note_box_is_even_with_top_of_content_highlight():
 @markers.highlighting
 @markers.parametrize("page_slug", [("preface")])
 def test_top_of_create_note_box_is_even_with_bottom_of_content_highlight(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """The top of the create box is even with the bottom of the highlight.
 
     .. note::
@@ -1491,8 +1470,7 @@ def test_top_of_create_note_box_is_even_with_bottom_of_content_highlight(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -1558,7 +1536,7 @@ def test_clicking_outside_create_note_box_closes_the_create_box():
     [("microbiology", "1-introduction")]
 )
 def test_change_color_of_highlighted_text(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Change the color of a content highlight."""
     # GIVEN: a book section is displayed
     # AND:   a user is logged in
@@ -1570,8 +1548,7 @@ def test_change_color_of_highlighted_text(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -20,7 +20,7 @@ from utils.utility import Color, Highlight, Utilities
     [("astronomy", "1-introduction")]
 )
 def test_highlight_is_not_created_until_a_color_is_selected(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """A highlight is not created until the highlight color is selected."""
     # GIVEN: the Astronomy book section 1.0 introduction is displayed
     # AND:   a user is logged in
@@ -30,8 +30,7 @@ def test_highlight_is_not_created_until_a_color_is_selected(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    Signup(selenium).register()
+    student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -76,7 +75,7 @@ def test_highlight_is_not_created_until_a_color_is_selected(
     [("microbiology", "1-introduction")]
 )
 def test_color_auto_selected_if_a_note_is_added(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """The first highlight color is auto-selected if a note is typed."""
     # GIVEN: the Astronomy book section 1.0 introduction is displayed
     # AND:   a user is logged in
@@ -87,8 +86,7 @@ def test_color_auto_selected_if_a_note_is_added(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    Signup(selenium).register()
+    student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -7,7 +7,6 @@ from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 
-from pages.accounts import Signup
 from pages.content import Content
 from tests import markers
 from tests.conftest import DESKTOP
@@ -28,7 +27,7 @@ HAS_INDICATOR = (
     [("astronomy", "1-1-the-nature-of-astronomy")]
 )
 def test_keyboard_navigation_for_my_highlights_button_on_content_page(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Use keyboard navigation to open and close My Highlights and Notes."""
     # GIVEN: a book page is displayed
     # AND:   a user is logged in
@@ -38,8 +37,7 @@ def test_keyboard_navigation_for_my_highlights_button_on_content_page(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -182,7 +180,7 @@ def test_open_my_highlights_for_non_logged_in_users_on_mobile(
       "2-2-histograms-frequency-polygons-and-time-series-graphs")]
 )
 def test_clicking_on_the_note_indicator_opens_the_note_card(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Open the note card for various highlights with notes."""
     # GIVEN: a book page is displayed
     # AND:   a user is logged in
@@ -193,8 +191,7 @@ def test_clicking_on_the_note_indicator_opens_the_note_card(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -256,7 +253,7 @@ def test_clicking_on_the_note_indicator_opens_the_note_card(
 )
 @markers.smoke_test
 def test_note_indicator_not_present_for_highlights_without_notes(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """The note indicator is not present on highlights without notes.
 
     .. note::
@@ -274,8 +271,7 @@ def test_note_indicator_not_present_for_highlights_without_notes(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -321,7 +317,7 @@ def test_note_indicator_not_present_for_highlights_without_notes(
 @markers.highlighting
 @markers.parametrize("page_slug", [("preface")])
 def test_note_indicator_added_when_highlight_without_a_note_has_a_note_added(
-        selenium, base_url, book_slug, page_slug):
+        selenium, base_url, book_slug, page_slug, student_account):
     """Adding a note to a highlight also adds the indicator to the highlight.
 
     """
@@ -334,8 +330,7 @@ def test_note_indicator_added_when_highlight_without_a_note_has_a_note_added(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -135,7 +135,7 @@ def test_my_highlights_summary_shows_highlights_and_notes_on_current_page(
 
     # ordering could be in sequence or reversed so check against both section
     # highlights
-    for index, highlight in enumerate(my_highlights.all_highlights):
+    for index, highlight in enumerate(my_highlights.highlights.iter_highlights()):
         option_1, option_2 = (ONE, TWO) if index <= TWO else (THREE, FOUR)
         assert (
             highlight.color == highlight_colors[option_1]
@@ -282,7 +282,7 @@ def test_my_highlights_summary_shows_all_types_of_content(selenium, base_url, bo
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("chemistry-2e", "1-1-chemistry-in-context")])
 def test_lengthy_highlights_summary_page_has_a_floating_back_to_top_link(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, seed_highlights
 ):
     """My Highlights and Notes summary has a floating back to top button."""
     # GIVEN: a book section is displayed
@@ -302,23 +302,7 @@ def test_lengthy_highlights_summary_page_has_a_floating_back_to_top_link(
         book.notification.got_it()
     book.content.show_solutions()
 
-    # making a highlight requires a non-mobile window width temporarily
-    width, height = book.get_window_size()
-    if width <= DESKTOP[0]:
-        selenium.set_window_size(width=DESKTOP[0], height=height)
-
-    for _ in range(10):
-        Highlight.force_highlight(
-            book=book,
-            by=random.choice,
-            group=book.content.paragraphs,
-            offset=Highlight.ENTIRE,
-            color=Highlight.random_color(),
-        )
-
-    if width != DESKTOP[0]:
-        # reset the window width for a mobile test
-        selenium.set_window_size(width=width, height=height)
+    seed_highlights(book, count=10)
 
     # WHEN: they open the highlights summary modal
     # AND:  the modal is scrolled down
@@ -1,16 +1,16 @@
-import random
 from time import sleep
 
-from pages.accounts import Signup
 from pages.content import Content
 from tests import markers
-from utils.utility import Highlight, Color
+from utils.utility import Color
 
 
 @markers.test_case("C593151")
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("microbiology", "4-introduction")])
-def test_no_results_message_in_MH_dropdown_filter(selenium, base_url, book_slug, page_slug):
+def test_no_results_message_in_MH_dropdown_filter(
+    selenium, base_url, book_slug, page_slug, student_account, seed_highlights
+):
     """No results message when selecting None in either or both chapter & color filters."""
 
     # GIVEN: Login book page
@@ -18,8 +18,7 @@ def test_no_results_message_in_MH_dropdown_filter(selenium, base_url, book_slug,
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -27,13 +26,7 @@ def test_no_results_message_in_MH_dropdown_filter(selenium, base_url, book_slug,
     book.content.show_solutions()
 
     # AND: Highlight 1 paragraph
-    Highlight.force_highlight(
-        book=book,
-        by=random.choice,
-        group=book.content.paragraphs,
-        offset=Highlight.ENTIRE,
-        color=Color.YELLOW,
-    )
+    seed_highlights(book, colors=[Color.YELLOW])
 
     my_highlights = book.toolbar.my_highlights()
 
@@ -86,7 +79,9 @@ def test_no_results_message_in_MH_dropdown_filter(selenium, base_url, book_slug,
 @markers.test_case("C593153")
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("microbiology", "4-introduction")])
-def test_no_results_message_in_MH_filter_tags(selenium, base_url, book_slug, page_slug):
+def test_no_results_message_in_MH_filter_tags(
+    selenium, base_url, book_slug, page_slug, student_account, seed_highlights
+):
     """No results message when removing filter tags."""
 
     # GIVEN: Login book page
@@ -94,8 +89,7 @@ def test_no_results_message_in_MH_filter_tags(selenium, base_url, book_slug, pag
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -103,13 +97,7 @@ def test_no_results_message_in_MH_filter_tags(selenium, base_url, book_slug, pag
     book.content.show_solutions()
 
     # AND: Highlight 1 paragraph
-    Highlight.force_highlight(
-        book=book,
-        by=random.choice,
-        group=book.content.paragraphs,
-        offset=Highlight.ENTIRE,
-        color=Color.YELLOW,
-    )
+    seed_highlights(book, colors=[Color.YELLOW])
 
     my_highlights = book.toolbar.my_highlights()
     filterbar = my_highlights.filter_bar
@@ -157,7 +145,9 @@ def test_no_results_message_in_MH_filter_tags(selenium, base_url, book_slug, pag
 @markers.desktop_only
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("microbiology", "1-introduction")])
-def test_filter_state_preserved_throughout_session(selenium, base_url, book_slug, page_slug):
+def test_filter_state_preserved_throughout_session(
+    selenium, base_url, book_slug, page_slug, student_account, seed_highlights
+):
     """Filter state preserved throughout the session irrespective of chapter/section navigation."""
 
     # GIVEN: Login book page
@@ -167,17 +157,14 @@ def test_filter_state_preserved_throughout_session(selenium, base_url, book_slug
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
         book.notification.got_it()
     book.content.show_solutions()
 
-    content_highlight_ids = book.content.highlight_ids
-    my_highlights = book.toolbar.my_highlights()
-    mh_highlight_ids = my_highlights.highlights.mh_highlight_ids
+    content_highlight_ids = []
 
     # AND: Highlights are present in different chapter pages
     page_slug = [
@@ -189,25 +176,14 @@ def test_filter_state_preserved_throughout_session(selenium, base_url, book_slug
 
     for page in page_slug:
         book = Content(selenium, base_url, book_slug=book_slug, page_slug=page).open()
-        Highlight.force_highlight(
-            book=book,
-            by=random.choice,
-            group=book.content.paragraphs,
-            offset=Highlight.ENTIRE,
-            color=Highlight.random_color(),
-        )
-
-        content_highlight_ids = content_highlight_ids + list(
-            set(book.content.highlight_ids) - set(content_highlight_ids)
-        )
+        content_highlight_ids = content_highlight_ids + seed_highlights(book)
 
-        my_highlights = book.toolbar.my_highlights()
-        mh_highlight_ids = mh_highlight_ids + list(
-            set(my_highlights.highlights.mh_highlight_ids) - set(mh_highlight_ids)
-        )
+    my_highlights = book.toolbar.my_highlights()
 
     # THEN: MH page displays all the content highlights
-    assert mh_highlight_ids == content_highlight_ids
+    missing, unexpected = my_highlights.highlights.compare_ids(content_highlight_ids)
+    assert not missing, f"highlights not listed in MH: {missing}"
+    assert not unexpected, f"unexpected highlights listed in MH: {unexpected}"
 
     # WHEN: Change the MH chapter filters to remove 2 chapters
     my_highlights = book.toolbar.my_highlights()
@@ -284,7 +260,9 @@ def test_filter_state_preserved_throughout_session(selenium, base_url, book_slug
 @markers.test_case("C594029")
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("microbiology", "1-introduction")])
-def test_filter_state_not_preserved_for_MH_in_new_tab(selenium, base_url, book_slug, page_slug):
+def test_filter_state_not_preserved_for_MH_in_new_tab(
+    selenium, base_url, book_slug, page_slug, student_account, seed_highlights
+):
     """Filter state is not preserved if MH page is opened in a new tab."""
 
     # GIVEN: Login book page
@@ -294,17 +272,14 @@ def test_filter_state_not_preserved_for_MH_in_new_tab(selenium, base_url, book_s
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
         book.notification.got_it()
     book.content.show_solutions()
 
-    content_highlight_ids = book.content.highlight_ids
-    my_highlights = book.toolbar.my_highlights()
-    mh_highlight_ids = my_highlights.highlights.mh_highlight_ids
+    content_highlight_ids = []
 
     # AND: Highlights are present in different chapter pages
     page_slug = [
@@ -316,25 +291,14 @@ def test_filter_state_not_preserved_for_MH_in_new_tab(selenium, base_url, book_s
 
     for page in page_slug:
         book = Content(selenium, base_url, book_slug=book_slug, page_slug=page).open()
-        Highlight.force_highlight(
-            book=book,
-            by=random.choice,
-            group=book.content.paragraphs,
-            offset=Highlight.ENTIRE,
-            color=Highlight.random_color(),
-        )
+        content_highlight_ids = content_highlight_ids + seed_highlights(book)
 
-        content_highlight_ids = content_highlight_ids + list(
-            set(book.content.highlight_ids) - set(content_highlight_ids)
-        )
-
-        my_highlights = book.toolbar.my_highlights()
-        mh_highlight_ids = mh_highlight_ids + list(
-            set(my_highlights.highlights.mh_highlight_ids) - set(mh_highlight_ids)
-        )
+    my_highlights = book.toolbar.my_highlights()
 
     # THEN: MH page displays all the content highlights
-    assert mh_highlight_ids == content_highlight_ids
+    missing, unexpected = my_highlights.highlights.compare_ids(content_highlight_ids)
+    assert not missing, f"highlights not listed in MH: {missing}"
+    assert not unexpected, f"unexpected highlights listed in MH: {unexpected}"
 
     # WHEN: Change the MH chapter filters to remove 2 chapters
     my_highlights = book.toolbar.my_highlights()
@@ -382,7 +346,7 @@ def test_filter_state_not_preserved_for_MH_in_new_tab(selenium, base_url, book_s
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("microbiology", "6-introduction")])
 def test_chapter_filter_collapses_on_clicking_color_filter(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, student_account, seed_highlights
 ):
     """Clicking on a filter dropdown will close the other filter dropdown if open."""
     sections = [("4.2", "Proteobacteria"), ("", "Introduction")]
@@ -392,16 +356,14 @@ def test_chapter_filter_collapses_on_clicking_color_filter(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
         book.notification.got_it()
     book.content.show_solutions()
 
-    my_highlights = book.toolbar.my_highlights()
-    mh_highlight_ids = my_highlights.highlights.mh_highlight_ids
+    highlight_ids = []
 
     # AND: Highlights are present in different chapter pages
     data = [
@@ -413,21 +375,11 @@ def test_chapter_filter_collapses_on_clicking_color_filter(
 
     for page, color in data:
         book = Content(selenium, base_url, book_slug=book_slug, page_slug=page).open()
-        Highlight.force_highlight(
-            book=book,
-            by=random.choice,
-            group=book.content.paragraphs,
-            offset=Highlight.ENTIRE,
-            color=color,
-        )
-
-        my_highlights = book.toolbar.my_highlights()
-        mh_highlight_ids = mh_highlight_ids + list(
-            set(my_highlights.highlights.mh_highlight_ids) - set(mh_highlight_ids)
-        )
+        highlight_ids = highlight_ids + seed_highlights(book, colors=[color])
 
+    my_highlights = book.toolbar.my_highlights()
     filterbar = my_highlights.filter_bar
-    last_two_highlights = (mh_highlight_ids[2], mh_highlight_ids[3])
+    last_two_highlights = (highlight_ids[2], highlight_ids[3])
 
     # AND: Open chapter dropdown to remove one chapter
     filterbar.toggle_chapter_dropdown_menu()
@@ -454,11 +406,12 @@ def test_chapter_filter_collapses_on_clicking_color_filter(
         (section.number, section.title) for section in my_highlights.highlights.sections
     ]
     assert set(highlight_sections) == set(sections), "mismatched section numbers and/or names"
-    assert len(my_highlights.all_highlights) == 2, (
-        "unexpected number of highlights found on the summary page ("
-        f"found {len(my_highlights.all_highlights)}"
-    )
-    assert set(my_highlights.highlights.mh_highlight_ids) == set(last_two_highlights)
+    records = my_highlights.highlights.records
+    assert (
+        len(records) == 2
+    ), f"unexpected number of highlights found on the summary page (found {len(records)})"
+    assert set(record.id for record in records) == set(last_two_highlights)
+    assert set(record.color for record in records) == {Color.YELLOW, Color.PINK}
 
 
 @markers.test_case("C593152")
@@ -466,7 +419,7 @@ def test_chapter_filter_collapses_on_clicking_color_filter(
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("psychology-2e", "2-introduction")])
 def test_select_chapter_with_highlights_and_select_color_not_used_in_that_chapter(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, student_account, seed_highlights
 ):
     """Select chapter with highlights and a color that is not used in that chapter in MH page filters dropdown."""  # NOQA
     # GIVEN: Login book page
@@ -474,8 +427,7 @@ def test_select_chapter_with_highlights_and_select_color_not_used_in_that_chapte
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -491,13 +443,7 @@ def test_select_chapter_with_highlights_and_select_color_not_used_in_that_chapte
 
     for page, color in data:
         book = Content(selenium, base_url, book_slug=book_slug, page_slug=page).open()
-        Highlight.force_highlight(
-            book=book,
-            by=random.choice,
-            group=book.content.paragraphs,
-            offset=Highlight.ENTIRE,
-            color=color,
-        )
+        seed_highlights(book, colors=[color])
 
     # WHEN: Update chapter dropdown to include only one highlighted
     #       Chapter - ch 1 remains selected
@@ -523,7 +469,7 @@ def test_select_chapter_with_highlights_and_select_color_not_used_in_that_chapte
 @markers.test_case("C592628")
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("astronomy", "1-1-the-nature-of-astronomy")])
-def test_MH_empty_state_logged_in_user(selenium, base_url, book_slug, page_slug):
+def test_MH_empty_state_logged_in_user(selenium, base_url, book_slug, page_slug, student_account):
     """Logged in user empty state for MH page."""
 
     # GIVEN: Login book page
@@ -531,8 +477,7 @@ def test_MH_empty_state_logged_in_user(selenium, base_url, book_slug, page_slug)
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
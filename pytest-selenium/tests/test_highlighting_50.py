@@ -5,7 +5,6 @@ import pytest
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.action_chains import ActionChains
 
-from pages.accounts import Signup
 from pages.content import Content
 from tests import markers
 from utils.utility import Highlight, Color, Utilities
@@ -17,7 +16,7 @@ from utils.utility import Highlight, Color, Utilities
 @markers.parametrize(
     "book_slug, page_slug", [("organizational-behavior", "1-1-the-nature-of-work")]
 )
-def test_change_color_from_MH_page(selenium, base_url, book_slug, page_slug):
+def test_change_color_from_MH_page(selenium, base_url, book_slug, page_slug, student_account):
     """Changing highlight color from MH page, updates the highlight in content page."""
 
     # GIVEN: Login book page
@@ -25,8 +24,7 @@ def test_change_color_from_MH_page(selenium, base_url, book_slug, page_slug):
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -84,7 +82,7 @@ def test_change_color_from_MH_page(selenium, base_url, book_slug, page_slug):
 @markers.parametrize(
     "book_slug, page_slug", [("organizational-behavior", "1-1-the-nature-of-work")]
 )
-def test_add_note_from_MH_page(selenium, base_url, book_slug, page_slug):
+def test_add_note_from_MH_page(selenium, base_url, book_slug, page_slug, student_account):
     """Adding note from MH page, updates the highlight in content page."""
 
     # GIVEN: Login book page
@@ -92,8 +90,7 @@ def test_add_note_from_MH_page(selenium, base_url, book_slug, page_slug):
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -164,7 +161,7 @@ def test_add_note_from_MH_page(selenium, base_url, book_slug, page_slug):
 @markers.parametrize(
     "book_slug, page_slug", [("organizational-behavior", "1-1-the-nature-of-work")]
 )
-def test_edit_note_from_MH_page(selenium, base_url, book_slug, page_slug):
+def test_edit_note_from_MH_page(selenium, base_url, book_slug, page_slug, student_account):
     """Editing note from MH page, updates the highlight in content page."""
 
     # GIVEN: Login book page
@@ -172,8 +169,7 @@ def test_edit_note_from_MH_page(selenium, base_url, book_slug, page_slug):
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -291,7 +287,7 @@ def test_edit_note_from_MH_page(selenium, base_url, book_slug, page_slug):
 @markers.parametrize(
     "book_slug, page_slug", [("organizational-behavior", "1-1-the-nature-of-work")]
 )
-def test_delete_highlight_from_MH_page(selenium, base_url, book_slug, page_slug):
+def test_delete_highlight_from_MH_page(selenium, base_url, book_slug, page_slug, student_account):
     """Deleting highlight from MH page, removes the highlight in content page."""
 
     # GIVEN: Login book page
@@ -299,8 +295,7 @@ def test_delete_highlight_from_MH_page(selenium, base_url, book_slug, page_slug)
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -367,7 +362,9 @@ def test_delete_highlight_from_MH_page(selenium, base_url, book_slug, page_slug)
 @markers.parametrize(
     "book_slug, page_slug", [("organizational-behavior", "1-1-the-nature-of-work")]
 )
-def test_no_context_menu_in_mobile_MH_page(selenium, base_url, book_slug, page_slug):
+def test_no_context_menu_in_mobile_MH_page(
+    selenium, base_url, book_slug, page_slug, student_account
+):
     """Mobile MH page does not have context menu."""
 
     # GIVEN: Login book page
@@ -375,8 +372,7 @@ def test_no_context_menu_in_mobile_MH_page(selenium, base_url, book_slug, page_s
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -395,7 +391,9 @@ def test_no_context_menu_in_mobile_MH_page(selenium, base_url, book_slug, page_s
 @markers.test_case("C597679")
 @markers.desktop_only
 @markers.parametrize("book_slug,page_slug", [("organizational-behavior", "1-1-the-nature-of-work")])
-def test_MH_color_filters_reflect_highlight_color_change(selenium, base_url, book_slug, page_slug):
+def test_MH_color_filters_reflect_highlight_color_change(
+    selenium, base_url, book_slug, page_slug, student_account
+):
     """Highlight color change in MH page is reflected in MH filters."""
 
     # GIVEN: Login book page
@@ -403,8 +401,7 @@ def test_MH_color_filters_reflect_highlight_color_change(selenium, base_url, boo
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
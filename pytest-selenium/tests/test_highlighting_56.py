@@ -4,7 +4,6 @@ import pytest
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 
-from pages.accounts import Signup
 from tests import markers
 from pages.osweb import WebBase
 from pages.content import Content
@@ -23,7 +22,7 @@ XPATH_SEARCH = "//span[contains(text(),'{term}') and contains(@class,'highlight'
 @markers.parametrize("book_slug, page_slug", [("microbiology", "4-introduction")])
 @markers.smoke_test
 def test_modal_for_unsaved_notes_appears_on_clicking_another_highlight(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, student_account
 ):
     """Discard modal appears when unsaved notes are present & clicking another highlight."""
     # GIVEN: Login book page
@@ -31,8 +30,7 @@ def test_modal_for_unsaved_notes_appears_on_clicking_another_highlight(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -89,7 +87,7 @@ def test_modal_for_unsaved_notes_appears_on_clicking_another_highlight(
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("microbiology", "1-introduction")])
 def test_modal_for_unsaved_notes_appears_on_page_navigation_using_toc(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, student_account
 ):
     """Discard modal appears when unsaved notes are present & clicking TOC link."""
     # GIVEN: Login book page
@@ -98,8 +96,7 @@ def test_modal_for_unsaved_notes_appears_on_page_navigation_using_toc(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -164,7 +161,7 @@ def test_modal_for_unsaved_notes_appears_on_page_navigation_using_toc(
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("microbiology", "1-introduction")])
 def test_modal_for_unsaved_notes_appears_on_page_navigation_using_prev_link(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, student_account
 ):
     """Discard modal appears when unsaved notes are present & clicking previous link."""
     # GIVEN: Login book page
@@ -173,8 +170,7 @@ def test_modal_for_unsaved_notes_appears_on_page_navigation_using_prev_link(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -239,7 +235,7 @@ def test_modal_for_unsaved_notes_appears_on_page_navigation_using_prev_link(
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("microbiology", "1-introduction")])
 def test_modal_for_unsaved_notes_appears_on_page_navigation_using_next_link(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, student_account
 ):
     """Discard modal appears when unsaved notes are present & clicking next link."""
     # GIVEN: Login book page
@@ -248,8 +244,7 @@ def test_modal_for_unsaved_notes_appears_on_page_navigation_using_next_link(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -314,7 +309,7 @@ def test_modal_for_unsaved_notes_appears_on_page_navigation_using_next_link(
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("microbiology", "1-introduction")])
 def test_modal_for_unsaved_notes_appears_on_clicking_book_title(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, student_account
 ):
     """Discard modal appears when unsaved notes are present & book title is clicked."""
     # GIVEN: Login book page
@@ -323,8 +318,7 @@ def test_modal_for_unsaved_notes_appears_on_clicking_book_title(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -386,7 +380,7 @@ def test_modal_for_unsaved_notes_appears_on_clicking_book_title(
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("organizational-behavior", "2-introduction")])
 def test_modal_for_unsaved_notes_appears_on_selecting_new_text(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, student_account
 ):
     """Discard modal appears when unsaved notes are present & selecting new text."""
     # GIVEN: Login book page
@@ -394,8 +388,7 @@ def test_modal_for_unsaved_notes_appears_on_selecting_new_text(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -455,7 +448,7 @@ def test_modal_for_unsaved_notes_appears_on_selecting_new_text(
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("chemistry-atoms-first-2e", "preface")])
 def test_modal_for_unsaved_notes_appears_on_clicking_search_result_same_page(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, student_account
 ):
     """Discard modal appears when unsaved notes are present & selecting search result in same page."""
     # GIVEN: Login book page
@@ -465,8 +458,7 @@ def test_modal_for_unsaved_notes_appears_on_clicking_search_result_same_page(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -527,7 +519,7 @@ def test_modal_for_unsaved_notes_appears_on_clicking_search_result_same_page(
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("microbiology", "preface")])
 def test_modal_for_unsaved_notes_appears_on_clicking_search_result_different_page(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, student_account
 ):
     """Discard modal appears when unsaved notes are present & selecting search result in different page."""
     # GIVEN: Login book page
@@ -537,8 +529,7 @@ def test_modal_for_unsaved_notes_appears_on_clicking_search_result_different_pag
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -614,7 +605,7 @@ def test_modal_for_unsaved_notes_appears_on_clicking_search_result_different_pag
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("astronomy", "1-6-a-tour-of-the-universe")])
 def test_modal_for_unsaved_notes_appears_on_clicking_content_links(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, student_account
 ):
     """Discard modal appears when unsaved notes are present & clicking in-content link."""
     # GIVEN: Login book page
@@ -622,8 +613,7 @@ def test_modal_for_unsaved_notes_appears_on_clicking_content_links(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
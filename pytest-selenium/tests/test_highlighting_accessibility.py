@@ -19,7 +19,7 @@ from utils.utility import Color, Highlight, Utilities
     "book_slug, page_slug", [("business-law-i-essentials", "1-1-basic-american-legal-principles")]
 )
 def test_change_highlight_color_using_keyboard_content_page(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, student_account
 ):
     """Highlight color can be changed using keyboard navigation."""
 
@@ -28,8 +28,7 @@ def test_change_highlight_color_using_keyboard_content_page(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -109,7 +108,9 @@ def test_change_highlight_color_using_keyboard_content_page(
 @markers.desktop_only
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("organizational-behavior", "2-introduction")])
-def test_add_note_using_keyboard_content_page(selenium, base_url, book_slug, page_slug):
+def test_add_note_using_keyboard_content_page(
+    selenium, base_url, book_slug, page_slug, student_account
+):
     """Add note using keyboard navigation."""
 
     # GIVEN: Login book page
@@ -117,8 +118,7 @@ def test_add_note_using_keyboard_content_page(selenium, base_url, book_slug, pag
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -188,7 +188,9 @@ def test_add_note_using_keyboard_content_page(selenium, base_url, book_slug, pag
 @markers.desktop_only
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("organizational-behavior", "2-introduction")])
-def test_edit_note_using_keyboard_content_page(selenium, base_url, book_slug, page_slug):
+def test_edit_note_using_keyboard_content_page(
+    selenium, base_url, book_slug, page_slug, student_account
+):
     """Edit note using keyboard navigation."""
 
     # GIVEN: Login book page
@@ -196,8 +198,7 @@ def test_edit_note_using_keyboard_content_page(selenium, base_url, book_slug, pa
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -276,7 +277,9 @@ def test_edit_note_using_keyboard_content_page(selenium, base_url, book_slug, pa
 @markers.desktop_only
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("organizational-behavior", "2-introduction")])
-def test_delete_note_using_keyboard_content_page(selenium, base_url, book_slug, page_slug):
+def test_delete_note_using_keyboard_content_page(
+    selenium, base_url, book_slug, page_slug, student_account
+):
     """Delete note using keyboard navigation."""
 
     # GIVEN: Login book page
@@ -284,8 +287,7 @@ def test_delete_note_using_keyboard_content_page(selenium, base_url, book_slug,
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -369,7 +371,9 @@ def test_delete_note_using_keyboard_content_page(selenium, base_url, book_slug,
 @markers.parametrize(
     "book_slug, page_slug", [("organizational-behavior", "1-1-the-nature-of-work")]
 )
-def test_toggle_MH_page_context_menu_using_keyboard(selenium, base_url, book_slug, page_slug):
+def test_toggle_MH_page_context_menu_using_keyboard(
+    selenium, base_url, book_slug, page_slug, student_account
+):
     """Open/close context menu in MH page using keyboard."""
 
     # GIVEN: Login book page
@@ -377,8 +381,7 @@ def test_toggle_MH_page_context_menu_using_keyboard(selenium, base_url, book_slu
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -446,7 +449,7 @@ def test_toggle_MH_page_context_menu_using_keyboard(selenium, base_url, book_slu
     "book_slug, page_slug", [("organizational-behavior", "1-1-the-nature-of-work")]
 )
 def test_change_highlight_color_from_MH_page_context_menu_using_keyboard(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, student_account
 ):
     """Change highlight color using keyboard navigation in MH page."""
 
@@ -455,8 +458,7 @@ def test_change_highlight_color_from_MH_page_context_menu_using_keyboard(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -510,7 +512,9 @@ def test_change_highlight_color_from_MH_page_context_menu_using_keyboard(
 @markers.parametrize(
     "book_slug, page_slug", [("organizational-behavior", "1-1-the-nature-of-work")]
 )
-def test_add_note_from_MH_page_using_keyboard_navigation(selenium, base_url, book_slug, page_slug):
+def test_add_note_from_MH_page_using_keyboard_navigation(
+    selenium, base_url, book_slug, page_slug, student_account
+):
     """Add note from MH page using keyboard navigation."""
 
     # GIVEN: Login book page
@@ -518,8 +522,7 @@ def test_add_note_from_MH_page_using_keyboard_navigation(selenium, base_url, boo
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -598,7 +601,9 @@ def test_add_note_from_MH_page_using_keyboard_navigation(selenium, base_url, boo
 @markers.parametrize(
     "book_slug, page_slug", [("organizational-behavior", "1-1-the-nature-of-work")]
 )
-def test_edit_note_from_MH_page_using_keyboard_navigation(selenium, base_url, book_slug, page_slug):
+def test_edit_note_from_MH_page_using_keyboard_navigation(
+    selenium, base_url, book_slug, page_slug, student_account
+):
     """Edit note from MH page using keyboard navigation."""
 
     # GIVEN: Login book page
@@ -606,8 +611,7 @@ def test_edit_note_from_MH_page_using_keyboard_navigation(selenium, base_url, bo
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -688,7 +692,7 @@ def test_edit_note_from_MH_page_using_keyboard_navigation(selenium, base_url, bo
     "book_slug, page_slug", [("organizational-behavior", "1-1-the-nature-of-work")]
 )
 def test_delete_highlight_from_MH_page_using_keyboard_navigation(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, student_account
 ):
     """Deleting highlight from MH page using_keyboard_navigation."""
 
@@ -697,8 +701,7 @@ def test_delete_highlight_from_MH_page_using_keyboard_navigation(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -772,7 +775,7 @@ def test_delete_highlight_from_MH_page_using_keyboard_navigation(
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("astronomy", "1-1-the-nature-of-astronomy")])
 def test_keyboard_navigation_MH_empty_state_logged_in_user(
-    selenium, base_url, book_slug, page_slug
+    selenium, base_url, book_slug, page_slug, student_account
 ):
     """Keyboard navigation for logged in user empty state MH page."""
 
@@ -781,8 +784,7 @@ def test_keyboard_navigation_MH_empty_state_logged_in_user(
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -856,7 +858,9 @@ def test_keyboard_navigation_MH_empty_state_non_logged_in_user(
 @markers.desktop_only
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("astronomy", "1-1-the-nature-of-astronomy")])
-def test_keyboard_navigation_for_MH_dropdown_filters(selenium, base_url, book_slug, page_slug):
+def test_keyboard_navigation_for_MH_dropdown_filters(
+    selenium, base_url, book_slug, page_slug, student_account
+):
     """Keyboard navigation for the MH dropdown filters."""
 
     # GIVEN: Login book page
@@ -864,8 +868,7 @@ def test_keyboard_navigation_for_MH_dropdown_filters(selenium, base_url, book_sl
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
@@ -987,7 +990,9 @@ def test_keyboard_navigation_for_MH_dropdown_filters(selenium, base_url, book_sl
 @markers.desktop_only
 @markers.highlighting
 @markers.parametrize("book_slug, page_slug", [("astronomy", "1-1-the-nature-of-astronomy")])
-def test_keyboard_navigation_for_MH_filter_tags(selenium, base_url, book_slug, page_slug):
+def test_keyboard_navigation_for_MH_filter_tags(
+    selenium, base_url, book_slug, page_slug, student_account
+):
     """Keyboard navigation for the MH filter tags."""
 
     # GIVEN: Login book page
@@ -995,8 +1000,7 @@ def test_keyboard_navigation_for_MH_filter_tags(selenium, base_url, book_slug, p
 
     while book.notification_present:
         book.notification.got_it()
-    book.navbar.click_login()
-    name, email = Signup(selenium).register()
+    name, email = student_account(book)
 
     book.wait_for_page_to_load()
     while book.notification_present:
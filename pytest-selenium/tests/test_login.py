@@ -59,18 +59,13 @@ def test_login_and_logout(selenium, base_url, book_slug, page_slug, email, passw
 @markers.test_case("C477329")
 @markers.non_heroku
 @markers.parametrize("page_slug", ["preface"])
-def test_logout_in_osweb_logsout_rex(selenium, base_url, book_slug, page_slug, email, password):
+def test_logout_in_osweb_logsout_rex(selenium, base_url, book_slug, page_slug, logged_in):
     # GIVEN: Rex page is open
-    rex = Content(selenium, base_url, book_slug=book_slug, page_slug=page_slug).open()
+    # AND: the user is logged in
+    rex = logged_in(Content(selenium, base_url, book_slug=book_slug, page_slug=page_slug))
     rex_nav = rex.navbar
 
-    # WHEN: Login Rex with email & password
-    rex_nav.click_login()
-
-    accounts = Login(selenium)
-    accounts.login(email, password)
-
-    # AND: Open osweb url in a new tab
+    # WHEN: Open osweb url in a new tab
     rex.open_new_tab()
     rex.switch_to_window(1)
 
@@ -90,6 +85,29 @@ def test_logout_in_osweb_logsout_rex(selenium, base_url, book_slug, page_slug, e
     assert rex_nav.user_is_not_logged_in
 
 
+@markers.parametrize("page_slug", ["preface"])
+def test_second_login_replays_the_cached_session(
+    selenium, base_url, book_slug, page_slug, logged_in, monkeypatch
+):
+    """A cached login restores the session without the Accounts log in form."""
+    # GIVEN: a user logged in on this worker
+    book = logged_in(Content(selenium, base_url, book_slug=book_slug, page_slug=page_slug))
+    assert book.navbar.user_is_logged_in
+
+    # WHEN: the browser's cookies are cleared
+    # AND:  the user logs in again
+    selenium.delete_all_cookies()
+
+    def login_form(*args, **kwargs):
+        raise AssertionError("the Accounts log in form was used")
+
+    monkeypatch.setattr(Login, "login", login_form)
+    book = logged_in(Content(selenium, base_url, book_slug=book_slug, page_slug=page_slug))
+
+    # THEN: the user is logged in without using the log in form
+    assert book.navbar.user_is_logged_in
+
+
 @markers.test_case("C477328")
 @markers.non_heroku
 @markers.parametrize("page_slug", ["preface"])
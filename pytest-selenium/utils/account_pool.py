@@ -0,0 +1,196 @@
+"""A shared pool of registered student accounts leased one test at a time."""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from time import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from utils.restmail import RestMail
+from utils.sessions import Cookie
+
+
+class Account(object):
+    """A registered student account and its last known session cookies."""
+
+    def __init__(
+        self,
+        name: Tuple[str, str],
+        username: str,
+        password: str,
+        cookies: List[Cookie] = None,
+    ):
+        """Initialize the account details.
+
+        :param name: the student's first and last name
+        :param str username: the RestMail username used to register
+        :param str password: the account password
+        :param cookies: (optional) the captured session cookies
+        :type name: (str, str)
+        :type cookies: list(dict)
+
+        """
+        self.name = tuple(name)
+        self.username = username
+        self.password = password
+        self.cookies = cookies or []
+
+    @property
+    def email(self) -> RestMail:
+        """Return the account mailbox.
+
+        :return: the RestMail mailbox used to register the account
+        :rtype: :py:class:`~utils.restmail.RestMail`
+
+        """
+        return RestMail(self.username)
+
+    @classmethod
+    def from_json(cls, data: Dict) -> Account:
+        """Build an account from its stored representation.
+
+        :param dict data: the stored account values
+        :return: the account
+        :rtype: :py:class:`~utils.account_pool.Account`
+
+        """
+        return cls(data["name"], data["username"], data["password"], data.get("cookies"))
+
+    def to_json(self) -> Dict:
+        """Return the account values to store.
+
+        :return: the account values
+        :rtype: dict
+
+        """
+        return {
+            "cookies": self.cookies,
+            "name": list(self.name),
+            "password": self.password,
+            "username": self.username,
+        }
+
+
+class AccountPool(object):
+    """Lease registered accounts to tests across processes.
+
+    Accounts are stored in a JSON file, grouped by the site they were
+    registered on, so they survive between test runs. Every read and write
+    holds an exclusive lock on a sibling ``.lock`` file so pytest-xdist
+    workers never lease the same account. Leases held by processes that are
+    no longer running are reclaimed. The file holds passwords and session
+    cookies, so it is only readable by its owner and is kept outside the
+    project, and its ``.pytest_cache``, unless another path is given.
+
+    """
+
+    # The pool file used when no other path is given
+    DEFAULT = os.path.join(os.path.expanduser("~"), ".rex-web", "accounts.json")
+
+    def __init__(self, path: str, site: str):
+        """Open the pool for one site.
+
+        :param str path: the pool file path or ``None`` for
+            :py:attr:`DEFAULT`
+        :param str site: the site the accounts are registered on, typically
+            the base URL
+
+        """
+        self.path = path or self.DEFAULT
+        self.site = site
+        self.owner = os.getpid()
+
+    def lease(self) -> Optional[Account]:
+        """Reserve an idle account for the current process.
+
+        :return: an idle account or ``None`` if every account is in use
+        :rtype: :py:class:`~utils.account_pool.Account` or None
+
+        """
+        with self._accounts() as accounts:
+            for entry in accounts:
+                if not self._is_leased(entry):
+                    entry.update(leased_by=self.owner, leased_at=time())
+                    return Account.from_json(entry)
+        return None
+
+    def add(self, account: Account):
+        """Add a newly registered account, leased by the current process.
+
+        :param account: the new account
+        :type account: :py:class:`~utils.account_pool.Account`
+        :return: None
+
+        """
+        with self._accounts() as accounts:
+            accounts.append(dict(account.to_json(), leased_by=self.owner, leased_at=time()))
+
+    def update(self, account: Account):
+        """Store the account's latest session cookies.
+
+        :param account: a leased account
+        :type account: :py:class:`~utils.account_pool.Account`
+        :return: None
+
+        """
+        with self._accounts() as accounts:
+            for entry in accounts:
+                if entry["username"] == account.username:
+                    entry["cookies"] = account.cookies
+
+    def release(self, account: Account):
+        """Return a leased account to the pool.
+
+        :param account: a leased account
+        :type account: :py:class:`~utils.account_pool.Account`
+        :return: None
+
+        """
+        with self._accounts() as accounts:
+            for entry in accounts:
+                if entry["username"] == account.username:
+                    entry.update(leased_by=None, leased_at=None)
+
+    @contextmanager
+    def _accounts(self) -> Iterator[List[Dict]]:
+        """Lock the pool file and yield this site's accounts for editing."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        with open(f"{self.path}.lock", "w", opener=self._private) as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                pool = {}
+                if os.path.exists(self.path):
+                    with open(self.path) as stored:
+                        pool = json.load(stored)
+                accounts = pool.setdefault(self.site, [])
+                yield accounts
+                temporary = f"{self.path}.{self.owner}"
+                with open(temporary, "w", opener=self._private) as stored:
+                    json.dump(pool, stored, indent=2, sort_keys=True)
+                os.chmod(temporary, 0o600)
+                os.replace(temporary, self.path)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    @classmethod
+    def _private(cls, path: str, flags: int) -> int:
+        """Open a file that only its owner may read or write."""
+        return os.open(path, flags, 0o600)
+
+    @classmethod
+    def _is_leased(cls, entry: Dict) -> bool:
+        """Return True if a running process holds the account lease."""
+        owner = entry.get("leased_by")
+        if not owner:
+            return False
+        try:
+            os.kill(owner, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
@@ -0,0 +1,146 @@
+"""Choose the book a test runs against by its needs and measured page weight."""
+
+from __future__ import annotations
+
+from random import Random
+from typing import Dict, Iterable, List
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from utils.scheduler import DurationHistory
+from utils.utility import Library
+
+# The kilobytes transferred, or read from a cache, to load the current document,
+# leaving out the resources requested after its load event as the test used it
+PAGE_WEIGHT = r"""
+const navigation = performance.getEntriesByType('navigation')[0];
+if (!navigation) { return 0; }
+const loaded = navigation.loadEventEnd || Infinity;
+const entries = [navigation].concat(performance.getEntriesByType('resource')
+  .filter((entry) => entry.startTime <= loaded));
+const bytes = entries.reduce(
+  (total, entry) => total + (entry.encodedBodySize || entry.transferSize || 0), 0);
+return bytes / 1024;"""  # NOQA
+
+
+class PageWeights(DurationHistory):
+    """The measured page weight of each book, in kilobytes, kept on disk.
+
+    Books without a measurement are expected to weigh the median weight.
+    Only the first load of a book page is measured, not the content the
+    single page application fetched while the test navigated it.
+
+    """
+
+    @classmethod
+    def measure(cls, driver, slug: str) -> float:
+        """Return the weight of the first load of the book page displayed.
+
+        :param driver: a selenium webdriver
+        :param str slug: the book slug
+        :return: the page weight in kilobytes or ``0`` if the browser is not
+            displaying the book
+        :rtype: float
+
+        """
+        try:
+            if f"/books/{slug}/" not in driver.current_url:
+                return 0.0
+            return driver.execute_script(PAGE_WEIGHT)
+        except WebDriverException:
+            return 0.0
+
+
+class BookSelection(object):
+    """Choose a book for each test from the books that offer what it needs.
+
+    Tests declare their needs with the ``needs`` marker, like
+    ``@markers.needs("math", "practice")``. The candidates are ranked by their
+    measured page weight, books without a measurement at the median weight,
+    and a test receives one of the ``candidates`` lightest books, picked with
+    a generator seeded by the run seed and the test ID; books of equal weight
+    are shuffled by the same generator. The
+    seed is printed in the report header and the chosen book is added to each
+    test's report so a run may be repeated with ``--book-seed``.
+
+    """
+
+    def __init__(self, path: str, seed: str, candidates: int = 3):
+        """Load the page weights.
+
+        :param str path: the page weight history file
+        :param str seed: the run seed
+        :param int candidates: (optional) the number of lightest books a
+            test may receive
+            default: 3
+
+        """
+        self.candidates = max(1, candidates)
+        self.measured: Dict[str, float] = {}
+        self.seed = seed
+        self.weights = PageWeights(path)
+
+    def candidates_for(self, needs: Iterable[str], random: Random = None) -> List[str]:
+        """Return the books offering every need from the lightest.
+
+        :param needs: the book features the test needs
+        :param random: (optional) a generator used to order books of equal
+            weight, like books without a measurement
+            default: ``None`` orders them by slug
+        :type needs: iterable(str)
+        :type random: :py:class:`random.Random`
+        :return: the book slugs ordered by page weight
+        :rtype: list(str)
+        :raises ValueError: if no book offers every need
+
+        """
+        needs = sorted(set(needs))
+        slugs = sorted(book.slug for book in Library.with_features(*needs))
+        if not slugs:
+            raise ValueError(f"no book offers {', '.join(needs)}")
+        if random:
+            random.shuffle(slugs)
+        return sorted(slugs, key=self.weights.predict)
+
+    def choose(self, nodeid: str, needs: Iterable[str] = ()) -> str:
+        """Return the book slug for a test.
+
+        :param str nodeid: the test node ID
+        :param needs: (optional) the book features the test needs
+        :type needs: iterable(str)
+        :return: the book slug
+        :rtype: str
+
+        """
+        random = Random(f"{self.seed}:{nodeid}")
+        return random.choice(self.candidates_for(needs, random)[: self.candidates])
+
+    def record(self, slug: str, weight: float):
+        """Store the weight measured for a book.
+
+        :param str slug: the book slug
+        :param float weight: the page weight in kilobytes
+        :return: None
+
+        """
+        if weight > 0:
+            self.measured[slug] = max(self.measured.get(slug, 0.0), weight)
+
+    def pytest_report_header(self, config):
+        """Print the seed used to choose the books."""
+        return f"book selection seed: {self.seed}"
+
+    def pytest_sessionfinish(self, session):
+        """Save the measured weights or send them to the pytest-xdist controller."""
+        workeroutput = getattr(session.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput["page_weights"] = self.measured
+        elif self.measured:
+            self.weights.update(self.measured)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Merge the weights measured by a pytest-xdist worker."""
+        for slug, weight in getattr(node, "workeroutput", {}).get("page_weights", {}).items():
+            self.record(slug, weight)
@@ -0,0 +1,227 @@
+"""A pool of warm WebDriver sessions shared by the tests run on a worker."""
+
+from __future__ import annotations
+
+from json import dumps
+from typing import Callable, Dict, List, Set
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.readiness import Readiness
+
+# Cloud providers report one job per browser session so every test must
+# receive its own session
+CLOUD_DRIVERS = ("BrowserStack", "CrossBrowserTesting", "SauceLabs", "TestingBot")
+# The WebDriver arguments that decide which browser is started; others, like
+# the per-test service_log_path, do not prevent a browser from being reused
+SIGNATURE_ARGUMENTS = ("capabilities", "command_executor", "desired_capabilities", "options")
+
+CLEAR_STORAGE = r"""
+const [keepServiceWorkers] = arguments;
+const done = arguments[arguments.length - 1];
+try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}
+const registrations = !keepServiceWorkers && navigator.serviceWorker &&
+  navigator.serviceWorker.getRegistrations
+  ? navigator.serviceWorker.getRegistrations()
+  : Promise.resolve([]);
+registrations
+  .then((workers) => Promise.all(workers.map((worker) => worker.unregister())))
+  .then(() => done(true), () => done(false));"""  # NOQA
+
+
+class BrowserPool(object):
+    """Keep browser sessions warm between tests.
+
+    Browsers are reset after each test and recycled after ``max_uses`` tests
+    or as soon as they stop responding. At most ``max_idle`` browsers wait
+    between tests and idle browsers started with other options are quit when
+    a new browser is needed. Pre-warmed browsers keep their
+    service worker and its precache between tests so only the first test run
+    by each browser downloads the site's assets.
+
+    """
+
+    BLANK = "about:blank"
+    SCRIPT_TIMEOUT = 5
+
+    def __init__(self, max_uses: int = 25, max_idle: int = 1):
+        """Initialize an empty pool.
+
+        :param int max_uses: (optional) the number of tests a browser may run
+            before it is replaced with a new session
+            default: 25
+        :param int max_idle: (optional) the number of browsers kept between
+            tests
+            default: 1
+
+        """
+        self._idle: Dict[str, List] = {}
+        self._keys: Dict[str, str] = {}
+        self._uses: Dict[str, int] = {}
+        self._warm: Set[str] = set()
+        self.max_idle = max(0, max_idle)
+        self.max_uses = max(1, max_uses)
+
+    def acquire(self, driver_class, driver_kwargs: Dict, start: Callable = None):
+        """Return a warm browser matching the requested options.
+
+        :param driver_class: the WebDriver class supplied by pytest-selenium
+        :param dict driver_kwargs: the WebDriver initialization arguments
+        :param start: (optional) a function returning a new browser session
+            default: ``driver_class(**driver_kwargs)``
+        :type start: callable
+        :return: an idle browser session or a new one if none are available
+        :rtype: :py:class:`~selenium.webdriver.remote.webdriver.WebDriver`
+
+        """
+        key = self._signature(driver_class, driver_kwargs)
+        idle = self._idle.setdefault(key, [])
+        while idle:
+            driver = idle.pop()
+            if self.is_alive(driver):
+                return driver
+            self.discard(driver)
+        # Browsers started with other options are unlikely to be requested
+        # again by this worker
+        for other in list(self._idle):
+            while self._idle[other]:
+                self.discard(self._idle[other].pop())
+        driver = start() if start else driver_class(**driver_kwargs)
+        self._keys[driver.session_id] = key
+        self._uses[driver.session_id] = 0
+        return driver
+
+    def release(self, driver, reset: bool = True):
+        """Return a browser to the pool once a test is complete.
+
+        :param driver: the browser session used by the test
+        :param bool reset: (optional) clear the browser state before the next
+            test
+            default: ``True``
+        :return: None
+
+        """
+        session = driver.session_id
+        self._uses[session] = self._uses.get(session, 0) + 1
+        idle = sum(len(drivers) for drivers in self._idle.values())
+        if (
+            self._uses[session] >= self.max_uses
+            or session not in self._keys
+            or idle >= self.max_idle
+        ):
+            self.discard(driver)
+            return
+        try:
+            if reset:
+                self.reset(driver)
+        except WebDriverException:
+            self.discard(driver)
+            return
+        self._idle.setdefault(self._keys[session], []).append(driver)
+
+    def prewarm(self, driver, url: str, timeout: float = 30.0) -> bool:
+        """Install the site's service worker once per browser session.
+
+        The page is loaded and the wait ends when the service worker has
+        precached the site. Later resets keep the service worker.
+
+        :param driver: a pooled browser session
+        :param str url: a page of the site that registers the service worker
+        :param float timeout: (optional) the maximum time to wait in seconds
+            default: 30 seconds
+        :return: ``True`` if the browser holds a populated precache
+        :rtype: bool
+
+        """
+        session = driver.session_id
+        if session in self._warm:
+            return True
+        driver.get(url)
+        if Readiness.service_worker_ready(driver, timeout):
+            self._warm.add(session)
+            return True
+        return False
+
+    def reset(self, driver):
+        """Clear the session state left behind by the previous test.
+
+        Close any extra tabs, clear the cookies and web storage, unregister
+        service workers, unless the browser was pre-warmed, and park the
+        browser on a blank page.
+
+        :param driver: the browser session to reset
+        :return: None
+        :raises :py:class:`~selenium.common.exceptions.WebDriverException`: if
+            the browser no longer responds
+
+        """
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        if driver.current_url.startswith("http"):
+            with Readiness.script_timeout(driver, self.SCRIPT_TIMEOUT):
+                driver.execute_async_script(CLEAR_STORAGE, driver.session_id in self._warm)
+            driver.delete_all_cookies()
+        if hasattr(driver, "execute_cdp_cmd"):
+            # Clear the cookies set by every domain, not just the current one
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.get(self.BLANK)
+
+    def discard(self, driver):
+        """Quit a browser session and forget about it.
+
+        :param driver: the browser session to quit
+        :return: None
+
+        """
+        session = driver.session_id
+        self._keys.pop(session, None)
+        self._uses.pop(session, None)
+        self._warm.discard(session)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def close(self):
+        """Quit every idle browser in the pool.
+
+        :return: None
+
+        """
+        for idle in self._idle.values():
+            while idle:
+                self.discard(idle.pop())
+
+    @classmethod
+    def is_alive(cls, driver) -> bool:
+        """Return True if the browser still responds to commands.
+
+        :param driver: a browser session
+        :return: ``True`` if the browser session is still usable
+        :rtype: bool
+
+        """
+        try:
+            return bool(driver.window_handles)
+        except WebDriverException:
+            return False
+
+    @classmethod
+    def _signature(cls, driver_class, driver_kwargs: Dict) -> str:
+        """Return a key identifying browsers started with the same options.
+
+        :param driver_class: the WebDriver class
+        :param dict driver_kwargs: the WebDriver initialization arguments
+        :return: the serialized driver class and options
+        :rtype: str
+
+        """
+        options = {
+            name: value.to_capabilities() if hasattr(value, "to_capabilities") else value
+            for name, value in driver_kwargs.items()
+            if name in SIGNATURE_ARGUMENTS
+        }
+        return dumps([driver_class.__name__, options], sort_keys=True, default=str)
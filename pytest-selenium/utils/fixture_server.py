@@ -0,0 +1,423 @@
+"""An offline rex-web server for network isolated test runs.
+
+The server combines:
+
+* a built rex-web bundle (``yarn build``) served as a single page app
+* recorded archive, search and CMS responses read from disk using the same
+  layout as ``src/test/fixtures`` and the ``FIXTURES`` mode of
+  ``src/setupProxy.js``: the request path, optionally followed by the URL
+  encoded query string, an ``index.html`` for directories, a sibling
+  ``.status`` file for non-200 responses and an ``authenticated`` directory
+  used when the user is logged in
+* an in-memory Accounts stub with a log in form, log out and the current
+  user API; any e-mail and password pair logs in, so new students log in
+  instead of signing up
+* an in-memory highlights API for the logged in users' own highlights;
+  curated highlights, like study guides, are read from the fixtures
+
+"""
+
+from __future__ import annotations
+
+import json
+import mimetypes
+import os
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, quote, urlencode, urlparse
+from uuid import uuid4
+
+HIGHLIGHTS_API = "/highlights/api/v0/highlights"
+LOG_IN_FORM = """<!DOCTYPE html>
+<html><head><title>Log in</title></head><body>
+<form method="post" action="/accounts/login?{query}">
+<input id="login_form_email" name="email" type="text">
+<input id="login_form_password" name="password" type="password">
+<button type="submit">Continue</button>
+</form></body></html>"""
+SESSION_COOKIE = "_accounts_session"
+USER_SETS = ("", "user:me")
+
+
+class AccountStore(object):
+    """Users and their log in sessions."""
+
+    def __init__(self):
+        """Initialize the empty store."""
+        self._lock = Lock()
+        self._sessions: Dict[str, Dict] = {}
+        self._users: Dict[str, Dict] = {}
+
+    def log_in(self, email: str) -> str:
+        """Start a session for a user, creating the user if needed.
+
+        :param str email: the user's e-mail address
+        :return: the new session token
+        :rtype: str
+
+        """
+        with self._lock:
+            user = self._users.get(email)
+            if not user:
+                first, _, last = email.split("@")[0].replace(".", " ").partition(" ")
+                user = {
+                    "first_name": first.title(),
+                    "full_name": f"{first} {last}".strip().title(),
+                    "id": len(self._users) + 1,
+                    "last_name": last.title(),
+                    "name": email.split("@")[0],
+                    "uuid": str(uuid4()),
+                }
+                self._users[email] = user
+            token = uuid4().hex
+            self._sessions[token] = user
+            return token
+
+    def log_out(self, token: str):
+        """End a session.
+
+        :param str token: the session token
+        :return: None
+
+        """
+        with self._lock:
+            self._sessions.pop(token, None)
+
+    def user(self, token: Optional[str]) -> Optional[Dict]:
+        """Return the user for a session.
+
+        :param str token: the session token
+        :return: the logged in user or ``None``
+        :rtype: dict or None
+
+        """
+        with self._lock:
+            return self._sessions.get(token or "")
+
+
+class HighlightStore(object):
+    """Each user's highlights, using the highlights API JSON fields."""
+
+    def __init__(self):
+        """Initialize the empty store."""
+        self._lock = Lock()
+        self._highlights: Dict[str, List[Dict]] = {}
+
+    def create(self, user: Dict, highlight: Dict) -> Dict:
+        """Save a new highlight.
+
+        :param dict user: the highlight owner
+        :param dict highlight: the new highlight
+        :return: the saved highlight
+        :rtype: dict
+
+        """
+        saved = dict(highlight, id=highlight.get("id") or str(uuid4()))
+        with self._lock:
+            self._highlights.setdefault(user["uuid"], []).append(saved)
+        return saved
+
+    def update(self, user: Dict, highlight_id: str, changes: Dict) -> Optional[Dict]:
+        """Change a highlight's color or annotation.
+
+        :param dict user: the highlight owner
+        :param str highlight_id: the highlight ID
+        :param dict changes: the new values
+        :return: the updated highlight or ``None`` if it does not exist
+        :rtype: dict or None
+
+        """
+        with self._lock:
+            for highlight in self._highlights.get(user["uuid"], []):
+                if highlight["id"] == highlight_id:
+                    highlight.update(changes)
+                    return highlight
+        return None
+
+    def delete(self, user: Dict, highlight_id: str) -> bool:
+        """Delete a highlight.
+
+        :param dict user: the highlight owner
+        :param str highlight_id: the highlight ID
+        :return: ``True`` if the highlight existed
+        :rtype: bool
+
+        """
+        with self._lock:
+            highlights = self._highlights.get(user["uuid"], [])
+            remaining = [highlight for highlight in highlights if highlight["id"] != highlight_id]
+            self._highlights[user["uuid"]] = remaining
+            return len(remaining) != len(highlights)
+
+    def find(self, user: Dict, query: Dict[str, List[str]]) -> List[Dict]:
+        """Return the highlights matching the API filters.
+
+        :param dict user: the highlight owner
+        :param query: the parsed query string
+        :type query: dict(str, list(str))
+        :return: the matching highlights in creation order
+        :rtype: list(dict)
+
+        """
+        scope = query.get("scope_id", [None])[0]
+        sources = self._values(query, "source_ids")
+        colors = self._values(query, "colors")
+        with self._lock:
+            return [
+                highlight
+                for highlight in self._highlights.get(user["uuid"], [])
+                if (not scope or highlight.get("scope_id") == scope)
+                and (not sources or highlight.get("source_id") in sources)
+                and (not colors or highlight.get("color") in colors)
+            ]
+
+    @classmethod
+    def _values(cls, query: Dict[str, List[str]], name: str) -> List[str]:
+        """Return a list parameter sent either repeated or comma separated."""
+        return [value for entry in query.get(name, []) for value in entry.split(",") if value]
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """Route requests to the stubs, the fixtures or the rex-web bundle."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_DELETE(self):
+        if not self._highlights_api("DELETE"):
+            self._send_json(404, {"error": "not found"})
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == "/accounts/login":
+            return self._send(200, LOG_IN_FORM.format(query=self._query_string()), "text/html")
+        if path == "/accounts/logout":
+            self.server.accounts.log_out(self._session())
+            return self._redirect(self._return_to(), SESSION_COOKIE, "", expire=True)
+        if path == "/accounts/api/user":
+            user = self.server.accounts.user(self._session())
+            return self._send_json(200 if user else 403, user or {})
+        if self._highlights_api("GET"):
+            return
+        fixture = self._fixture()
+        if fixture:
+            return self._send_file(fixture)
+        self._send_bundle(path)
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        if path == "/accounts/login":
+            form = parse_qs(self._body().decode("utf-8"))
+            token = self.server.accounts.log_in(form.get("email", ["student@openstax.org"])[0])
+            return self._redirect(self._return_to(), SESSION_COOKIE, token)
+        if not self._highlights_api("POST"):
+            self._send_json(404, {"error": "not found"})
+
+    def do_PUT(self):
+        if not self._highlights_api("PUT"):
+            self._send_json(404, {"error": "not found"})
+
+    def log_message(self, format, *args):
+        """Keep the test output quiet."""
+        pass
+
+    def _highlights_api(self, method: str) -> bool:
+        """Serve the user's highlights; return False for other requests."""
+        url = urlparse(self.path)
+        if not url.path.startswith(HIGHLIGHTS_API):
+            return False
+        query = parse_qs(url.query)
+        if query.get("sets", [""])[0] not in USER_SETS:
+            # Curated highlights are recorded fixtures
+            return False
+        user = self.server.accounts.user(self._session())
+        if not user:
+            self._send_json(401, {"error": "not logged in"})
+            return True
+        store = self.server.highlights
+        highlight_id = url.path[len(HIGHLIGHTS_API) :].strip("/")
+        if method == "GET" and highlight_id == "summary":
+            counts: Dict[str, Dict[str, int]] = {}
+            for highlight in store.find(user, query):
+                colors = counts.setdefault(highlight["source_id"], {})
+                colors[highlight["color"]] = colors.get(highlight["color"], 0) + 1
+            self._send_json(200, {"counts_per_source": counts})
+        elif method == "GET":
+            found = store.find(user, query)
+            page = int(query.get("page", ["1"])[0])
+            per_page = int(query.get("per_page", ["200"])[0])
+            data = found[(page - 1) * per_page : page * per_page]
+            meta = {"page": page, "per_page": per_page, "total_count": len(found)}
+            self._send_json(200, {"data": data, "meta": meta})
+        elif method == "POST":
+            body = self._json_body()
+            self._send_json(201, store.create(user, body.get("highlight", body)))
+        elif method == "PUT":
+            body = self._json_body()
+            updated = store.update(user, highlight_id, body.get("highlight", body))
+            self._send_json(200 if updated else 404, updated or {})
+        elif method == "DELETE":
+            self._send(200 if store.delete(user, highlight_id) else 404, "", "text/plain")
+        return True
+
+    def _fixture(self) -> Optional[str]:
+        """Return the recorded response file for the request, if any."""
+        url = urlparse(self.path)
+        directories = [self.server.fixtures]
+        if self.server.accounts.user(self._session()):
+            directories.insert(0, os.path.join(self.server.fixtures, "authenticated"))
+        for directory in directories:
+            path = os.path.join(directory, url.path.lstrip("/"))
+            if not self._contains(directory, path):
+                return None
+            candidates = [
+                os.path.join(path, quote(f"?{url.query}", safe="!'()*~")) if url.query else None,
+                path,
+                os.path.join(path, "index.html"),
+            ]
+            for candidate in candidates:
+                if candidate and os.path.isfile(candidate) and self._contains(directory, candidate):
+                    return candidate
+        return None
+
+    def _send_bundle(self, path: str):
+        """Serve a built file or the single page app index."""
+        build = self.server.build
+        target = os.path.normpath(os.path.join(build, path.lstrip("/")))
+        if os.path.isdir(target):
+            target = os.path.join(target, "index.html")
+        if self._contains(build, target) and os.path.isfile(target):
+            return self._send_file(target)
+        fallback = self.server.defaults.get(path)
+        if fallback and os.path.isfile(fallback):
+            return self._send_file(fallback)
+        if path == "/rex/redirects.json":
+            return self._send_json(200, [])
+        index = os.path.join(build, "index.html")
+        if path.startswith("/books/") and os.path.isfile(index):
+            return self._send_file(index)
+        self._send_json(404, {"error": "not found"})
+
+    def _send_file(self, path: str):
+        """Send a file, using a sibling ``.status`` file for the status."""
+        status = 200
+        if os.path.isfile(f"{path}.status"):
+            with open(f"{path}.status") as status_file:
+                status = int(status_file.read().strip() or 200)
+        with open(path, "rb") as body:
+            content = body.read()
+        content_type = mimetypes.guess_type(path)[0]
+        if not content_type:
+            content_type = "application/json" if content[:1] in (b"{", b"[") else "text/html"
+        self._send(status, content, content_type)
+
+    def _send_json(self, status: int, body):
+        self._send(status, json.dumps(body), "application/json")
+
+    def _send(self, status: int, body, content_type: str, headers: Dict[str, str] = None):
+        content = body.encode("utf-8") if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _redirect(self, location: str, cookie: str, value: str, expire: bool = False):
+        expiry = "; Max-Age=0" if expire else ""
+        self._send(
+            302,
+            "",
+            "text/plain",
+            {"Location": location, "Set-Cookie": f"{cookie}={value}; Path=/{expiry}"},
+        )
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def _json_body(self) -> Dict:
+        body = self._body()
+        return json.loads(body) if body else {}
+
+    @classmethod
+    def _contains(cls, root: str, path: str) -> bool:
+        """Return True if a path, once links are resolved, is within root."""
+        root = os.path.realpath(root)
+        return os.path.realpath(path).startswith(root + os.sep)
+
+    def _query_string(self) -> str:
+        return urlencode({"r": self._return_to()})
+
+    def _return_to(self) -> str:
+        return parse_qs(urlparse(self.path).query).get("r", ["/"])[0]
+
+    def _session(self) -> Optional[str]:
+        cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        return cookies[SESSION_COOKIE].value if SESSION_COOKIE in cookies else None
+
+
+class FixtureServer(object):
+    """Serve rex-web and its recorded dependencies from a background thread."""
+
+    def __init__(self, build: str, fixtures: str, host: str = "127.0.0.1", port: int = 0):
+        """Configure the server.
+
+        :param str build: the rex-web build directory
+        :param str fixtures: the recorded response directory
+        :param str host: (optional) the interface to listen on
+            default: ``127.0.0.1``
+        :param int port: (optional) the port; ``0`` selects a free port
+            default: 0
+
+        """
+        source = os.path.join(os.path.dirname(os.path.abspath(build)), "src")
+        self._server = ThreadingHTTPServer((host, port), FixtureRequestHandler)
+        self._server.daemon_threads = True
+        self._server.accounts = AccountStore()
+        self._server.build = os.path.abspath(build)
+        self._server.fixtures = os.path.abspath(fixtures)
+        self._server.highlights = HighlightStore()
+        # The development configuration used by setupProxy.js when the build
+        # does not include its own
+        self._server.defaults = {
+            "/rex/environment.json": os.path.join(source, "environment.development.json"),
+            "/rex/release.json": os.path.join(source, "release.development.json"),
+        }
+
+    def __enter__(self) -> FixtureServer:
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Return the server base URL.
+
+        :return: the base URL to use for ``--base-url``
+        :rtype: str
+
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> FixtureServer:
+        """Start serving in a daemon thread.
+
+        :return: the running server
+        :rtype: :py:class:`~utils.fixture_server.FixtureServer`
+
+        """
+        Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        """Stop the server and release its port.
+
+        :return: None
+
+        """
+        self._server.shutdown()
+        self._server.server_close()
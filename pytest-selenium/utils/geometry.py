@@ -0,0 +1,118 @@
+"""Element and viewport measurements collected in a single WebDriver call."""
+
+from __future__ import annotations
+
+from math import ceil as round_up
+from typing import Dict, List
+
+from selenium.webdriver.remote.webelement import WebElement
+
+# Return the element bounding box, its position within the document, the
+# scrolled viewport, the tag name and any requested computed style values
+MEASURE = r"""
+const [element, styles] = arguments;
+const {top, right, bottom, left, width, height} = element.getBoundingClientRect();
+const computed = window.getComputedStyle(element);
+const root = document.documentElement;
+return {
+  rect: {top, right, bottom, left, width, height},
+  document: {top: top + window.pageYOffset, left: left + window.pageXOffset},
+  viewport: {
+    top: window.pageYOffset,
+    left: window.pageXOffset,
+    width: root.clientWidth,
+    height: root.clientHeight,
+  },
+  tag: element.tagName.toLowerCase(),
+  styles: styles.reduce((values, name) => { values[name] = computed[name]; return values; }, {}),
+};"""  # NOQA
+
+
+class Geometry(object):
+    """The measurements for a single element."""
+
+    def __init__(self, data: Dict):
+        """Wrap the values returned by the measurement script.
+
+        :param dict data: the script results
+
+        """
+        self.rect: Dict[str, float] = data.get("rect", {})
+        self.document: Dict[str, float] = data.get("document", {})
+        self.viewport: Dict[str, float] = data.get("viewport", {})
+        self.tag_name: str = data.get("tag", "")
+        self.styles: Dict[str, str] = data.get("styles", {})
+
+    @classmethod
+    def measure(cls, driver, element: WebElement, styles: List[str] = ()) -> Geometry:
+        """Measure an element and the current viewport.
+
+        :param driver: a selenium webdriver
+        :param WebElement element: the element to measure
+        :param styles: (optional) the computed style properties to read, using
+            their JavaScript names like ``minHeight``
+        :type styles: list(str)
+        :return: the element measurements
+        :rtype: :py:class:`~utils.geometry.Geometry`
+
+        """
+        return cls(driver.execute_script(MEASURE, element, list(styles)))
+
+    @property
+    def height(self) -> float:
+        """Return the rendered element height in pixels.
+
+        :return: the element height
+        :rtype: float
+
+        """
+        return self.rect.get("height")
+
+    @property
+    def width(self) -> float:
+        """Return the rendered element width in pixels.
+
+        :return: the element width
+        :rtype: float
+
+        """
+        return self.rect.get("width")
+
+    @property
+    def in_viewport(self) -> bool:
+        """Return True if the entire element is within the visible viewport.
+
+        :return: ``True`` if the element is fully scrolled into view
+        :rtype: bool
+
+        """
+        left = round_up(self.document.get("left"))
+        right = round_up(self.document.get("left") + self.width)
+        top = round_up(self.document.get("top"))
+        bottom = top + round_up(self.height)
+
+        viewport_left = self.viewport.get("left")
+        viewport_top = self.viewport.get("top")
+        return all(
+            (
+                viewport_left <= left,
+                viewport_left + self.viewport.get("width") >= right,
+                viewport_top <= top,
+                viewport_top + self.viewport.get("height") >= bottom,
+            )
+        )
+
+    def pixels(self, style: str) -> float:
+        """Return a computed style length as a number.
+
+        :param str style: the computed style property name
+        :return: the length in pixels or ``0.0`` if the style is not a pixel
+            value, like ``auto`` or ``none``
+        :rtype: float
+
+        """
+        value = self.styles.get(style) or ""
+        try:
+            return float(value[:-2] if value.endswith("px") else value)
+        except ValueError:
+            return 0.0
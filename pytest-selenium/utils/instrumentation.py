@@ -0,0 +1,140 @@
+"""Count and time the WebDriver commands sent by each page object."""
+
+from __future__ import annotations
+
+import os
+import sys
+from html import escape
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+# The page object packages commands are attributed to
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGE_OBJECTS = tuple(os.path.join(ROOT, package) + os.sep for package in ("pages", "regions"))
+TEST_CODE = "test code"
+
+# (caller, WebDriver command, seconds)
+Command = Tuple[str, str, float]
+
+
+def page_object_caller(depth: int = 2) -> str:
+    """Return the innermost page object method on the call stack.
+
+    :param int depth: (optional) the number of frames to skip
+        default: 2
+    :return: the class and method name, like ``Content.highlight_box``, or
+        ``test code`` for direct calls from a test or fixture
+    :rtype: str
+
+    """
+    frame = sys._getframe(depth)
+    while frame:
+        code = frame.f_code
+        if code.co_filename.startswith(PAGE_OBJECTS):
+            owner = frame.f_locals.get("self")
+            if owner is None:
+                return f"{os.path.basename(code.co_filename)[:-3]}.{code.co_name}"
+            return f"{type(owner).__name__}.{code.co_name}"
+        frame = frame.f_back
+    return TEST_CODE
+
+
+class CommandRecorder(object):
+    """Record every command a browser session's executor sends.
+
+    The recorder replaces the ``execute`` method of the driver's
+    ``command_executor`` so every WebDriver call, including those made by
+    element references and waits, is counted.
+
+    """
+
+    def __init__(self, executor):
+        """Wrap a command executor.
+
+        :param executor: the WebDriver remote connection
+
+        """
+        self.commands: List[Command] = []
+        self._execute = executor.execute
+        executor.execute = self._record
+
+    @classmethod
+    def install(cls, driver) -> CommandRecorder:
+        """Return the recorder for a browser, installing it once per session.
+
+        :param driver: a selenium webdriver
+        :return: the session's command recorder
+        :rtype: :py:class:`~utils.instrumentation.CommandRecorder`
+
+        """
+        executor = driver.command_executor
+        recorder = getattr(executor, "_command_recorder", None)
+        if recorder is None:
+            recorder = cls(executor)
+            executor._command_recorder = recorder
+        return recorder
+
+    @property
+    def count(self) -> int:
+        """Return the number of commands recorded.
+
+        :return: the command count
+        :rtype: int
+
+        """
+        return len(self.commands)
+
+    def reset(self):
+        """Forget the commands sent by the previous test.
+
+        :return: None
+
+        """
+        self.commands = []
+
+    def summary(self) -> List[Tuple[str, str, int, float]]:
+        """Return the command totals for each page object method.
+
+        :return: the caller, command, command count and total seconds sorted
+            from the most to the least expensive
+        :rtype: list((str, str, int, float))
+
+        """
+        totals: Dict[Tuple[str, str], List] = {}
+        for caller, command, seconds in self.commands:
+            total = totals.setdefault((caller, command), [0, 0.0])
+            total[0] += 1
+            total[1] += seconds
+        rows = [(caller, command, *total) for (caller, command), total in totals.items()]
+        return sorted(rows, key=lambda row: (-row[3], row[0], row[1]))
+
+    def to_html(self, budget: int = None) -> str:
+        """Return the command summary as an HTML table for pytest-html.
+
+        :param int budget: (optional) the test's command budget
+            default: ``None``
+        :return: the HTML summary
+        :rtype: str
+
+        """
+        total = sum(seconds for _, _, seconds in self.commands)
+        limit = f" of {budget}" if budget is not None else ""
+        rows = "".join(
+            f"<tr><td>{escape(caller)}</td><td>{escape(command)}</td><td>{count}</td>"
+            f"<td>{seconds * 1000:.0f}</td><td>{seconds * 1000 / count:.1f}</td></tr>"
+            for caller, command, count, seconds in self.summary()
+        )
+        return (
+            f"<div><p>WebDriver commands: {self.count}{limit} in {total:.2f}s</p>"
+            "<table><tr><th>Caller</th><th>Command</th><th>Count</th>"
+            f"<th>Total (ms)</th><th>Mean (ms)</th></tr>{rows}</table></div>"
+        )
+
+    def _record(self, command: str, params: Dict):
+        """Send a command and record its caller and latency."""
+        caller = page_object_caller()
+        started = perf_counter()
+        try:
+            return self._execute(command, params)
+        finally:
+            self.commands.append((caller, command, perf_counter() - started))
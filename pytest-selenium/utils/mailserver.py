@@ -0,0 +1,297 @@
+"""A local RestMail stand-in that receives SMTP mail and serves it as JSON.
+
+Point the system under test's outgoing mail at the SMTP port and the
+:py:class:`~utils.restmail.RestMail` client at :py:attr:`LocalMailServer.mail_url`
+to verify registration e-mails without the public internet. Mail is
+delivered to the mailbox matching the recipient's local part, regardless of
+the domain, and the HTTP API matches restmail.net:
+
+    GET    /mail/{username}           list the messages as RestMail JSON
+    GET    /mail/{username}?wait=30   hold the request until a message arrives
+    DELETE /mail/{username}           empty the mailbox
+
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import socketserver
+from datetime import datetime, timezone
+from email import message_from_bytes, policy
+from email.utils import getaddresses, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Condition, Thread
+from typing import Dict, List
+from urllib.parse import parse_qs, urlparse
+
+ADDRESS_MATCHER = re.compile(r"<([^>]*)>")
+
+
+class Mailboxes(object):
+    """Thread-safe mail storage shared by the SMTP and HTTP servers."""
+
+    # The longest a single HTTP request may be held open
+    MAX_WAIT = 120.0
+
+    def __init__(self):
+        """Initialize the empty mailboxes."""
+        self._boxes: Dict[str, List[Dict]] = {}
+        self._arrival = Condition()
+
+    def deliver(self, recipients: List[str], data: bytes):
+        """Store a message for each recipient and wake any waiting readers.
+
+        :param recipients: the SMTP envelope recipient addresses
+        :param bytes data: the raw message
+        :type recipients: list(str)
+        :return: None
+
+        """
+        message = self.to_json(data)
+        with self._arrival:
+            for recipient in recipients:
+                username = recipient.split("@")[0].lower()
+                self._boxes.setdefault(username, []).append(message)
+            self._arrival.notify_all()
+
+    def messages(self, username: str, wait: float = 0.0) -> List[Dict]:
+        """Return the messages for a user, waiting for the first to arrive.
+
+        :param str username: the mailbox username
+        :param float wait: (optional) the maximum number of seconds to wait
+            when the mailbox is empty
+        :return: the mailbox messages
+        :rtype: list(dict)
+
+        """
+        username = username.lower()
+        with self._arrival:
+            self._arrival.wait_for(
+                lambda: self._boxes.get(username), timeout=min(max(wait, 0.0), self.MAX_WAIT)
+            )
+            return list(self._boxes.get(username, []))
+
+    def empty(self, username: str):
+        """Delete the messages for a user.
+
+        :param str username: the mailbox username
+        :return: None
+
+        """
+        with self._arrival:
+            self._boxes.pop(username.lower(), None)
+
+    @classmethod
+    def to_json(cls, data: bytes) -> Dict:
+        """Convert a raw message to the restmail.net JSON structure.
+
+        :param bytes data: the raw message
+        :return: the message fields read by
+            :py:class:`~utils.restmail.RestMail.Email`
+        :rtype: dict
+
+        """
+        message = message_from_bytes(data, policy=policy.default)
+        html = message.get_body(preferencelist=("html",))
+        text = message.get_body(preferencelist=("plain",))
+        received = datetime.now(timezone.utc).isoformat()
+        try:
+            date = parsedate_to_datetime(message["date"]).isoformat()
+        except (TypeError, ValueError):
+            date = received
+        return {
+            "date": date,
+            "from": cls._addresses(message.get_all("from", [])),
+            "headers": {name.lower(): str(value) for name, value in message.items()},
+            "html": html.get_content() if html else "",
+            "inReplyTo": str(message.get("in-reply-to", "")).split(),
+            "messageId": str(message.get("message-id", "")).strip("<>"),
+            "priority": "normal",
+            "receivedAt": received,
+            "receivedDate": received,
+            "references": str(message.get("references", "")).split(),
+            "subject": str(message.get("subject", "")),
+            "text": text.get_content() if text else "",
+            "to": cls._addresses(message.get_all("to", [])),
+        }
+
+    @classmethod
+    def _addresses(cls, headers: List[str]) -> List[Dict[str, str]]:
+        """Return the name and address pairs found in address headers."""
+        return [
+            {"address": address, "name": name}
+            for name, address in getaddresses([str(header) for header in headers])
+        ]
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """Accept mail using the minimal SMTP command set."""
+
+    def handle(self):
+        """Run a single SMTP conversation."""
+        recipients = []
+        self._reply("220 restmail.local ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8", "replace").strip()
+            verb = command[:4].upper()
+            if verb in ("HELO", "EHLO"):
+                self._reply("250 restmail.local")
+            elif verb in ("MAIL", "RSET"):
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                address = ADDRESS_MATCHER.search(command)
+                recipients.append(address.group(1) if address else command.split(":")[-1].strip())
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                self.server.mailboxes.deliver(recipients, self._read_data())
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "NOOP":
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+    def _read_data(self) -> bytes:
+        """Read the message body, removing the SMTP dot stuffing."""
+        lines = []
+        for line in iter(self.rfile.readline, b""):
+            if line.rstrip(b"\r\n") == b".":
+                break
+            lines.append(line[1:] if line.startswith(b"..") else line)
+        return b"".join(lines)
+
+    def _reply(self, response: str):
+        """Send a single response line."""
+        self.wfile.write(f"{response}\r\n".encode("utf-8"))
+
+
+class MailAPIHandler(BaseHTTPRequestHandler):
+    """Serve the mailboxes using the restmail.net API."""
+
+    def do_DELETE(self):
+        """Empty a mailbox."""
+        username = self._username()
+        if username is None:
+            return self._send(404, {"error": "not found"})
+        self.server.mailboxes.empty(username)
+        self._send(200, [])
+
+    def do_GET(self):
+        """List the messages in a mailbox, optionally waiting for one."""
+        username = self._username()
+        if username is None:
+            return self._send(404, {"error": "not found"})
+        query = parse_qs(urlparse(self.path).query)
+        try:
+            wait = float(query.get("wait", ["0"])[0])
+        except ValueError:
+            wait = 0.0
+        self._send(200, self.server.mailboxes.messages(username, wait))
+
+    def log_message(self, format, *args):
+        """Keep the test output quiet."""
+        pass
+
+    def _send(self, status: int, body):
+        """Send a JSON response."""
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _username(self):
+        """Return the mailbox username requested or None for other paths."""
+        parts = urlparse(self.path).path.strip("/").split("/")
+        if len(parts) == 2 and parts[0] == "mail" and parts[1]:
+            return parts[1]
+        return None
+
+
+class ThreadingSMTPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """Handle each SMTP connection in its own thread."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class LocalMailServer(object):
+    """Run the SMTP and HTTP mail services in background threads."""
+
+    def __init__(self, host: str = "127.0.0.1", smtp_port: int = 2525, http_port: int = 0):
+        """Configure the servers.
+
+        :param str host: (optional) the interface to listen on
+            default: ``127.0.0.1``
+        :param int smtp_port: (optional) the SMTP port; ``0`` selects a free
+            port
+            default: 2525
+        :param int http_port: (optional) the HTTP API port; ``0`` selects a
+            free port
+            default: 0
+
+        """
+        self.mailboxes = Mailboxes()
+        self._smtp = ThreadingSMTPServer((host, smtp_port), SMTPHandler)
+        self._http = ThreadingHTTPServer((host, http_port), MailAPIHandler)
+        self._http.daemon_threads = True
+        for server in (self._smtp, self._http):
+            server.mailboxes = self.mailboxes
+
+    def __enter__(self) -> LocalMailServer:
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def mail_url(self) -> str:
+        """Return the RestMail compatible mailbox URL template.
+
+        :return: the mailbox URL with a ``{username}`` placeholder
+        :rtype: str
+
+        """
+        host, port = self._http.server_address[:2]
+        return f"http://{host}:{port}/mail/{{username}}"
+
+    @property
+    def smtp_address(self):
+        """Return the SMTP host and port.
+
+        :return: the SMTP server host and port
+        :rtype: (str, int)
+
+        """
+        return self._smtp.server_address[:2]
+
+    def start(self) -> LocalMailServer:
+        """Start serving in daemon threads.
+
+        :return: the running server
+        :rtype: :py:class:`~utils.mailserver.LocalMailServer`
+
+        """
+        for server in (self._smtp, self._http):
+            Thread(target=server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        """Stop both servers and release their ports.
+
+        :return: None
+
+        """
+        for server in (self._smtp, self._http):
+            server.shutdown()
+            server.server_close()
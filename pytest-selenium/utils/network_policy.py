@@ -0,0 +1,99 @@
+"""Keep third-party requests out of the browser using the DevTools protocol."""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterable, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+
+class NetworkPolicy(object):
+    """Block third-party URLs and opt out of analytics before a page loads.
+
+    The rex-web page template defines queueing ``gtag`` and ``pi`` functions
+    before the Google and Pulse Insights scripts load so blocking those
+    scripts leaves working stubs in place; analytics events are still queued
+    in ``__APP_ANALYTICS``. MathJax is loaded from a CDN but is required to
+    render book content so it is never blocked by default.
+
+    """
+
+    # Analytics, survey and web font hosts used by rex-web
+    BLOCKED = (
+        "*doubleclick.net*",
+        "*fast.fonts.net*",
+        "*fonts.googleapis.com*",
+        "*fonts.gstatic.com*",
+        "*google-analytics.com*",
+        "*googleoptimize.com*",
+        "*googletagmanager.com*",
+        "*pulseinsights.com*",
+    )
+    OPT_OUT = "ANALYTICS_OPT_OUT"
+
+    def __init__(self, blocked: Iterable[str] = BLOCKED, base_url: Optional[str] = None):
+        """Configure the policy.
+
+        :param blocked: (optional) URL patterns to block; ``*`` matches any
+            characters
+            default: :py:attr:`BLOCKED`
+        :param str base_url: (optional) the site URL receiving the analytics
+            opt out cookie
+            default: ``None``
+        :type blocked: iterable(str)
+
+        """
+        self.blocked = [pattern for pattern in blocked if pattern]
+        self.base_url = base_url
+
+    @classmethod
+    def from_option(cls, value: Optional[str], base_url: Optional[str] = None) -> NetworkPolicy:
+        """Return a policy for a comma separated list of URL patterns.
+
+        :param str value: the URL patterns; ``None`` selects the default
+            patterns and an empty string blocks nothing
+        :param str base_url: (optional) the site URL
+            default: ``None``
+        :return: the network policy
+        :rtype: :py:class:`~utils.network_policy.NetworkPolicy`
+
+        """
+        if value is None:
+            return cls(base_url=base_url)
+        return cls([pattern.strip() for pattern in value.split(",")], base_url)
+
+    def apply(self, driver) -> bool:
+        """Install the policy in the current browser tab.
+
+        The blocked URLs and the opt out cookie are in place before the first
+        page is requested. Only Chromium browsers support the DevTools
+        protocol; other browsers are left unchanged and a warning is logged.
+        An ``EventFiringWebDriver`` is unwrapped to reach the browser driver.
+
+        :param driver: a selenium webdriver
+        :return: ``True`` if the policy was installed
+        :rtype: bool
+
+        """
+        driver = getattr(driver, "wrapped_driver", driver)
+        if not hasattr(driver, "execute_cdp_cmd"):
+            logger.warning(
+                "%s does not support the DevTools protocol; third-party URLs are not blocked",
+                type(driver).__name__,
+            )
+            return False
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked})
+            if self.base_url:
+                driver.execute_cdp_cmd(
+                    "Network.setCookie",
+                    {"name": self.OPT_OUT, "url": self.base_url, "value": "1"},
+                )
+        except WebDriverException as error:
+            logger.warning("Could not install the network policy: %s", error.msg)
+            return False
+        return True
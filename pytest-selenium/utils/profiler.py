@@ -0,0 +1,253 @@
+"""Attribute test time to page object methods, WebDriver calls, sleeps and waits.
+
+When enabled, every method and property defined by a ``Page`` or ``Region``
+in ``pages/`` and ``regions/`` is timed along with the WebDriver commands,
+``sleep()`` calls and ``WebDriverWait`` polling they trigger. Self time is
+recorded per call stack so the result can be written in the collapsed stack
+format read by ``flamegraph.pl`` and speedscope, and summarized per page
+object method.
+
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import os
+import pkgutil
+import sys
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple
+
+import pytest
+from pypom import Page, Region
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.instrumentation import ROOT
+
+PACKAGES = ("pages", "regions")
+
+# Leaf frame prefixes
+SLEEP = "sleep"
+WAIT = "wait:"
+WEBDRIVER = "webdriver:"
+
+Stack = Tuple[str, ...]
+
+
+class PageProfiler(object):
+    """Collect self time for each page object call stack."""
+
+    def __init__(self):
+        """Initialize an empty profile."""
+        self.samples: Dict[Stack, float] = {}
+        self._instrumented = set()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def instrument(self):
+        """Wrap the page objects, sleeps, waits and WebDriver commands.
+
+        :return: None
+
+        """
+        for package in PACKAGES:
+            for module in pkgutil.iter_modules([os.path.join(ROOT, package)]):
+                importlib.import_module(f"{package}.{module.name}")
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, "__file__", None) or ""
+            if not path.startswith(ROOT + os.sep):
+                continue
+            if getattr(module, "sleep", None) is time.sleep:
+                module.sleep = self.timed(SLEEP, time.sleep)
+            if name.split(".")[0] in PACKAGES:
+                for value in list(vars(module).values()):
+                    if isinstance(value, type) and value.__module__ == name:
+                        self._instrument_class(value)
+        for method in ("until", "until_not"):
+            wait = getattr(WebDriverWait, method)
+            setattr(WebDriverWait, method, self.timed(f"{WAIT}{method}", wait))
+        original = WebDriver.execute
+
+        @functools.wraps(original)
+        def execute(driver, command, params=None):
+            return self.call(f"{WEBDRIVER}{command}", original, driver, command, params)
+
+        WebDriver.execute = execute
+
+    def timed(self, label: str, function):
+        """Return a function wrapper that records its time under ``label``.
+
+        :param str label: the frame name
+        :param function: the function to time
+        :return: the wrapped function
+
+        """
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            return self.call(label, function, *args, **kwargs)
+
+        wrapper._profiled = True
+        return wrapper
+
+    def call(self, label: str, function, *args, **kwargs):
+        """Call a function inside a new profile frame.
+
+        :param str label: the frame name
+        :param function: the function to call
+        :return: the function's result
+
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        frame = [label, 0.0]
+        stack.append(frame)
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            key = tuple(name for name, _ in stack)
+            stack.pop()
+            if stack:
+                stack[-1][1] += elapsed
+            with self._lock:
+                self.samples[key] = self.samples.get(key, 0.0) + elapsed - frame[1]
+
+    def merge(self, samples: Iterable[Tuple[Iterable[str], float]]):
+        """Add the samples collected by another process.
+
+        :param samples: the call stacks and self times
+        :type samples: iterable((list(str), float))
+        :return: None
+
+        """
+        for key, seconds in samples:
+            key = tuple(key)
+            self.samples[key] = self.samples.get(key, 0.0) + seconds
+
+    def export(self) -> List[Tuple[List[str], float]]:
+        """Return the samples in a serializable form.
+
+        :return: the call stacks and self times
+        :rtype: list((list(str), float))
+
+        """
+        return [(list(key), seconds) for key, seconds in self.samples.items()]
+
+    def write_collapsed(self, path: str):
+        """Write the profile in the collapsed stack format.
+
+        Each line is a semicolon separated call stack followed by its self
+        time in milliseconds.
+
+        :param str path: the output file
+        :return: None
+
+        """
+        with open(path, "w") as output:
+            for key, seconds in sorted(self.samples.items()):
+                milliseconds = round(seconds * 1000)
+                if milliseconds:
+                    output.write(f"{';'.join(key)} {milliseconds}\n")
+
+    def top(self, count: int = 25) -> List[Tuple[str, float, float, float, float]]:
+        """Return the page object members with the most wall time.
+
+        Time is attributed to the innermost page object member on each call
+        stack and split into WebDriver, sleep and wait polling time.
+
+        :param int count: (optional) the number of members to return
+            default: 25
+        :return: the member, total, WebDriver, sleep and wait seconds
+        :rtype: list((str, float, float, float, float))
+
+        """
+        totals: Dict[str, List[float]] = {}
+        for key, seconds in self.samples.items():
+            members = [name for name in key if not name.startswith((SLEEP, WAIT, WEBDRIVER))]
+            if not members:
+                continue
+            total = totals.setdefault(members[-1], [0.0, 0.0, 0.0, 0.0])
+            total[0] += seconds
+            if key[-1].startswith(WEBDRIVER):
+                total[1] += seconds
+            elif key[-1] == SLEEP:
+                total[2] += seconds
+            elif key[-1].startswith(WAIT):
+                total[3] += seconds
+        rows = [(member, *total) for member, total in totals.items()]
+        return sorted(rows, key=lambda row: -row[1])[:count]
+
+    def _instrument_class(self, cls: type):
+        """Wrap the members defined by a page object and its nested regions."""
+        if not issubclass(cls, (Page, Region)) or cls in self._instrumented:
+            return
+        self._instrumented.add(cls)
+        for name, value in list(vars(cls).items()):
+            label = f"{cls.__name__}.{name}"
+            if isinstance(value, type) and value.__module__ == cls.__module__:
+                self._instrument_class(value)
+            elif name.startswith("__") and name != "__init__":
+                continue
+            elif isinstance(value, property) and value.fget:
+                setattr(
+                    cls,
+                    name,
+                    property(self.timed(label, value.fget), value.fset, value.fdel, value.__doc__),
+                )
+            elif isinstance(value, (classmethod, staticmethod)):
+                setattr(cls, name, type(value)(self.timed(label, value.__func__)))
+            elif callable(value) and not getattr(value, "_profiled", False):
+                setattr(cls, name, self.timed(label, value))
+
+
+class ProfilePlugin(object):
+    """Profile the page objects and report the results at the end of the run.
+
+    pytest-xdist workers send their samples to the controller, which writes
+    the combined profile.
+
+    """
+
+    def __init__(self, path: str, count: int = 25):
+        """Instrument the page objects.
+
+        :param str path: the collapsed stack output file
+        :param int count: (optional) the number of rows in the summary table
+            default: 25
+
+        """
+        self.count = count
+        self.path = path
+        self.profiler = PageProfiler()
+        self.profiler.instrument()
+
+    def pytest_sessionfinish(self, session):
+        """Send a worker's samples to the pytest-xdist controller."""
+        workeroutput = getattr(session.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput["page_profile"] = self.profiler.export()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Merge the samples collected by a pytest-xdist worker."""
+        self.profiler.merge(getattr(node, "workeroutput", {}).get("page_profile", []))
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        """Write the collapsed stacks and print the slowest page object members."""
+        if hasattr(config, "workerinput"):
+            return
+        self.profiler.write_collapsed(self.path)
+        terminalreporter.write_sep("-", f"page object profile: {self.path}")
+        terminalreporter.write_line(
+            f"{'total (s)':>10} {'webdriver':>10} {'sleep':>10} {'wait':>10}  member"
+        )
+        for member, total, webdriver, sleep, wait in self.profiler.top(self.count):
+            terminalreporter.write_line(
+                f"{total:10.2f} {webdriver:10.2f} {sleep:10.2f} {wait:10.2f}  {member}"
+            )
@@ -0,0 +1,297 @@
+"""Event-driven page load detection for rex-web pages."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Dict
+
+from selenium.common.exceptions import WebDriverException
+
+# The W3C get timeouts command, which selenium 3 does not define
+GET_TIMEOUTS = "getTimeouts"
+GET_TIMEOUTS_ROUTE = ("GET", "/session/$sessionId/timeouts")
+
+# Resolve as soon as the page reports a final state: the app has loaded and
+# MathJax has finished typesetting, the page is missing, the 404 page is
+# displayed or an error modal is open
+REX_READY = r"""
+const [missingText, notFoundHTML, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+let finished = false;
+let scheduled = false;
+let observer = null;
+let timer = null;
+const finish = (state) => {
+  if (finished) { return; }
+  finished = true;
+  if (observer) { observer.disconnect(); }
+  clearTimeout(timer);
+  done(state);
+};
+const check = () => {
+  scheduled = false;
+  const body = document.body;
+  if (finished || !body) { return; }
+  if (document.querySelector('.error-modal')) { return finish('error'); }
+  if (body.getAttribute('data-rex-loaded') === 'true') {
+    const hub = window.MathJax && window.MathJax.Hub;
+    return hub && hub.Queue ? hub.Queue(() => finish('loaded')) : finish('loaded');
+  }
+  if (body.textContent.includes(missingText)) { return finish('missing'); }
+  if (body.innerHTML.includes(notFoundHTML)) { return finish('not found'); }
+};
+const schedule = () => {
+  if (scheduled) { return; }
+  scheduled = true;
+  requestAnimationFrame(check);
+};
+timer = setTimeout(() => finish('timeout'), timeout);
+observer = new MutationObserver(schedule);
+observer.observe(document.documentElement, {
+  attributes: true, attributeFilter: ['data-rex-loaded', 'class'], childList: true, subtree: true
+});
+check();"""  # NOQA
+DOCUMENT_READY = "return document.readyState === 'complete';"
+# Resolve once MathJax has processed every queued typesetting request
+MATHJAX_IDLE = r"""
+const done = arguments[arguments.length - 1];
+const hub = window.MathJax && window.MathJax.Hub;
+if (!hub || !hub.Queue) { return done(false); }
+hub.Queue(() => done(true));"""  # NOQA
+# Resolve once the page, or an element, has stopped changing: no scrolling,
+# DOM mutations, size or position changes or running finite animations for a
+# number of consecutive animation frames
+SETTLED = r"""
+const [element, quietFrames, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const target = element || document.documentElement;
+let changed = false;
+let last = null;
+let quiet = 0;
+const signature = () => {
+  const rect = element ? element.getBoundingClientRect() : {};
+  return [window.scrollX, window.scrollY, rect.x, rect.y, rect.width, rect.height].join();
+};
+const animating = () => {
+  const source = element || document;
+  const animations = source.getAnimations ? source.getAnimations({subtree: true}) : [];
+  return animations.some((animation) => animation.playState === 'running' &&
+    !(animation.effect && animation.effect.getComputedTiming().endTime === Infinity));
+};
+const changes = () => { changed = true; };
+const observer = new MutationObserver(changes);
+observer.observe(target, {attributes: true, characterData: true, childList: true, subtree: true});
+document.addEventListener('scroll', changes, true);
+const finish = (result) => {
+  observer.disconnect();
+  document.removeEventListener('scroll', changes, true);
+  clearTimeout(timer);
+  done(result);
+};
+const timer = setTimeout(() => finish(false), timeout);
+const frame = () => {
+  const current = signature();
+  quiet = changed || current !== last || animating() ? 0 : quiet + 1;
+  changed = false;
+  last = current;
+  if (quiet >= quietFrames) { return finish(true); }
+  requestAnimationFrame(frame);
+};
+requestAnimationFrame(frame);"""  # NOQA
+# Resolve once the site's service worker is activated, controls the page and
+# Workbox has finished precaching the build. Workbox fills its precache during
+# the install event so an activated worker has a complete precache.
+SERVICE_WORKER_READY = r"""
+const [timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const container = navigator.serviceWorker;
+if (!container || !window.caches) { return done({state: 'unsupported', precached: 0}); }
+let finished = false;
+const finish = (state, precached = 0) => {
+  if (finished) { return; }
+  finished = true;
+  clearTimeout(timer);
+  done({state, precached});
+};
+const timer = setTimeout(() => finish('timeout'), timeout);
+const activated = (worker) => new Promise((resolve) => {
+  if (worker.state === 'activated') { return resolve(); }
+  worker.addEventListener('statechange', () => {
+    if (worker.state === 'activated') { resolve(); }
+  });
+});
+const controlled = () => new Promise((resolve) => {
+  if (container.controller) { return resolve(); }
+  container.addEventListener('controllerchange', resolve, {once: true});
+});
+const precached = () => caches.keys()
+  .then((names) => Promise.all(names
+    .filter((name) => name.includes('precache'))
+    .map((name) => caches.open(name).then((cache) => cache.keys()))))
+  .then((entries) => entries.reduce((total, requests) => total + requests.length, 0));
+container.ready
+  .then((registration) => activated(registration.active))
+  .then(controlled)
+  .then(precached)
+  .then((count) => finish(count ? 'ready' : 'empty', count))
+  .catch(() => finish('error'));"""  # NOQA
+
+
+class Readiness(object):
+    """Page readiness checks that cost a single WebDriver round trip."""
+
+    ERROR = "error"
+    LOADED = "loaded"
+    MISSING = "missing"
+    NOT_FOUND = "not found"
+    READY = "ready"
+    TIMEOUT = "timeout"
+    UNLOADED = "unloaded"
+
+    READY_STATES = (ERROR, LOADED, MISSING, NOT_FOUND)
+
+    # The W3C default script timeout in seconds
+    SCRIPT_TIMEOUT = 30.0
+
+    @classmethod
+    @contextmanager
+    def script_timeout(cls, driver, seconds: float):
+        """Use a script timeout for the enclosed scripts then restore it.
+
+        :param driver: a selenium webdriver
+        :param float seconds: the script timeout in seconds
+        :return: None
+
+        """
+        try:
+            commands = driver.command_executor._commands
+            commands.setdefault(GET_TIMEOUTS, GET_TIMEOUTS_ROUTE)
+            previous = driver.execute(GET_TIMEOUTS)["value"]["script"] / 1000
+        except (AttributeError, KeyError, TypeError, WebDriverException):
+            previous = cls.SCRIPT_TIMEOUT
+        driver.set_script_timeout(seconds)
+        try:
+            yield
+        finally:
+            try:
+                driver.set_script_timeout(previous)
+            except WebDriverException:
+                pass
+
+    @classmethod
+    def document_ready(cls, driver) -> bool:
+        """Return True when the document and its resources have loaded.
+
+        :param driver: a selenium webdriver
+        :return: ``True`` if the document ``readyState`` is complete
+        :rtype: bool
+
+        """
+        return driver.execute_script(DOCUMENT_READY)
+
+    @classmethod
+    def mathjax_idle(cls, driver, timeout: float = 5.0) -> bool:
+        """Block until MathJax has finished typesetting.
+
+        :param driver: a selenium webdriver
+        :param float timeout: (optional) the maximum time to wait in seconds
+            default: 5 seconds
+        :return: ``True`` if MathJax is loaded and idle
+        :rtype: bool
+
+        """
+        try:
+            with cls.script_timeout(driver, timeout):
+                return driver.execute_async_script(MATHJAX_IDLE)
+        except WebDriverException:
+            return False
+
+    @classmethod
+    def service_worker_ready(cls, driver, timeout: float = 10.0) -> bool:
+        """Block until the site works offline.
+
+        :param driver: a selenium webdriver
+        :param float timeout: (optional) the maximum time to wait in seconds
+            default: 10 seconds
+        :return: ``True`` if the service worker controls the page and the
+            Workbox precache is populated
+        :rtype: bool
+
+        """
+        return cls.service_worker_status(driver, timeout)["state"] == cls.READY
+
+    @classmethod
+    def service_worker_status(cls, driver, timeout: float = 10.0) -> Dict:
+        """Block until the service worker is activated and has precached the site.
+
+        The site registers its service worker once the app has loaded; the
+        wait ends when the active worker controls the page and the Workbox
+        precache, see ``workbox.config.js``, holds the build's assets.
+
+        :param driver: a selenium webdriver
+        :param float timeout: (optional) the maximum time to wait in seconds
+            default: 10 seconds
+        :return: the service worker ``state``, one of ``ready``, ``empty``
+            when nothing was precached, ``unsupported``, ``error`` or
+            ``timeout``, and the number of ``precached`` requests
+        :rtype: dict
+
+        """
+        try:
+            with cls.script_timeout(driver, timeout + 1):
+                return driver.execute_async_script(SERVICE_WORKER_READY, int(timeout * 1000))
+        except WebDriverException:
+            return {"state": cls.TIMEOUT, "precached": 0}
+
+    @classmethod
+    def settled(cls, driver, element=None, timeout: float = 2.0, frames: int = 2) -> bool:
+        """Block until scrolling, animations and rendering have finished.
+
+        Replaces fixed sleeps after clicks, scrolls and toggles; the wait ends
+        as soon as the page, or the element and its children, stop changing.
+
+        :param driver: a selenium webdriver
+        :param element: (optional) the element to watch instead of the whole
+            page
+            default: ``None``
+        :param float timeout: (optional) the maximum time to wait in seconds
+            default: 2 seconds
+        :param int frames: (optional) the number of unchanged animation frames
+            needed
+            default: 2
+        :type element: :py:class:`~selenium.webdriver.remote.webelement.WebElement`
+        :return: ``True`` if the page settled before the timeout
+        :rtype: bool
+
+        """
+        try:
+            with cls.script_timeout(driver, timeout + 1):
+                return driver.execute_async_script(SETTLED, element, frames, int(timeout * 1000))
+        except WebDriverException:
+            return False
+
+    @classmethod
+    def wait_for_rex(
+        cls, driver, missing_text: str, not_found_html: str, timeout: float = 10.0
+    ) -> str:
+        """Block until a rex-web page reaches a final load state.
+
+        :param driver: a selenium webdriver
+        :param str missing_text: the text displayed when a page is not found
+            within a book
+        :param str not_found_html: the HTML displayed by the 404 page
+        :param float timeout: (optional) the maximum time to wait in seconds
+            default: 10 seconds
+        :return: the page state; one of ``loaded``, ``missing``,
+            ``not found``, ``error``, ``timeout`` or ``unloaded`` if the
+            document was replaced while waiting, like during a reload
+        :rtype: str
+
+        """
+        try:
+            with cls.script_timeout(driver, timeout + 1):
+                return driver.execute_async_script(
+                    REX_READY, missing_text, not_found_html, int(timeout * 1000)
+                )
+        except WebDriverException:
+            return cls.UNLOADED
@@ -0,0 +1,337 @@
+"""A recording HTTP(S) proxy that replays book content from a local cache.
+
+Every ``GET`` response passing through the proxy, like the archive book and
+page JSON, page HTML, MathJax and images, is stored in a content-addressed
+cache: response bodies are saved once under their SHA-256 digest and an
+index entry per request URL records the status, headers and body digest.
+
+In ``record`` mode every request is sent to its origin and the cache is
+refreshed. In ``replay`` mode cached responses are served locally, after an
+optional fixed latency, and only cache misses reach the network (and are then
+recorded). Account and highlight requests are user specific, and the rex-web
+app shell, bundles and release files change with every deployment, so they
+always pass through and a replayed run never tests a stale build.
+
+HTTPS requests are intercepted using a self-signed certificate generated for
+the session; the browser must be started with ``--ignore-certificate-errors``.
+
+"""
+
+from __future__ import annotations
+
+import datetime
+import http.client
+import json
+import os
+import re
+import ssl
+import tempfile
+from hashlib import sha256
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import sleep
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+Headers = List[Tuple[str, str]]
+
+# Headers that only apply to a single connection or to a single user
+HOP_BY_HOP = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "proxy-connection",
+    "te",
+    "trailers",
+    "transfer-encoding",
+    "upgrade",
+}
+NOT_RECORDED = HOP_BY_HOP | {"content-length", "set-cookie"}
+# User specific requests that are never cached
+PASS_THROUGH = ("/accounts", "/highlights/api")
+# The rex-web app's own files, as routed by src/setupProxy.js, that are never
+# cached so each run loads the deployed release
+APP_PATHS = re.compile(
+    r"^/((books/.*)|(apps/rex/.*)|static.*|errors.*|rex.*|asset-manifest\.json"
+    r"|precache-manifest.*|index\.html)?$"
+)
+
+
+class ResponseCache(object):
+    """Store responses on disk with bodies addressed by their digest."""
+
+    def __init__(self, directory: str):
+        """Open, and create if needed, a cache directory.
+
+        :param str directory: the cache directory
+
+        """
+        self.directory = directory
+        os.makedirs(os.path.join(directory, "index"), exist_ok=True)
+        os.makedirs(os.path.join(directory, "objects"), exist_ok=True)
+
+    def load(self, url: str) -> Optional[Tuple[int, Headers, bytes]]:
+        """Return a recorded response.
+
+        :param str url: the request URL
+        :return: the status, headers and body or ``None`` if the URL has not
+            been recorded
+        :rtype: (int, list((str, str)), bytes) or None
+
+        """
+        try:
+            with open(self._entry(url)) as stored:
+                entry = json.load(stored)
+            with open(self._object(entry["body"]), "rb") as body:
+                return entry["status"], [tuple(header) for header in entry["headers"]], body.read()
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def store(self, url: str, status: int, headers: Headers, body: bytes):
+        """Record a response.
+
+        :param str url: the request URL
+        :param int status: the response status
+        :param headers: the response headers
+        :param bytes body: the response body
+        :type headers: list((str, str))
+        :return: None
+
+        """
+        digest = sha256(body).hexdigest()
+        body_path = self._object(digest)
+        if not os.path.exists(body_path):
+            os.makedirs(os.path.dirname(body_path), exist_ok=True)
+            self._write(body_path, body)
+        entry = {
+            "body": digest,
+            "headers": [
+                [name, value] for name, value in headers if name.lower() not in NOT_RECORDED
+            ],
+            "status": status,
+            "url": url,
+        }
+        self._write(self._entry(url), json.dumps(entry, indent=2).encode("utf-8"))
+
+    def _entry(self, url: str) -> str:
+        return os.path.join(
+            self.directory, "index", f"{sha256(url.encode('utf-8')).hexdigest()}.json"
+        )
+
+    def _object(self, digest: str) -> str:
+        return os.path.join(self.directory, "objects", digest[:2], digest)
+
+    @classmethod
+    def _write(cls, path: str, content: bytes):
+        """Write a file atomically so parallel workers never see a partial file."""
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as output:
+            output.write(content)
+        os.replace(temporary, path)
+
+
+class ProxyHandler(BaseHTTPRequestHandler):
+    """Forward, record and replay browser requests."""
+
+    protocol_version = "HTTP/1.1"
+    origin = None
+
+    def do_CONNECT(self):
+        """Intercept an HTTPS tunnel and keep reading requests through TLS."""
+        host, _, port = self.path.partition(":")
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        connection = self.server.tls.wrap_socket(self.connection, server_side=True)
+        self.connection = connection
+        self.rfile = connection.makefile("rb", self.rbufsize)
+        self.wfile = connection.makefile("wb")
+        self.origin = f"https://{host}" if port in ("", "443") else f"https://{self.path}"
+        self.close_connection = False
+
+    def do_GET(self):
+        self._handle()
+
+    def do_DELETE(self):
+        self._handle()
+
+    def do_HEAD(self):
+        self._handle()
+
+    def do_OPTIONS(self):
+        self._handle()
+
+    def do_PATCH(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def do_PUT(self):
+        self._handle()
+
+    def log_message(self, format, *args):
+        """Keep the test output quiet."""
+        pass
+
+    def _handle(self):
+        """Serve a request from the cache or its origin."""
+        url = f"{self.origin}{self.path}" if self.origin else self.path
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        proxy = self.server.proxy
+        path = urlsplit(url).path
+        cacheable = (
+            self.command == "GET"
+            and not path.startswith(PASS_THROUGH)
+            and not APP_PATHS.match(path)
+        )
+        if cacheable and proxy.mode == ReplayProxy.REPLAY:
+            recorded = proxy.cache.load(url)
+            if recorded:
+                sleep(proxy.latency)
+                return self._respond(*recorded)
+        try:
+            status, headers, content = self._fetch(url, body)
+        except (OSError, http.client.HTTPException) as error:
+            return self._respond(502, [("Content-Type", "text/plain")], str(error).encode())
+        if cacheable and status < 500:
+            proxy.cache.store(url, status, headers, content)
+        self._respond(status, headers, content)
+
+    def _fetch(self, url: str, body: bytes) -> Tuple[int, Headers, bytes]:
+        """Send the request to its origin."""
+        parts = urlsplit(url)
+        if parts.scheme == "https":
+            connection = http.client.HTTPSConnection(
+                parts.netloc,
+                timeout=self.server.proxy.TIMEOUT,
+                context=ssl.create_default_context(),
+            )
+        else:
+            connection = http.client.HTTPConnection(parts.netloc, timeout=self.server.proxy.TIMEOUT)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        headers = {
+            name: value for name, value in self.headers.items() if name.lower() not in HOP_BY_HOP
+        }
+        try:
+            connection.request(self.command, path, body=body or None, headers=headers)
+            response = connection.getresponse()
+            return response.status, response.getheaders(), response.read()
+        finally:
+            connection.close()
+
+    def _respond(self, status: int, headers: Headers, body: bytes):
+        """Send a complete response to the browser."""
+        self.send_response(status)
+        for name, value in headers:
+            if name.lower() not in HOP_BY_HOP and name.lower() != "content-length":
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+
+class ReplayProxy(object):
+    """Run the record and replay proxy in a background thread."""
+
+    RECORD = "record"
+    REPLAY = "replay"
+    MODES = (RECORD, REPLAY)
+
+    # Origin request timeout in seconds
+    TIMEOUT = 30
+
+    def __init__(
+        self, cache: str, mode: str = REPLAY, latency: float = 0.0, host: str = "127.0.0.1"
+    ):
+        """Configure the proxy.
+
+        :param str cache: the cache directory
+        :param str mode: (optional) ``record`` or ``replay``
+            default: ``replay``
+        :param float latency: (optional) seconds to wait before serving each
+            cached response
+            default: 0
+        :param str host: (optional) the interface to listen on
+            default: ``127.0.0.1``
+        :raises ValueError: for an unknown mode
+
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"{mode} is not one of {', '.join(self.MODES)}")
+        self.cache = ResponseCache(cache)
+        self.latency = latency
+        self.mode = mode
+        self._server = ThreadingHTTPServer((host, 0), ProxyHandler)
+        self._server.daemon_threads = True
+        self._server.proxy = self
+        self._server.tls = self._tls_context()
+
+    @property
+    def address(self) -> str:
+        """Return the proxy address for the browser's proxy settings.
+
+        :return: the proxy host and port
+        :rtype: str
+
+        """
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self) -> ReplayProxy:
+        """Start serving in a daemon thread.
+
+        :return: the running proxy
+        :rtype: :py:class:`~utils.replay_proxy.ReplayProxy`
+
+        """
+        Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        """Stop the proxy and release its port.
+
+        :return: None
+
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    @classmethod
+    def _tls_context(cls) -> ssl.SSLContext:
+        """Return a server context using a new self-signed certificate."""
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "rex-web replay proxy")])
+        now = datetime.datetime.utcnow()
+        certificate = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=30))
+            .sign(key, hashes.SHA256())
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            certificate_file = os.path.join(directory, "proxy.pem")
+            with open(certificate_file, "wb") as pem:
+                pem.write(certificate.public_bytes(serialization.Encoding.PEM))
+                pem.write(
+                    key.private_bytes(
+                        serialization.Encoding.PEM,
+                        serialization.PrivateFormat.TraditionalOpenSSL,
+                        serialization.NoEncryption(),
+                    )
+                )
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certificate_file)
+        return context
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 import re
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import Timeout
-from time import sleep
+from time import monotonic, sleep
 from typing import List, Union
 
 PIN_MATCHER = re.compile(r"(PIN\:? \d{6})")
@@ -20,7 +23,17 @@ class EmailVerificationError(Exception):
 class RestMail(object):
     """RestMail API for non-interactive e-mail testing."""
 
-    MAIL_URL = "http://restmail.net/mail/{username}"
+    DOMAIN = os.getenv("RESTMAIL_DOMAIN", "restmail.net")
+    MAIL_URL = os.getenv("RESTMAIL_URL", "http://restmail.net/mail/{username}")
+
+    # Polling backs off exponentially up to this pause between requests
+    MAX_PAUSE = 2.0
+    # The keep-alive connection pool size shared by every mailbox
+    POOL_SIZE = 16
+    # Extra time allowed for a long poll response beyond the requested wait
+    REQUEST_MARGIN = 5.0
+
+    _session = None
 
     def __init__(self, username: str):
         """Initialize a mailbox.
@@ -30,7 +43,40 @@ class RestMail(object):
         """
         self._inbox = []
         self._username = username
-        self._address = f"{username}@restmail.net"
+        self._address = f"{username}@{self.DOMAIN}"
+
+    @classmethod
+    def configure(cls, mail_url: str = None, domain: str = None):
+        """Select the RestMail service used by every mailbox.
+
+        :param str mail_url: (optional) the mailbox URL with a ``{username}``
+            placeholder, like the :py:class:`~utils.mailserver.LocalMailServer`
+            ``mail_url``
+        :param str domain: (optional) the e-mail address domain
+        :return: None
+
+        """
+        if mail_url:
+            cls.MAIL_URL = mail_url
+        if domain:
+            cls.DOMAIN = domain
+
+    @classmethod
+    def session(cls) -> requests.Session:
+        """Return the keep-alive HTTP session shared by every mailbox.
+
+        :return: a session with a connection pool large enough for
+            concurrent polling
+        :rtype: :py:class:`~requests.Session`
+
+        """
+        if cls._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=cls.POOL_SIZE, pool_maxsize=cls.POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            RestMail._session = session
+        return cls._session
 
     @property
     def address(self) -> str:
@@ -79,16 +125,22 @@ class RestMail(object):
         :return: None
 
         """
-        requests.delete(self.MAIL_URL.format(username=self._username))
+        self.session().delete(self.MAIL_URL.format(username=self._username))
 
-    def get_mail(self):
+    def get_mail(self, wait: float = 0.0):
         """Get email for a dynamic user.
 
+        :param float wait: (optional) ask the service to hold the request up
+            to this many seconds until a message arrives; services without
+            long polling, like restmail.net, respond immediately
         :return: a list of Emails received for a particular user
         :rtype: list(:py:class:`~RestMail.Email`)
 
         """
-        messages = requests.get(self.MAIL_URL.format(username=self._username))
+        messages = self.session().get(
+            self.MAIL_URL.format(username=self._username),
+            params={"wait": wait} if wait else None,
+            timeout=wait + self.REQUEST_MARGIN)
         self._inbox = [self.Email(message) for message in messages.json()]
         return self._inbox
 
@@ -96,23 +148,85 @@ class RestMail(object):
             -> List[RestMail.Email]:
         """Poll until mail is received but doesn't exceed max_time seconds.
 
+        Each request asks the service to long poll for the remaining time;
+        services that respond immediately are polled again after a pause that
+        doubles each time, up to ``MAX_PAUSE`` seconds.
+
+        :param float max_time: (optional) the maximum time to wait for emails
+        :param float pause_time: (optional) the initial time to wait between
+            polling requests
+        :return: a list of emails received for a particular user
+        :rtype: list(:py:class:`~RestMail.Email`)
+        :raises :py:class:`~requests.exceptions.Timeout`: if after waiting the
+            maximum time, no emails were received
+
+        """
+        deadline = monotonic() + max_time
+        pause = pause_time
+        while True:
+            remaining = deadline - monotonic()
+            self.get_mail(wait=max(remaining, 0.0))
+            if self._inbox:
+                return self._inbox
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise Timeout(f"Mail not received in {max_time} seconds")
+            sleep(min(pause, remaining))
+            pause = min(pause * 2, self.MAX_PAUSE)
+
+    async def wait_for_mail_async(self, max_time: float = 60.0,
+                                  pause_time: float = 0.25) \
+            -> List[RestMail.Email]:
+        """Wait for mail without blocking the event loop.
+
+        The requests run in the loop's default executor so many mailboxes may
+        be awaited concurrently, like during bulk account registration.
+
         :param float max_time: (optional) the maximum time to wait for emails
-        :param float pause_time: (optional) time to wait between polling
-            requests
+        :param float pause_time: (optional) the initial time to wait between
+            polling requests
         :return: a list of emails received for a particular user
         :rtype: list(:py:class:`~RestMail.Email`)
         :raises :py:class:`~requests.exceptions.Timeout`: if after waiting the
             maximum time, no emails were received
 
         """
-        timer = 0.0
-        while timer <= (max_time / pause_time):
-            self.get_mail()
+        loop = asyncio.get_running_loop()
+        deadline = monotonic() + max_time
+        pause = pause_time
+        while True:
+            remaining = deadline - monotonic()
+            await loop.run_in_executor(None, self.get_mail, max(remaining, 0.0))
             if self._inbox:
                 return self._inbox
-            timer = timer + pause_time
-            sleep(pause_time)
-        raise Timeout(f"Mail not received in {max_time} seconds")
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise Timeout(f"Mail not received in {max_time} seconds")
+            await asyncio.sleep(min(pause, remaining))
+            pause = min(pause * 2, self.MAX_PAUSE)
+
+    @classmethod
+    def wait_for_all(cls, mailboxes: List[RestMail], max_time: float = 60.0,
+                     pause_time: float = 0.25) -> List[List[RestMail.Email]]:
+        """Wait for mail to arrive in several mailboxes at once.
+
+        :param mailboxes: the mailboxes to watch
+        :param float max_time: (optional) the maximum time to wait for emails
+        :param float pause_time: (optional) the initial time to wait between
+            polling requests
+        :type mailboxes: list(:py:class:`~RestMail`)
+        :return: the emails received, in the same order as the mailboxes
+        :rtype: list(list(:py:class:`~RestMail.Email`))
+        :raises :py:class:`~requests.exceptions.Timeout`: if any mailbox does
+            not receive an email within the maximum time
+
+        """
+        async def gather():
+            return await asyncio.gather(*[
+                mailbox.wait_for_mail_async(max_time, pause_time)
+                for mailbox in mailboxes])
+
+        return asyncio.run(gather())
 
     class Email(object):
         """E-mail message structure.
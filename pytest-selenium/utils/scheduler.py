@@ -0,0 +1,228 @@
+"""Order and distribute tests using the durations recorded by earlier runs."""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+from statistics import median
+from time import monotonic
+from typing import Dict, Iterable, List
+
+import pytest
+from xdist.scheduler import LoadScheduling
+
+from utils.workers import Worker
+
+
+class DurationHistory(object):
+    """Per-test durations, including the resolution parameter, kept on disk."""
+
+    # Weight given to the newest measurement when updating a test's duration
+    SMOOTHING = 0.5
+
+    def __init__(self, path: str):
+        """Load the history file.
+
+        :param str path: the duration history file
+
+        """
+        self.path = path
+        try:
+            with open(path) as history:
+                self.durations: Dict[str, float] = json.load(history)
+        except (OSError, ValueError):
+            self.durations = {}
+        # Tests without a history are expected to take the median duration
+        self.default = median(self.durations.values()) if self.durations else 0.0
+
+    def predict(self, nodeid: str) -> float:
+        """Return the expected duration of a test.
+
+        :param str nodeid: the test node ID
+        :return: the expected duration in seconds
+        :rtype: float
+
+        """
+        return self.durations.get(nodeid, self.default)
+
+    def unknown(self, nodeids: Iterable[str]) -> int:
+        """Return the number of tests without a recorded duration.
+
+        :param nodeids: the test node IDs
+        :type nodeids: iterable(str)
+        :return: the number of new tests
+        :rtype: int
+
+        """
+        return len([nodeid for nodeid in nodeids if nodeid not in self.durations])
+
+    def longest_first(self, nodeids: Iterable[str]) -> List[int]:
+        """Return test positions ordered from the longest to the shortest.
+
+        :param nodeids: the test node IDs
+        :type nodeids: iterable(str)
+        :return: the positions of the tests in their new order
+        :rtype: list(int)
+
+        """
+        predicted = [self.predict(nodeid) for nodeid in nodeids]
+        return sorted(range(len(predicted)), key=lambda index: -predicted[index])
+
+    def makespan(self, nodeids: Iterable[str], workers: int = 1) -> float:
+        """Return the predicted wall time when the tests run longest first.
+
+        Each test is given to the first worker to become idle.
+
+        :param nodeids: the test node IDs
+        :param int workers: (optional) the number of parallel workers
+            default: 1
+        :type nodeids: iterable(str)
+        :return: the predicted wall time in seconds
+        :rtype: float
+
+        """
+        nodeids = list(nodeids)
+        finish = [0.0] * max(workers, 1)
+        for index in self.longest_first(nodeids):
+            heapq.heapreplace(finish, finish[0] + self.predict(nodeids[index]))
+        return max(finish)
+
+    def update(self, measured: Dict[str, float]):
+        """Merge the durations measured by this run and save the history.
+
+        :param measured: the test durations in seconds keyed by node ID
+        :type measured: dict(str, float)
+        :return: None
+
+        """
+        for nodeid, duration in measured.items():
+            previous = self.durations.get(nodeid)
+            if previous is not None:
+                duration = previous + self.SMOOTHING * (duration - previous)
+            self.durations[nodeid] = round(duration, 3)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as history:
+            json.dump(self.durations, history, indent=2, sort_keys=True)
+        os.replace(temporary, self.path)
+
+
+class LongestFirstScheduling(LoadScheduling):
+    """Send each idle pytest-xdist worker the longest remaining test.
+
+    Workers keep two tests queued, the minimum a worker needs to run a test,
+    so the longest tests start first and short tests fill the gaps at the end
+    of the run.
+
+    """
+
+    QUEUED = 2
+
+    def __init__(self, config, log=None, history: DurationHistory = None, plugin=None):
+        super().__init__(config, log)
+        self.history = history
+        self.plugin = plugin
+
+    def schedule(self):
+        """Order the collected tests and send the first tests to each worker."""
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+        self.collection = list(self.node2collection.values())[0]
+        self.pending[:] = self.history.longest_first(self.collection)
+        if self.plugin:
+            self.plugin.predict(self.collection, len(self.nodes))
+        for node in self.nodes:
+            self.check_schedule(node)
+
+    def check_schedule(self, node, duration=0):
+        """Top up a worker's queue from the front of the pending tests."""
+        if node.shutting_down:
+            return
+        if self.pending:
+            queued = len(self.node2pending[node])
+            if queued < self.QUEUED:
+                self._send_tests(node, self.QUEUED - queued)
+        else:
+            node.shutdown()
+        self.log("num items waiting for node:", len(self.pending))
+
+
+class DurationScheduler(object):
+    """Record test durations and schedule tests longest first.
+
+    Durations are always recorded, by the pytest-xdist controller when tests
+    are distributed. Tests are only reordered, and distributed by predicted
+    duration, when ``reorder`` is set.
+
+    """
+
+    def __init__(self, path: str, reorder: bool = False):
+        """Load the duration history.
+
+        :param str path: the duration history file
+        :param bool reorder: (optional) run the longest tests first
+            default: ``False``
+
+        """
+        self.history = DurationHistory(path)
+        self.measured: Dict[str, float] = {}
+        self.predicted = None
+        self.reorder = reorder
+        self.started = monotonic()
+        self.unknown = 0
+
+    def predict(self, nodeids: List[str], workers: int = 1):
+        """Store the predicted wall time for the scheduled tests.
+
+        :param nodeids: the scheduled test node IDs
+        :param int workers: (optional) the number of parallel workers
+            default: 1
+        :type nodeids: list(str)
+        :return: None
+
+        """
+        self.predicted = self.history.makespan(nodeids, workers)
+        self.unknown = self.history.unknown(nodeids)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        """Run the selected tests longest first."""
+        if not self.reorder:
+            return
+        nodeids = [item.nodeid for item in items]
+        items[:] = [items[index] for index in self.history.longest_first(nodeids)]
+        if not Worker.is_distributed():
+            self.predict(nodeids)
+
+    def pytest_runtest_logreport(self, report):
+        """Add the setup, call and teardown times of a test."""
+        self.measured[report.nodeid] = self.measured.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        """Save the measured durations."""
+        if self.measured and not Worker.is_distributed():
+            self.history.update(self.measured)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Report the predicted and actual wall time."""
+        if self.predicted is None or Worker.is_distributed():
+            return
+        terminalreporter.write_sep("-", "duration schedule")
+        terminalreporter.write_line(
+            f"predicted {self.predicted:.1f}s, actual {monotonic() - self.started:.1f}s"
+            f" ({self.unknown} tests without a recorded duration)"
+        )
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        """Distribute the tests longest first when using ``--dist load``."""
+        if self.reorder and config.getvalue("dist") == "load":
+            return LongestFirstScheduling(config, log, history=self.history, plugin=self)
+        return None
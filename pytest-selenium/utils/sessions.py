@@ -0,0 +1,139 @@
+"""Browser session cookie capture, restore and validation."""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.readiness import Readiness
+
+# Ask Accounts who is logged in using the browser's cookies; a logged out
+# user receives a 403
+CURRENT_USER = r"""
+const done = arguments[arguments.length - 1];
+fetch('/accounts/api/user', {credentials: 'include'})
+  .then((response) => done(response.status))
+  .catch(() => done(0));"""  # NOQA
+
+Cookie = Dict[str, object]
+
+
+class Session(object):
+    """Snapshot and replay an authenticated browser session."""
+
+    # Only these WebDriver cookie fields may be safely sent back to the browser
+    FIELDS = ("domain", "expiry", "httpOnly", "name", "path", "secure", "value")
+    SCRIPT_TIMEOUT = 10
+
+    @classmethod
+    def capture(cls, driver) -> List[Cookie]:
+        """Return the cookies visible to the current page.
+
+        :param driver: a selenium webdriver
+        :return: the cookie jar for the current domain
+        :rtype: list(dict)
+
+        """
+        return [
+            {field: cookie[field] for field in cls.FIELDS if field in cookie}
+            for cookie in driver.get_cookies()
+        ]
+
+    @classmethod
+    def restore(cls, driver, cookies: List[Cookie]) -> int:
+        """Add previously captured cookies to the browser.
+
+        The browser must already display a page on the cookies' domain.
+        Cookies the browser rejects, like those for another domain, are
+        skipped.
+
+        :param driver: a selenium webdriver
+        :param cookies: the captured cookie jar
+        :type cookies: list(dict)
+        :return: the number of cookies restored
+        :rtype: int
+
+        """
+        restored = 0
+        for cookie in cookies:
+            try:
+                driver.add_cookie(dict(cookie))
+                restored += 1
+            except WebDriverException:
+                continue
+        return restored
+
+    @classmethod
+    def is_logged_in(cls, driver) -> bool:
+        """Return True if Accounts recognizes the browser's session.
+
+        :param driver: a selenium webdriver displaying a rex-web page
+        :return: ``True`` if the current user request succeeds
+        :rtype: bool
+
+        """
+        try:
+            with Readiness.script_timeout(driver, cls.SCRIPT_TIMEOUT):
+                return driver.execute_async_script(CURRENT_USER) == 200
+        except WebDriverException:
+            return False
+
+
+class LoginCache(object):
+    """Authenticated cookie jars captured after a user's first UI log in.
+
+    Each pytest process, and therefore each pytest-xdist worker, keeps its own
+    cache so a session is never shared between parallel browsers.
+
+    """
+
+    # A small, same-origin resource to load before the site's cookies may be
+    # added to the browser
+    LANDING = "{base_url}/rex/release.json"
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._sessions: Dict[str, List[Cookie]] = {}
+
+    def store(self, driver, base_url: str, email: str):
+        """Capture the session for a user who just logged in.
+
+        :param driver: a selenium webdriver displaying a page on the site
+        :param str base_url: the site URL
+        :param str email: the user's log in email address
+        :return: None
+
+        """
+        self._sessions[self._key(base_url, email)] = Session.capture(driver)
+
+    def restore(self, driver, base_url: str, email: str) -> bool:
+        """Replay a cached session before the first page is opened.
+
+        The browser is sent to a lightweight page on the site so the cookies
+        may be added, then Accounts is asked to confirm the session. Expired
+        sessions are dropped from the cache.
+
+        :param driver: a selenium webdriver
+        :param str base_url: the site URL
+        :param str email: the user's log in email address
+        :return: ``True`` if the user is now logged in
+        :rtype: bool
+
+        """
+        key = self._key(base_url, email)
+        cookies = self._sessions.get(key)
+        if not cookies:
+            return False
+        driver.get(self.LANDING.format(base_url=base_url.rstrip("/")))
+        Session.restore(driver, cookies)
+        if Session.is_logged_in(driver):
+            return True
+        driver.delete_all_cookies()
+        self._sessions.pop(key, None)
+        return False
+
+    @classmethod
+    def _key(cls, base_url: str, email: str) -> str:
+        """Return the cache key for a user on a site."""
+        return f"{base_url.rstrip('/')} {email}"
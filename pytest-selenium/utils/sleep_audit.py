@@ -0,0 +1,142 @@
+"""Log every fixed sleep made by the page objects, helpers and tests."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple
+
+import pytest
+
+from utils.instrumentation import ROOT
+
+logger = logging.getLogger(__name__)
+
+# (file:line function) call site
+CallSite = str
+
+
+class SleepAudit(object):
+    """Record the call site and duration of each ``sleep()``.
+
+    Both ``time.sleep`` and the ``sleep`` names already imported by the
+    suite's modules are replaced. Only sleeps called from this repository are
+    recorded so library polling, like ``WebDriverWait``, is not reported.
+
+    """
+
+    def __init__(self):
+        """Initialize an empty audit."""
+        self.sleeps: Dict[CallSite, List] = {}
+        self._lock = threading.Lock()
+        self._sleep = time.sleep
+
+    def install(self):
+        """Replace the sleep functions.
+
+        :return: None
+
+        """
+        audited = self.audited(self._sleep)
+        for module in list(sys.modules.values()):
+            path = getattr(module, "__file__", None) or ""
+            current = getattr(module, "sleep", None)
+            if path.startswith(ROOT + os.sep) and current is not None:
+                if getattr(current, "__wrapped__", current) is self._sleep:
+                    module.sleep = audited if current is self._sleep else self.audited(current)
+        time.sleep = audited
+
+    def audited(self, function):
+        """Return a sleep function that records its call site.
+
+        :param function: the sleep function to wrap
+        :return: the wrapped function
+
+        """
+
+        @functools.wraps(function)
+        def sleep(seconds):
+            frame = sys._getframe(1)
+            path = frame.f_code.co_filename
+            if not path.startswith(ROOT + os.sep):
+                return function(seconds)
+            site = f"{os.path.relpath(path, ROOT)}:{frame.f_lineno} {frame.f_code.co_name}"
+            started = time.perf_counter()
+            try:
+                return function(seconds)
+            finally:
+                self.record(site, time.perf_counter() - started)
+
+        return sleep
+
+    def record(self, site: CallSite, seconds: float):
+        """Add a sleep to the audit.
+
+        :param str site: the call site
+        :param float seconds: the time slept
+        :return: None
+
+        """
+        with self._lock:
+            totals = self.sleeps.setdefault(site, [0, 0.0])
+            totals[0] += 1
+            totals[1] += seconds
+        logger.info("sleep %.2fs at %s (%.2fs total)", seconds, site, totals[1])
+
+    def merge(self, sleeps: Iterable[Tuple[CallSite, int, float]]):
+        """Add the sleeps recorded by another process.
+
+        :param sleeps: the call sites, call counts and seconds
+        :type sleeps: iterable((str, int, float))
+        :return: None
+
+        """
+        for site, count, seconds in sleeps:
+            totals = self.sleeps.setdefault(site, [0, 0.0])
+            totals[0] += count
+            totals[1] += seconds
+
+    def summary(self) -> List[Tuple[CallSite, int, float]]:
+        """Return the sleeps per call site from the longest total time.
+
+        :return: the call sites, call counts and seconds
+        :rtype: list((str, int, float))
+
+        """
+        rows = [(site, count, seconds) for site, (count, seconds) in self.sleeps.items()]
+        return sorted(rows, key=lambda row: (-row[2], row[0]))
+
+
+class SleepAuditPlugin(object):
+    """Audit the sleeps and report them at the end of the run."""
+
+    def __init__(self):
+        """Install the audit."""
+        self.audit = SleepAudit()
+        self.audit.install()
+
+    def pytest_sessionfinish(self, session):
+        """Send a worker's sleeps to the pytest-xdist controller."""
+        workeroutput = getattr(session.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput["sleep_audit"] = self.audit.summary()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Merge the sleeps recorded by a pytest-xdist worker."""
+        self.audit.merge(getattr(node, "workeroutput", {}).get("sleep_audit", []))
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        """List the sleeps by call site."""
+        if hasattr(config, "workerinput"):
+            return
+        rows = self.audit.summary()
+        total = sum(seconds for _, _, seconds in rows)
+        terminalreporter.write_sep("-", f"sleep audit: {total:.1f}s")
+        terminalreporter.write_line(f"{'total (s)':>10} {'calls':>6}  call site")
+        for site, count, seconds in rows:
+            terminalreporter.write_line(f"{seconds:10.2f} {count:6d}  {site}")
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 from enum import Enum
 from json import loads
-from os.path import exists
+from os.path import abspath, dirname, join
 from platform import system
 from random import choice, choices, randint
 from string import digits, ascii_letters
-from time import sleep
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Tuple
+from uuid import uuid4
 
 from faker import Faker
 from pypom import Page, Region
@@ -17,22 +18,52 @@ from selenium.common.exceptions import (
     ElementClickInterceptedException,
     NoSuchElementException,
     StaleElementReferenceException,
+    TimeoutException,
     WebDriverException,
 )
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.geometry import Geometry
+from utils.readiness import Readiness
 
 # Constant usage values for javascript commands
 ANALYTICS_QUEUE = (
     "return __APP_ANALYTICS.googleAnalyticsClient.getPendingCommands()"
     ".map(x => x.command.payload);"
 )
-ASYNC_DELETE = r"""
-(async function delete_page_highlights() {
-  const ids = __APP_STORE.getState().content.highlights.highlights.map(({id}) => id);
-  for(id of ids) await __APP_SERVICES.highlightClient.deleteHighlight({id});
-})()"""  # NOQA
+# Delete the user's highlights on the current page, or throughout the current
+# book, using a bounded number of concurrent requests
+DELETE_HIGHLIGHTS = r"""
+const [bookWide, concurrency, perPage] = arguments;
+const done = arguments[arguments.length - 1];
+const {book, highlights} = __APP_STORE.getState().content;
+const client = __APP_SERVICES.highlightClient;
+const pageIds = async () => highlights.highlights.map(({id}) => id);
+const bookIds = async () => {
+  const ids = [];
+  for (let page = 1; ; page++) {
+    const {data, meta} = await client.getHighlights({
+      page, perPage, scopeId: book.id, sets: ['user:me'], sourceType: 'openstax_page'});
+    ids.push(...data.map(({id}) => id));
+    if (!data.length || ids.length >= meta.totalCount) { return ids; }
+  }
+};
+const deleteAll = async (ids) => {
+  let next = 0;
+  const worker = async () => {
+    while (next < ids.length) { await client.deleteHighlight({id: ids[next++]}); }
+  };
+  await Promise.all(Array.from({length: Math.min(concurrency, ids.length)}, worker));
+  return ids.length;
+};
+(bookWide ? bookIds() : pageIds())
+  .then(deleteAll)
+  .then((deleted) => done({deleted}))
+  .catch((error) => done({error: String(error && (error.statusText || error.message) || error)}));"""  # NOQA
 HAS_SCROLL_BAR = r"""
 const hasScrollBar = (element) => {
   const {scrollTop} = element;
@@ -41,11 +72,117 @@ const hasScrollBar = (element) => {
   if(scrollTop === element.scrollTop) { return false; }
   element.scrollTop = scrollTop; return true; };
 return hasScrollBar(arguments[0]);"""
-HIGHLIGHTS = "return document.querySelectorAll('.highlight').length;"
+QUERY_ELEMENTS = r"""
+const [root, by, selector, attributes, fields, withText, withRect] = arguments;
+const scope = root || document;
+let elements = [];
+if (by === 'xpath') {
+  const found = document.evaluate(
+    selector, scope, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  for (let i = 0; i < found.snapshotLength; i++) { elements.push(found.snapshotItem(i)); }
+} else {
+  elements = Array.from(scope.querySelectorAll(selector));
+}
+const read = (node, name) => {
+  if (!node) { return null; }
+  if (node.hasAttribute(name)) { return node.getAttribute(name); }
+  return name in node ? node[name] : null;
+};
+return elements.map((element) => {
+  const entry = {element};
+  attributes.forEach((name) => { entry[name] = read(element, name); });
+  Object.keys(fields).forEach((key) => {
+    const [child, name] = fields[key];
+    entry[key] = read(child ? element.querySelector(child) : element, name);
+  });
+  if (withText) { entry.text = element.innerText; }
+  if (withRect) {
+    const {top, right, bottom, left, width, height} = element.getBoundingClientRect();
+    entry.rect = {top, right, bottom, left, width, height};
+  }
+  return entry;
+});"""  # NOQA
 PAGE_HIGHLIGHTS = "return __APP_STORE.getState().content.highlights.highlights;"  # NOQA
 RELOAD = "location.reload();"
+# Create highlights over the leading text of unhighlighted page paragraphs
+# using the same client the application uses to save new highlights
+SEED_HIGHLIGHTS = r"""
+const [seeds] = arguments;
+const done = arguments[arguments.length - 1];
+const {book, page} = __APP_STORE.getState().content;
+const client = __APP_SERVICES.highlightClient;
+const isText = (node) => node.nodeType === Node.TEXT_NODE;
+const leadingText = (paragraph) => Array.from(paragraph.childNodes)
+  .findIndex((node) => isText(node) && node.textContent.trim().length > 0);
+const targets = Array.from(document.querySelectorAll('#main-content p[id]'))
+  .filter((paragraph) => !paragraph.querySelector('.highlight') && leadingText(paragraph) >= 0);
+if (!book || !page || !client) { return done({error: 'the book page is not loaded'}); }
+if (targets.length < seeds.length) {
+  return done({error: `${seeds.length} highlights requested but ${targets.length} paragraphs are available`});
+}
+const toHighlight = (seed, paragraph) => {
+  const nodes = Array.from(paragraph.childNodes);
+  const position = leadingText(paragraph);
+  const text = nodes[position].textContent;
+  const textIndex = nodes.slice(0, position + 1).filter(isText).length;
+  const offset = nodes.slice(0, position).reduce((total, node) => total + node.textContent.length, 0);
+  const start = text.search(/\S/);
+  const end = text.trimEnd().length;
+  const container = `./text()[${textIndex}]`;
+  return {
+    anchor: paragraph.id,
+    annotation: seed.note || undefined,
+    color: seed.color,
+    highlightedContent: text.slice(start, end),
+    id: seed.id,
+    locationStrategies: [
+      {endContainer: container, endOffset: end, startContainer: container, startOffset: start, type: 'XpathRangeSelector'},
+      {end: String(offset + end), start: String(offset + start), type: 'TextPositionSelector'},
+    ],
+    scopeId: book.id,
+    sourceId: page.id,
+    sourceMetadata: {bookVersion: book.contentVersion, pipelineVersion: book.archiveVersion},
+    sourceType: 'openstax_page',
+  };
+};
+Promise.all(seeds.map((seed, index) => client.addHighlight({highlight: toHighlight(seed, targets[index])})))
+  .then((highlights) => done({ids: highlights.map(({id}) => id)}))
+  .catch((error) => done({error: String(error && (error.statusText || error.message) || error)}));"""  # NOQA
 SCROLL_INTO_VIEW = "arguments[0].scrollIntoView();"
 SHIFT_VIEW_BY = "window.scrollBy(0, arguments[0]);"
+# Return the next batch of elements in a lazily loaded list, scrolling the last
+# loaded element into view until enough elements are appended, the loading
+# indicator clears and nothing changes for a quiet period; a list still loading
+# after the timeout reports the timeout instead of a partial batch
+STREAM_ELEMENTS = r"""
+const [container, kinds, loaderSelector, start, size, quietTime, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const selector = Object.values(kinds).join(', ');
+const kindOf = (element) => Object.keys(kinds).find((kind) => element.matches(kinds[kind]));
+let quiet = null;
+const finish = (timedOut) => {
+  observer.disconnect();
+  clearTimeout(quiet);
+  clearTimeout(timer);
+  if (timedOut) { return done({timeout: true}); }
+  const elements = Array.from(container.querySelectorAll(selector));
+  done({
+    complete: elements.length < start + size,
+    entries: elements.slice(start, start + size).map((element) => [kindOf(element), element]),
+  });
+};
+const step = () => {
+  clearTimeout(quiet);
+  const elements = container.querySelectorAll(selector);
+  if (elements.length >= start + size) { return finish(); }
+  if (loaderSelector && document.querySelector(loaderSelector)) { return; }
+  if (elements.length) { elements[elements.length - 1].scrollIntoView({block: 'end'}); }
+  quiet = setTimeout(() => finish(false), quietTime);
+};
+const observer = new MutationObserver(step);
+observer.observe(container, {childList: true, subtree: true});
+const timer = setTimeout(() => finish(true), timeout);
+step();"""  # NOQA
 
 
 class Color(Enum):
@@ -126,21 +263,65 @@ class Highlight:
     RANDOM = "randomize"
     ENTIRE = "all"
 
+    # The highlights API page size limit
+    PAGE_SIZE = 200
+    SCRIPT_TIMEOUT = 30
+
+    @classmethod
+    def delete_highlights(
+        cls, driver, book_wide: bool = False, concurrency: int = 8, reload: bool = True
+    ) -> int:
+        """Delete the current user's highlights and wait for the server.
+
+        The script returns once every delete request has been confirmed.
+
+        :param driver: the selenium webdriver object
+        :param bool book_wide: (optional) delete every highlight in the
+            current book, found using the highlights API paging, instead of
+            only those on the current page
+            default: ``False``
+        :param int concurrency: (optional) the maximum number of delete
+            requests in flight at once
+            default: 8
+        :param bool reload: (optional) reload the page to see the updated UI
+            default: ``True``
+        :return: the number of highlights deleted
+        :rtype: int
+        :raises HighlightingException: if the highlights API rejects a request
+
+        """
+        with Readiness.script_timeout(driver, cls.SCRIPT_TIMEOUT):
+            result = driver.execute_async_script(
+                DELETE_HIGHLIGHTS, book_wide, max(1, concurrency), cls.PAGE_SIZE
+            )
+        if "error" in result:
+            raise HighlightingException(f"Failed to delete highlights: {result['error']}")
+        if reload:
+            driver.execute_script(RELOAD)
+        return result["deleted"]
+
     @classmethod
     def delete_highlights_on_page(cls, driver):
         """Purge the highlights for the current user on the current book page.
 
-        Trigger a javascript command to clean up the current page and remove
-        all highlights. Reload the page to see the updated UI.
+        Delete all of the page highlights then reload the page to see the
+        updated UI.
 
         :param driver: the selenium webdriver object
         :returns: None
 
         """
-        total_page_highlights = driver.execute_script(HIGHLIGHTS)
-        driver.execute_script(ASYNC_DELETE)
-        sleep(total_page_highlights * 0.05)
-        driver.execute_script(RELOAD)
+        cls.delete_highlights(driver)
+
+    @classmethod
+    def delete_highlights_in_book(cls, driver):
+        """Purge the highlights for the current user in the current book.
+
+        :param driver: the selenium webdriver object
+        :returns: None
+
+        """
+        cls.delete_highlights(driver, book_wide=True)
 
     @classmethod
     def force_highlight(cls, book, group, offset, color, by=None, name=None):
@@ -166,6 +347,47 @@ class Highlight:
             name = f" <{str(name)}>" if name else ""
             raise HighlightingException(f"Failed to highlight{name}")
 
+    @classmethod
+    def seed(
+        cls, driver, count: int = 1, colors: List[Color] = None, notes: List[str] = None
+    ) -> List[str]:
+        """Create highlights on the current book page without the UI.
+
+        Highlights are saved directly through the application highlight
+        client, one per unhighlighted paragraph starting from the top of the
+        page. The page must be reloaded before they are displayed.
+
+        :param driver: a selenium webdriver
+        :param int count: (optional) the number of highlights to create
+            default: 1
+        :param colors: (optional) the highlight colors; shorter lists are
+            repeated and colors are randomized if not provided
+        :param notes: (optional) the highlight annotations; highlights without
+            a matching note are created without one
+        :type colors: list(:py:class:`~utils.utility.Color`)
+        :type notes: list(str)
+        :return: the new highlight IDs in page order
+        :rtype: list(str)
+        :raises HighlightingException: if the page does not have enough
+            paragraphs available or the highlights API rejects a highlight
+
+        """
+        colors = colors or [cls.random_color() for _ in range(count)]
+        notes = notes or []
+        seeds = [
+            {
+                "color": str(colors[index % len(colors)]),
+                "id": str(uuid4()),
+                "note": notes[index] if index < len(notes) else "",
+            }
+            for index in range(count)
+        ]
+        with Readiness.script_timeout(driver, cls.SCRIPT_TIMEOUT):
+            result = driver.execute_async_script(SEED_HIGHLIGHTS, seeds)
+        if "error" in result:
+            raise HighlightingException(f"Failed to seed highlights: {result['error']}")
+        return result["ids"]
+
     @classmethod
     def get_position(cls, driver, element: WebElement) -> Dict[str, float]:
         """Return the position details for a specific page highlight or box.
@@ -177,7 +399,7 @@ class Highlight:
         :rtype: dict(str, float)
 
         """
-        position = driver.execute_script("return arguments[0].getBoundingClientRect();", element)
+        position = Geometry.measure(driver, element).rect
         return {
             "top": position.get("top"),
             "right": position.get("right"),
@@ -209,37 +431,281 @@ class Highlight:
         return len(driver.execute_script(PAGE_HIGHLIGHTS))
 
 
+class DOMBridge(object):
+    """Read element data in bulk using a single WebDriver round trip."""
+
+    Field = Tuple[str, str]
+    Locator = Tuple[str, str]
+
+    @classmethod
+    def query(
+        cls,
+        driver,
+        locator: DOMBridge.Locator,
+        root: WebElement = None,
+        attributes: List[str] = (),
+        fields: Dict[str, DOMBridge.Field] = None,
+        text: bool = False,
+        rect: bool = False,
+    ) -> List[Dict]:
+        """Return plain data for every element matching a locator.
+
+        Attribute names are read from the element attributes first and then
+        from the element properties (like ``textContent`` or ``checked``).
+
+        :param driver: a selenium webdriver
+        :param locator: a CSS selector or XPath locator
+        :param root: (optional) limit the search to the descendants of this
+            element
+        :param attributes: (optional) the attribute or property names to
+            read from each element
+        :param fields: (optional) named values to read from the first
+            descendant matching a CSS selector; an empty selector reads from
+            the element itself
+        :param bool text: (optional) include the rendered ``text``
+        :param bool rect: (optional) include the bounding ``rect``
+        :type locator: tuple(str, str)
+        :type root: WebElement
+        :type attributes: list(str)
+        :type fields: dict(str, tuple(str, str))
+        :return: one dictionary per matching element, in document order,
+            holding the ``element`` and the requested values
+        :rtype: list(dict)
+        :raises ValueError: if the locator is not a CSS selector or XPath
+
+        """
+        by, selector = locator
+        if by not in (By.CSS_SELECTOR, By.XPATH):
+            raise ValueError(f"{by} locators are not supported")
+        return driver.execute_script(
+            QUERY_ELEMENTS, root, by, selector, list(attributes), fields or {}, text, rect
+        )
+
+    @classmethod
+    def stream(
+        cls,
+        driver,
+        container: WebElement,
+        kinds: Dict[str, str],
+        loader: str = None,
+        batch: int = 25,
+        quiet: float = 0.5,
+        timeout: float = 30.0,
+    ) -> Iterator[Tuple[str, WebElement]]:
+        """Yield the elements of a list that loads more entries as it scrolls.
+
+        Elements are requested a batch at a time so a caller that stops early
+        never loads, or transfers, the rest of the list.
+
+        :param driver: a selenium webdriver
+        :param container: the element holding the list
+        :param kinds: the CSS selector for each kind of list entry, like
+            chapter headings and highlights
+        :param str loader: (optional) a CSS selector for the loading indicator
+            default: ``None``
+        :param int batch: (optional) the number of elements to request at once
+            default: 25
+        :param float quiet: (optional) the seconds without new elements before
+            the list is complete
+            default: 0.5 seconds
+        :param float timeout: (optional) the maximum time to wait for a batch
+            default: 30 seconds
+        :type container: WebElement
+        :type kinds: dict(str, str)
+        :return: the kind and element of each entry, in document order
+        :rtype: iterator(tuple(str, WebElement))
+        :raises :py:class:`~selenium.common.exceptions.TimeoutException`: if
+            a batch is still loading after ``timeout`` seconds
+
+        """
+        start = 0
+        while True:
+            with Readiness.script_timeout(driver, timeout + 1):
+                result = driver.execute_async_script(
+                    STREAM_ELEMENTS,
+                    container,
+                    kinds,
+                    loader,
+                    start,
+                    batch,
+                    int(quiet * 1000),
+                    int(timeout * 1000),
+                )
+            if result.get("timeout"):
+                raise TimeoutException(
+                    f"entries after the first {start} still loading after {timeout} seconds"
+                )
+            for kind, element in result["entries"]:
+                yield kind, element
+            start += len(result["entries"])
+            if result["complete"]:
+                return
+
+
+class Book(object):
+    """The read-only test metadata for a book in the Library."""
+
+    __slots__ = (
+        "slug",
+        "default_page",
+        "search_term",
+        "chapter_search_results_total",
+        "rkt_search_results_total",
+        "subject",
+        "features",
+    )
+
+    def __init__(self, slug: str, **fields):
+        """Store the validated book fields.
+
+        :param str slug: the book slug
+        :param fields: the book values from ``books.json``
+
+        """
+        object.__setattr__(self, "slug", slug)
+        for name, value in fields.items():
+            object.__setattr__(self, name, frozenset(value) if name == "features" else value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.slug} is read only")
+
+    def __repr__(self) -> str:
+        return f"Book({self.slug!r})"
+
+    def has(self, *features: str) -> bool:
+        """Return True if the book offers every feature.
+
+        :param str features: the feature flags, like ``math`` or ``practice``
+        :return: ``True`` if the book has all of the features
+        :rtype: bool
+
+        """
+        return self.features.issuperset(features)
+
+
 class Library(object):
+    """The books available to the tests, indexed by slug, subject and feature.
 
-    # Read the books details from books.json file
-    local = "utils/books.json"
-    parent = f"pytest-selenium/{local}"
-    location = parent if exists(parent) else local
-    with open(location, "r") as book_details:
-        books = loads(book_details.read())
+    ``books.json`` is read and validated the first time a book is requested.
+
+    """
+
+    FEATURES = ("math", "practice", "study_guides")
+    FIELDS = {
+        "default_page": str,
+        "search_term": str,
+        "chapter_search_results_total": int,
+        "rkt_search_results_total": int,
+        "subject": str,
+        "features": list,
+    }
+    LOCATION = join(dirname(abspath(__file__)), "books.json")
+
+    _books: Mapping[str, Book] = None
+
+    @classmethod
+    def books(cls) -> Mapping[str, Book]:
+        """Return every book keyed by slug.
+
+        :return: a read-only mapping of book slugs to books
+        :rtype: dict(str, :py:class:`~utils.utility.Book`)
+        :raises ValueError: if a book's metadata is missing or invalid
+
+        """
+        if cls._books is None:
+            with open(cls.LOCATION, "r") as book_details:
+                books = loads(book_details.read())
+            cls._books = MappingProxyType(
+                {slug: Book(slug, **cls._validate(slug, fields)) for slug, fields in books.items()}
+            )
+        return cls._books
+
+    @classmethod
+    def book(cls, slug: str) -> Book:
+        """Return a book by its slug.
+
+        :param str slug: the book slug
+        :return: the book
+        :rtype: :py:class:`~utils.utility.Book`
+        :raises KeyError: if the book is not in the Library
+
+        """
+        try:
+            return cls.books()[slug]
+        except KeyError:
+            raise KeyError(f"{slug} is not in {cls.LOCATION}") from None
+
+    @classmethod
+    def slugs(cls) -> List[str]:
+        """Return the slugs of every book.
+
+        :return: the book slugs
+        :rtype: list(str)
+
+        """
+        return list(cls.books())
+
+    @classmethod
+    def by_subject(cls, subject: str) -> List[Book]:
+        """Return the books in a subject.
+
+        :param str subject: the subject, like ``math`` or ``science``
+        :return: the books in the subject
+        :rtype: list(:py:class:`~utils.utility.Book`)
+
+        """
+        return [book for book in cls.books().values() if book.subject == subject]
+
+    @classmethod
+    def with_features(cls, *features: str) -> List[Book]:
+        """Return the books offering every requested feature.
+
+        :param str features: the feature flags, like ``math``, ``practice``
+            or ``study_guides``
+        :return: the books with all of the features
+        :rtype: list(:py:class:`~utils.utility.Book`)
+        :raises ValueError: if a feature is unknown
+
+        """
+        unknown = set(features) - set(cls.FEATURES)
+        if unknown:
+            raise ValueError(f"unknown book features: {', '.join(sorted(unknown))}")
+        return [book for book in cls.books().values() if book.has(*features)]
 
     def random_book_slug(self):
         """Book slug of a random book selected from the Library."""
-        random_book_slug = choice(list(self.books.keys()))
+        random_book_slug = choice(self.slugs())
         return random_book_slug
 
     @property
     def book_slugs_list(self):
         """List of book slugs for all the books present in the Library."""
-        book_slugs_list = list(self.books.keys())
-        return book_slugs_list
+        return self.slugs()
+
+    @classmethod
+    def _validate(cls, slug: str, fields: Dict) -> Dict:
+        """Return a book's fields after checking them against the schema."""
+        missing = set(cls.FIELDS) - set(fields)
+        extra = set(fields) - set(cls.FIELDS)
+        if missing or extra:
+            raise ValueError(
+                f"{slug}: missing fields {sorted(missing)}, unexpected fields {sorted(extra)}"
+            )
+        for name, kind in cls.FIELDS.items():
+            if not isinstance(fields[name], kind) or isinstance(fields[name], bool):
+                raise ValueError(f"{slug}: {name} must be a {kind.__name__}")
+        unknown = set(fields["features"]) - set(cls.FEATURES)
+        if unknown:
+            raise ValueError(f"{slug}: unknown features {sorted(unknown)}")
+        return fields
 
 
 def get_default_page(element):
-    book_list = Library.books
-    default_page = book_list[element]["default_page"]
-    return default_page
+    return Library.book(element).default_page
 
 
 def get_search_term(element):
-    book_list = Library.books
-    search_term = book_list[element]["search_term"]
-    return search_term
+    return Library.book(element).search_term
 
 
 def expected_chapter_search_results_total(element) -> int:
@@ -250,8 +716,7 @@ def expected_chapter_search_results_total(element) -> int:
         :rtype: int
 
     """
-    book_list = Library.books
-    return book_list[element]["chapter_search_results_total"]
+    return Library.book(element).chapter_search_results_total
 
 
 def expected_rkt_search_results_total(element) -> int:
@@ -262,8 +727,7 @@ def expected_rkt_search_results_total(element) -> int:
         :rtype: int
 
     """
-    book_list = Library.books
-    return book_list[element]["rkt_search_results_total"]
+    return Library.book(element).rkt_search_results_total
 
 
 class Utilities(object):
@@ -279,7 +743,7 @@ class Utilities(object):
         :type field: WebElement
         :returns: None
         """
-        sleep(0.1)
+        Readiness.settled(driver, field)
         if driver.name == "firefox":
             special = Keys.COMMAND if system() == "Darwin" else Keys.CONTROL
             ActionChains(driver).click(field).key_down(special).send_keys("a").key_up(
@@ -309,7 +773,8 @@ class Utilities(object):
                     driver.execute_script("arguments[0].click()", element)
                     break
                 except ElementClickInterceptedException:  # Firefox issues
-                    sleep(1.0)
+                    # Wait for the intercepting overlay or animation to finish
+                    Readiness.settled(driver)
                 except NoSuchElementException:  # Safari issues
                     if locator:
                         element = driver.find_element(*locator)
@@ -416,7 +881,7 @@ class Utilities(object):
 
         """
         driver.execute_script("window.scrollTo(0, 0);")
-        sleep(0.75)
+        Readiness.settled(driver)
 
     @classmethod
     def switch_to(cls, driver, link_locator=None, element=None, action=None):
@@ -436,7 +901,10 @@ class Utilities(object):
             cls.click_option(driver=driver, locator=link_locator, element=element)
         else:
             data = action()
-        sleep(1)
+        try:
+            WebDriverWait(driver, 5).until(lambda _: len(driver.window_handles) > 1)
+        except TimeoutException:
+            pass
         new_handle = 1 if current == driver.window_handles[0] else 0
         if len(driver.window_handles) > 1:
             driver.switch_to.window(driver.window_handles[new_handle])
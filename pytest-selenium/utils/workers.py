@@ -0,0 +1,105 @@
+"""pytest-xdist worker identity and per-worker resource partitioning."""
+
+from __future__ import annotations
+
+import os
+from typing import Dict, List, Sequence, TypeVar
+
+Item = TypeVar("Item")
+
+
+class Worker(object):
+    """Identify the current pytest-xdist worker.
+
+    The pytest-xdist environment variables are read so the values are also
+    available to helpers, like :py:class:`~utils.restmail.RestMail`, that are
+    not given the pytest configuration. A run without ``-n`` behaves as a
+    single worker with index 0.
+
+    """
+
+    CONTROLLER = "master"
+
+    @classmethod
+    def id(cls) -> str:
+        """Return the worker ID.
+
+        :return: the pytest-xdist worker ID, like ``gw2``, or ``master`` when
+            tests are not distributed
+        :rtype: str
+
+        """
+        return os.getenv("PYTEST_XDIST_WORKER", cls.CONTROLLER)
+
+    @classmethod
+    def index(cls) -> int:
+        """Return the zero-based worker number.
+
+        :return: the worker number
+        :rtype: int
+
+        """
+        worker = cls.id()
+        return int(worker[2:]) if worker.startswith("gw") and worker[2:].isdigit() else 0
+
+    @classmethod
+    def count(cls) -> int:
+        """Return the number of workers running the tests.
+
+        :return: the worker count
+        :rtype: int
+
+        """
+        return max(int(os.getenv("PYTEST_XDIST_WORKER_COUNT", 1)), 1)
+
+    @classmethod
+    def is_distributed(cls) -> bool:
+        """Return True if this process is a pytest-xdist worker.
+
+        :return: ``True`` if running under ``pytest -n``
+        :rtype: bool
+
+        """
+        return cls.id() != cls.CONTROLLER
+
+    @classmethod
+    def tag(cls) -> str:
+        """Return a short, unique label for names created by this worker.
+
+        :return: the worker ID or an empty string when tests are not
+            distributed
+        :rtype: str
+
+        """
+        return cls.id() if cls.is_distributed() else ""
+
+    @classmethod
+    def input(cls, config) -> Dict:
+        """Return the values the controller sent to this worker.
+
+        :param config: the pytest configuration
+        :return: the pytest-xdist worker input or an empty dictionary
+        :rtype: dict
+
+        """
+        return getattr(config, "workerinput", {})
+
+    @classmethod
+    def partition(cls, resources: Sequence[Item]) -> List[Item]:
+        """Return this worker's share of a list of shared resources.
+
+        Resources are dealt round robin so no two workers receive the same
+        resource. When there are fewer resources than workers, each worker
+        receives one resource and some are shared.
+
+        :param resources: the resources to divide, like the secure store users
+        :type resources: list
+        :return: the resources reserved for this worker
+        :rtype: list
+
+        """
+        resources = list(resources)
+        if not resources:
+            return []
+        share = resources[cls.index() :: cls.count()]
+        return share if share else [resources[cls.index() % len(resources)]]